@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Search Benchmark Suite
+Times EventSearchEngine on synthetic catalogs and reports p50/p99 latency and memory
+
+Usage:
+    python benchmark_search.py                        # 1k, 100k and 1M records
+    python benchmark_search.py --sizes 1000 20000 --queries 500 --vectorized
+    python benchmark_search.py --output bench.json
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from catalog_generator import AMENITIES, EVENT_TYPES, VENDOR_TYPES, generate_catalog_of_size
+from event_search import EventSearchEngine
+
+QUERY_TEMPLATES = [
+    "wedding venue in {city} for {guests} people",
+    "need a caterer and photographer for a birthday party",
+    "corporate conference hall for {guests} guests under {budget}",
+    "flowers and decoration for engagement in {city}",
+    "dj and makeup artist for reception"
+]
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+def time_calls(calls: List[Callable[[], object]]) -> Dict[str, float]:
+    """Run each call once and summarize the latencies in milliseconds"""
+    samples = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "calls": len(samples),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "max_ms": round(max(samples), 3)
+    }
+
+def build_workload(engine: EventSearchEngine, queries: int, seed: int) -> Dict[str, List[Callable]]:
+    """Random but repeatable calls for every benchmarked method"""
+    rng = random.Random(seed)
+    cities = list(engine.index.city_keys)
+    areas = {c: engine.get_city_areas(c) for c in cities[:5]}
+
+    def location():
+        city = rng.choice(cities + [None])
+        area = rng.choice(areas[city]) if city in areas and rng.random() < 0.5 else None
+        return city, area
+
+    workload = {"search_venues": [], "search_vendors": [], "get_recommendations": [],
+                "get_budget_estimate": []}
+    for _ in range(queries):
+        city, area = location()
+        capacity = rng.choice([None, 100, 300, 800])
+        budget_max = rng.choice([None, 100000, 300000, 800000])
+        event_type = rng.choice([None] + EVENT_TYPES[:6])
+        amenities = rng.choice([None, None, rng.sample(AMENITIES, 1)])
+        workload["search_venues"].append(
+            lambda a=(city, area, capacity, None, budget_max, event_type, amenities):
+                engine.search_venues(*a, limit=5))
+
+        city, area = location()
+        vendor_type = rng.choice([None] + list(VENDOR_TYPES))
+        speciality = rng.choice([None, None, "wedding", "corporate", "cuisine"])
+        workload["search_vendors"].append(
+            lambda a=(city, area, vendor_type, None, rng.choice([None, 50000]), speciality):
+                engine.search_vendors(*a, limit=5))
+
+        text = rng.choice(QUERY_TEMPLATES).format(city=rng.choice(cities), guests=rng.choice([50, 200, 500]),
+                                                  budget=rng.choice([200000, 500000]))
+        workload["get_recommendations"].append(lambda q=text: engine.get_recommendations(q))
+
+        estimate = (rng.choice(EVENT_TYPES[:6]), rng.choice([50, 150, 400]), rng.choice(cities),
+                    {"budget_level": rng.choice(["low", "medium", "high"])})
+        workload["get_budget_estimate"].append(lambda a=estimate: engine.get_budget_estimate(*a))
+    return workload
+
+def run_benchmark(size: int, queries: int = 200, seed: int = 42, vectorized: bool = False) -> Dict:
+    """
+    Generate a catalog of `size` records, load it and time every search method
+
+    The query cache is disabled so every call does the full lookup.
+
+    Returns:
+        Report with load time, memory and per-method latency percentiles
+    """
+    workdir = tempfile.mkdtemp()
+    try:
+        data_file = os.path.join(workdir, "event_data.json")
+        start = time.perf_counter()
+        catalog = generate_catalog_of_size(size, seed=seed)
+        with open(data_file, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, ensure_ascii=False)
+        generate_seconds = time.perf_counter() - start
+        del catalog
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        engine = EventSearchEngine(data_file, vectorized=vectorized, cache_size=0)
+        load_seconds = time.perf_counter() - start
+        loaded_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report = {
+            "records": len(engine.index.venue_records) + len(engine.index.vendor_records),
+            "venues": len(engine.index.venue_records),
+            "vendors": len(engine.index.vendor_records),
+            "cities": len(engine.index.city_keys),
+            "vectorized": engine.vectorized,
+            "file_mb": round(os.path.getsize(data_file) / 2**20, 1),
+            "generate_s": round(generate_seconds, 2),
+            "load_s": round(load_seconds, 2),
+            "memory_mb": round(loaded_bytes / 2**20, 1),
+            "peak_load_memory_mb": round(peak_bytes / 2**20, 1),
+            "methods": {}
+        }
+        for method, calls in build_workload(engine, queries, seed).items():
+            report["methods"][method] = time_calls(calls)
+        return report
+    finally:
+        shutil.rmtree(workdir)
+
+def print_report(report: Dict):
+    print(f"\n📊 {report['records']:,} records ({report['venues']:,} venues, {report['vendors']:,} vendors, "
+          f"{report['cities']} cities){' [vectorized]' if report['vectorized'] else ''}")
+    print(f"   file {report['file_mb']} MB | load {report['load_s']}s | "
+          f"memory {report['memory_mb']} MB (peak {report['peak_load_memory_mb']} MB)")
+    print(f"   {'method':<22}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for method, stats in report["methods"].items():
+        print(f"   {method:<22}{stats['p50_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EventSearchEngine on synthetic catalogs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000],
+                        help="Catalog sizes in records (venues + vendors)")
+    parser.add_argument("--queries", type=int, default=200, help="Calls per method per size")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for catalogs and queries")
+    parser.add_argument("--vectorized", action="store_true", help="Benchmark the NumPy execution mode")
+    parser.add_argument("--output", help="Also write the reports to this JSON file")
+    args = parser.parse_args()
+
+    reports = []
+    for size in args.sizes:
+        report = run_benchmark(size, args.queries, args.seed, args.vectorized)
+        print_report(report)
+        reports.append(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+        print(f"\n✅ Reports written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Event Budget Estimator
+Per-person cost tables and the budget arithmetic behind get_budget_estimate, for one
+scenario or a whole matrix of scenarios at once
+"""
+
+import itertools
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Base cost per person based on city and budget level
+CITY_MULTIPLIERS: Dict[str, float] = {
+    "mumbai": 1.4,
+    "delhi": 1.3,
+    "bangalore": 1.2,
+    "hyderabad": 1.1,
+    "chennai": 1.0,
+    "pune": 1.0,
+    "gurgaon": 1.3,
+    "noida": 1.1,
+    "kolkata": 0.9,
+    "kanpur": 0.8,
+    "ahmedabad": 0.9
+}
+
+BUDGET_MULTIPLIERS: Dict[str, float] = {
+    "low": 0.6,
+    "medium": 1.0,
+    "high": 1.8
+}
+
+# Base costs per person
+BASE_COSTS: Dict[str, Dict[str, int]] = {
+    "wedding": {
+        "venue": 800,
+        "food": 600,
+        "decoration": 400,
+        "flowers": 200,
+        "photography": 300,
+        "music_dj": 150,
+        "transportation": 100
+    },
+    "corporate": {
+        "venue": 500,
+        "food": 400,
+        "decoration": 200,
+        "flowers": 100,
+        "photography": 200,
+        "music_dj": 100,
+        "transportation": 80
+    },
+    "birthday": {
+        "venue": 300,
+        "food": 350,
+        "decoration": 250,
+        "flowers": 100,
+        "photography": 150,
+        "music_dj": 100,
+        "transportation": 50
+    }
+}
+
+DEFAULT_EVENT_TYPE = "birthday"
+DEFAULT_CITY = "delhi"
+CONTINGENCY_RATE = 0.15
+
+def city_multiplier(city: Optional[str]) -> float:
+    """Price multiplier of a city (DEFAULT_CITY when unset, 1.0 when unknown)"""
+    return CITY_MULTIPLIERS.get(city.lower() if city else DEFAULT_CITY, 1.0)
+
+def budget_multiplier(budget_level: str) -> float:
+    return BUDGET_MULTIPLIERS.get(budget_level, 1.0)
+
+def estimate_budget(event_type: str, guest_count: int, city: str = None, budget_level: str = "medium") -> Dict:
+    """Budget breakdown for one event (the get_budget_estimate result)"""
+    # Get base costs for event type
+    event_costs = BASE_COSTS.get(event_type, BASE_COSTS[DEFAULT_EVENT_TYPE])
+
+    # Apply multipliers
+    city_mult, budget_mult = city_multiplier(city), budget_multiplier(budget_level)
+
+    # Calculate costs
+    breakdown = {}
+    total_cost = 0
+
+    for category, base_cost in event_costs.items():
+        category_cost = base_cost * guest_count * city_mult * budget_mult
+        breakdown[category] = {
+            "cost": round(category_cost),
+            "per_person": round(base_cost * city_mult * budget_mult)
+        }
+        total_cost += category_cost
+
+    # Add contingency (15%)
+    contingency = total_cost * CONTINGENCY_RATE
+    final_total = total_cost + contingency
+
+    return {
+        "event_type": event_type,
+        "guest_count": guest_count,
+        "city": city,
+        "budget_level": budget_level,
+        "breakdown": breakdown,
+        "subtotal": round(total_cost),
+        "contingency": round(contingency),
+        "total_estimate": round(final_total),
+        "per_person_average": round(final_total / guest_count)
+    }
+
+def budget_matrix(event_types: Sequence[str], guest_counts: Sequence[int],
+                  cities: Sequence[Optional[str]], budget_levels: Sequence[str]) -> Dict:
+    """
+    Every estimate of the event type x guest count x city x budget level cross-product as arrays
+
+    Costs are broadcast over a (event type, guest count, city, budget level, category) grid,
+    multiplied and summed in the same order as estimate_budget, so every cell equals the
+    single estimate exactly. Needs numpy.
+
+    Returns:
+        {"categories": category names (union over the event types, in table order),
+         "present": (E, K) bool, category is in the event type's table,
+         "per_person": (E, C, B, K), "cost": (E, G, C, B, K),
+         "subtotal" / "contingency" / "total_estimate" / "per_person_average": (E, G, C, B)}
+        Money arrays are rounded like estimate_budget (int64).
+    """
+    tables = [BASE_COSTS.get(e, BASE_COSTS[DEFAULT_EVENT_TYPE]) for e in event_types]
+    categories = list(dict.fromkeys(category for table in tables for category in table))
+    base = np.array([[table.get(c, 0) for c in categories] for table in tables], dtype=np.float64)
+    present = np.array([[c in table for c in categories] for table in tables], dtype=bool)
+    guests = np.array(guest_counts, dtype=np.float64)
+    city_mult = np.array([city_multiplier(city) for city in cities], dtype=np.float64)
+    budget_mult = np.array([budget_multiplier(level) for level in budget_levels], dtype=np.float64)
+
+    # Axes: event, guests, city, level, category
+    b = base[:, None, None, None, :]
+    g = guests[None, :, None, None, None]
+    c = city_mult[None, None, :, None, None]
+    m = budget_mult[None, None, None, :, None]
+    cost = b * g * c * m
+    per_person = (b * c * m)[:, 0]
+
+    # Accumulate category by category, as estimate_budget does, so float sums match exactly
+    subtotal = np.zeros(cost.shape[:4])
+    for k in range(len(categories)):
+        subtotal = subtotal + cost[..., k]
+    contingency = subtotal * CONTINGENCY_RATE
+    final_total = subtotal + contingency
+
+    return {
+        "categories": categories,
+        "present": present,
+        "per_person": np.rint(per_person).astype(np.int64),
+        "cost": np.rint(cost).astype(np.int64),
+        "subtotal": np.rint(subtotal).astype(np.int64),
+        "contingency": np.rint(contingency).astype(np.int64),
+        "total_estimate": np.rint(final_total).astype(np.int64),
+        "per_person_average": np.rint(final_total / g[..., 0]).astype(np.int64)
+    }
+
+def budget_scenarios(event_types: Sequence[str], guest_counts: Sequence[int],
+                     cities: Sequence[Optional[str]], budget_levels: Sequence[str],
+                     breakdown: bool = True) -> List[Dict]:
+    """
+    Estimates for the whole cross-product, in event type -> guest count -> city -> level order
+
+    Each entry has the estimate_budget format (without "breakdown" if breakdown=False).
+    Computed with budget_matrix when numpy is installed, one estimate at a time otherwise.
+    """
+    if any(guests < 1 for guests in guest_counts):
+        raise ValueError("guest counts must be at least 1")
+    if not (event_types and guest_counts and cities and budget_levels):
+        return []
+
+    if not NUMPY_AVAILABLE:
+        scenarios = []
+        for event_type, guests, city, level in itertools.product(event_types, guest_counts, cities, budget_levels):
+            estimate = estimate_budget(event_type, guests, city, level)
+            if not breakdown:
+                del estimate["breakdown"]
+            scenarios.append(estimate)
+        return scenarios
+
+    matrix = budget_matrix(event_types, guest_counts, cities, budget_levels)
+    categories = matrix["categories"]
+    columns = {name: matrix[name].tolist() for name in
+               ("per_person", "cost", "subtotal", "contingency", "total_estimate", "per_person_average")}
+    present = matrix["present"].tolist()
+
+    scenarios = []
+    for e, event_type in enumerate(event_types):
+        for g, guests in enumerate(guest_counts):
+            for c, city in enumerate(cities):
+                for b, level in enumerate(budget_levels):
+                    estimate = {"event_type": event_type, "guest_count": guests, "city": city, "budget_level": level}
+                    if breakdown:
+                        cost, per_person = columns["cost"][e][g][c][b], columns["per_person"][e][c][b]
+                        estimate["breakdown"] = {
+                            category: {"cost": cost[k], "per_person": per_person[k]}
+                            for k, category in enumerate(categories) if present[e][k]
+                        }
+                    for name in ("subtotal", "contingency", "total_estimate", "per_person_average"):
+                        estimate[name] = columns[name][e][g][c][b]
+                    scenarios.append(estimate)
+    return scenarios
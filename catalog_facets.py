@@ -0,0 +1,269 @@
+"""
+Catalog Facets
+Per-value bitmaps over venue/vendor ids for counting search matches by area, price bucket,
+capacity bucket and vendor type without materializing any results
+
+Each facet value (an area, a price bucket, ...) is one Python int used as a bitset: bit i is set
+when record i has that value. A filter's matches are built the same way, by ANDing the bitmaps
+of its location, event type and amenities with ranges cut from the sorted capacity/price indexes,
+and every facet count is popcount(matches & facet bitmap), a word-at-a-time AND over the id space.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from typing import Dict, Iterable, List, Optional
+
+# Bucket edges in rupees / guests; bucket k holds values in [edges[k-1], edges[k])
+VENUE_PRICE_EDGES = [50000, 100000, 200000, 500000, 1000000]
+VENDOR_PRICE_EDGES = [5000, 20000, 50000, 100000, 250000]
+CAPACITY_EDGES = [101, 301, 501, 1001]
+
+def popcount(bitmap: int) -> int:
+    try:
+        return bitmap.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(bitmap).count("1")
+
+def ids_to_bitmap(ids: Iterable[int], size: int) -> int:
+    """Bitset with bit i set for every id i (< size)"""
+    bits = bytearray((size + 7) // 8)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+def _short_inr(amount: int) -> str:
+    """₹50k / ₹1.5L / ₹2Cr style amounts for bucket labels"""
+    for unit, suffix in ((10000000, "Cr"), (100000, "L"), (1000, "k")):
+        if amount >= unit:
+            return f"₹{amount / unit:g}{suffix}"
+    return f"₹{amount}"
+
+def price_buckets(edges: List[int]) -> List[Dict]:
+    """Bucket descriptors (label, min, max) for price edges; max is exclusive, None when open"""
+    bounds = [0] + edges
+    buckets = []
+    for k, low in enumerate(bounds):
+        high = edges[k] if k < len(edges) else None
+        if k == 0:
+            label = f"under {_short_inr(high)}"
+        elif high is None:
+            label = f"{_short_inr(low)}+"
+        else:
+            label = f"{_short_inr(low)}–{_short_inr(high)[1:]}"
+        buckets.append({"label": label, "min": low, "max": high})
+    return buckets
+
+def capacity_buckets(edges: List[int]) -> List[Dict]:
+    """Bucket descriptors (label, min, max guests, both inclusive; max None when open)"""
+    bounds = [0] + edges
+    buckets = []
+    for k, low in enumerate(bounds):
+        high = edges[k] - 1 if k < len(edges) else None
+        label = f"up to {high}" if k == 0 else (f"{low}+" if high is None else f"{low}–{high}")
+        buckets.append({"label": label, "min": low, "max": high})
+    return buckets
+
+VENUE_PRICE_BUCKETS = price_buckets(VENUE_PRICE_EDGES)
+VENDOR_PRICE_BUCKETS = price_buckets(VENDOR_PRICE_EDGES)
+CAPACITY_BUCKETS = capacity_buckets(CAPACITY_EDGES)
+
+def _group_bitmaps(keys: Iterable[int], size: int, live: Iterable[int]) -> Dict[int, int]:
+    """{key: bitmap of the live ids having that key}, from a per-id key column"""
+    groups: Dict[int, bytearray] = {}
+    width = (size + 7) // 8
+    for i in live:
+        bits = groups.get(keys[i])
+        if bits is None:
+            bits = groups[keys[i]] = bytearray(width)
+        bits[i >> 3] |= 1 << (i & 7)
+    return {key: int.from_bytes(bits, "little") for key, bits in groups.items()}
+
+def _set_bit(bitmaps: Dict, key, record_id: int):
+    bitmaps[key] = bitmaps.get(key, 0) | (1 << record_id)
+
+def _clear_bit(bitmaps: Dict, key, record_id: int):
+    bitmap = bitmaps.get(key)
+    if bitmap is not None:
+        bitmaps[key] = bitmap & ~(1 << record_id)
+
+class FacetBitmaps:
+    """
+    Facet bitmaps of one compiled catalog (built on first use, see CatalogIndex.facet_bitmaps);
+    retired records are in no bitmap
+
+    Catalog mutations patch single bits through add_*/remove_*: remove with the record's old
+    column values, add with the new ones. Each bitmap is replaced by a new int, never edited.
+    """
+
+    def __init__(self, index):
+        venue_count = len(index.venue_records)
+        live_venues = [i for i in range(venue_count) if i not in index.retired_venues]
+        self.venue_count = venue_count
+        self.venue_area = _group_bitmaps(index.venue_area, venue_count, live_venues)
+        self.venue_price = _group_bitmaps(
+            [bisect_right(VENUE_PRICE_EDGES, p) for p in index.venue_min_price], venue_count, live_venues)
+        self.venue_capacity = _group_bitmaps(
+            [bisect_right(CAPACITY_EDGES, c) for c in index.venue_capacity], venue_count, live_venues)
+        # Filter-only bitmaps, one per posting list
+        self.venue_event_type = {key: ids_to_bitmap(ids, venue_count) for key, ids in index.venues_by_event_type.items()}
+        self.venue_amenity = {key: ids_to_bitmap(ids, venue_count) for key, ids in index.venues_by_amenity.items()}
+
+        vendor_count = len(index.vendor_records)
+        live_vendors = [i for i in range(vendor_count) if i not in index.retired_vendors]
+        self.vendor_count = vendor_count
+        self.vendor_area = _group_bitmaps(index.vendor_area, vendor_count, live_vendors)
+        self.vendor_price = _group_bitmaps(
+            [bisect_right(VENDOR_PRICE_EDGES, p) for p in index.vendor_min_price], vendor_count, live_vendors)
+        self.vendor_type = _group_bitmaps(index.vendor_type, vendor_count, live_vendors)
+
+    def _venue_keys(self, index, venue_id: int):
+        keys = [(self.venue_area, index.venue_area[venue_id]),
+                (self.venue_price, bisect_right(VENUE_PRICE_EDGES, index.venue_min_price[venue_id])),
+                (self.venue_capacity, bisect_right(CAPACITY_EDGES, index.venue_capacity[venue_id]))]
+        keys += [(self.venue_event_type, e) for e in set(index.venue_records[venue_id].get("suitable_for", []))]
+        keys += [(self.venue_amenity, a) for a in index.venue_amenities[venue_id]]
+        return keys
+
+    def _vendor_keys(self, index, vendor_id: int):
+        return ((self.vendor_area, index.vendor_area[vendor_id]),
+                (self.vendor_price, bisect_right(VENDOR_PRICE_EDGES, index.vendor_min_price[vendor_id])),
+                (self.vendor_type, index.vendor_type[vendor_id]))
+
+    def add_venue(self, index, venue_id: int):
+        """Set a venue's bits from its current column values"""
+        self.venue_count = max(self.venue_count, venue_id + 1)
+        for bitmaps, key in self._venue_keys(index, venue_id):
+            _set_bit(bitmaps, key, venue_id)
+
+    def remove_venue(self, index, venue_id: int):
+        """Clear a venue's bits; call before its column values change"""
+        for bitmaps, key in self._venue_keys(index, venue_id):
+            _clear_bit(bitmaps, key, venue_id)
+
+    def add_vendor(self, index, vendor_id: int):
+        """Set a vendor's bits from its current column values"""
+        self.vendor_count = max(self.vendor_count, vendor_id + 1)
+        for bitmaps, key in self._vendor_keys(index, vendor_id):
+            _set_bit(bitmaps, key, vendor_id)
+
+    def remove_vendor(self, index, vendor_id: int):
+        """Clear a vendor's bits; call before its column values change"""
+        for bitmaps, key in self._vendor_keys(index, vendor_id):
+            _clear_bit(bitmaps, key, vendor_id)
+
+def count_by(matches: int, bitmaps: Dict[int, int]) -> Dict[int, int]:
+    """{facet key: matches having it}, leaving out empty facets"""
+    counts = {}
+    for key, bitmap in bitmaps.items():
+        count = popcount(matches & bitmap)
+        if count:
+            counts[key] = count
+    return counts
+
+def bucket_counts(buckets: List[Dict], counts: Dict[int, int]) -> List[Dict]:
+    """Every bucket with its count (zeros included, so the ranges read as a histogram)"""
+    return [dict(bucket, count=counts.get(k, 0)) for k, bucket in enumerate(buckets)]
+
+def area_counts(index, counts: Dict[int, int]) -> List[Dict]:
+    """Area facet entries, most matches first (ties in area id order)"""
+    return [{"area": index.area_keys[a], "area_name": index.area_names[a],
+             "city": index.city_keys[index.area_city[a]], "count": n}
+            for a, n in sorted(counts.items(), key=lambda item: (-item[1], item[0]))]
+
+def _any_of(bitmaps: Dict[int, int], keys: Iterable[int]) -> int:
+    """Union of the bitmaps of some facet keys"""
+    matches = 0
+    for key in keys:
+        matches |= bitmaps.get(key, 0)
+    return matches
+
+def _keep_range(matches: int, columns: List, size: int, low=None, high=None) -> int:
+    """
+    Keep the ids of `matches` whose key is >= low (or <= high) in sorted column indexes
+
+    Each index is cut at one bisect point and only the shorter side is turned into a bitmap,
+    ANDed in when it holds the kept ids and ANDed out when it holds the others. The indexes
+    must cover every id in `matches`.
+    """
+    splits = [bisect_left(column.keys, low) if low is not None else bisect_right(column.keys, high)
+              for column in columns]
+    below = sum(splits)
+    above = sum(len(column.ids) for column in columns) - below
+    # ids below the cut fail `>= low` and pass `<= high`
+    if below <= above:
+        bitmap = ids_to_bitmap(chain.from_iterable(c.ids[:s] for c, s in zip(columns, splits)), size)
+        return matches & bitmap if low is None else matches & ~bitmap
+    bitmap = ids_to_bitmap(chain.from_iterable(c.ids[s:] for c, s in zip(columns, splits)), size)
+    return matches & ~bitmap if low is None else matches & bitmap
+
+def venue_matches(index, city: Optional[str], area: Optional[str], capacity: Optional[int],
+                  budget_min: Optional[int], budget_max: Optional[int], event_type: Optional[str],
+                  amenities: Optional[List[str]]) -> int:
+    """Bitmap of the venues passing search_venues filters, built without reading any venue"""
+    facets: FacetBitmaps = index.facet_bitmaps()
+    matches = _any_of(facets.venue_area, index.resolve_areas(city, area))
+    if event_type:
+        matches &= facets.venue_event_type.get(event_type.lower(), 0)
+    for amenity in {a.strip().lower() for a in amenities or [] if a and a.strip()}:
+        matches &= facets.venue_amenity.get(amenity, 0)
+    if matches and (capacity or budget_min or budget_max):
+        scopes = index.venue_scopes(city, area)
+        if capacity:
+            matches = _keep_range(matches, [s.capacity for s in scopes], facets.venue_count, low=capacity)
+        if budget_max:
+            matches = _keep_range(matches, [s.min_price for s in scopes], facets.venue_count, high=budget_max)
+        if budget_min:
+            matches = _keep_range(matches, [s.max_price for s in scopes], facets.venue_count, low=budget_min)
+    return matches
+
+def vendor_matches(index, city: Optional[str], area: Optional[str], vendor_type: Optional[str],
+                   budget_min: Optional[int], budget_max: Optional[int], speciality: Optional[str]) -> int:
+    """
+    Bitmap of the vendors passing search_vendors filters
+
+    Location, type and budget come from bitmaps and the sorted price indexes; the speciality
+    substring is only confirmed on the vendors its token postings leave.
+    """
+    facets: FacetBitmaps = index.facet_bitmaps()
+    matches = _any_of(facets.vendor_area, index.resolve_areas(city, area))
+    if vendor_type:
+        matches &= facets.vendor_type.get(index.vendor_type_ids.get(vendor_type), 0)
+    if matches and speciality:
+        candidates = index.speciality_candidates(speciality)
+        speciality_lower = speciality.lower()
+        speciality_col = index.vendor_speciality
+        matches &= ids_to_bitmap((i for i in (range(facets.vendor_count) if candidates is None else candidates)
+                                  if speciality_lower in speciality_col[i]), facets.vendor_count)
+    if matches and (budget_min or budget_max):
+        prices = index.vendor_prices()
+        if budget_max:
+            matches = _keep_range(matches, [prices.min_price], facets.vendor_count, high=budget_max)
+        if budget_min:
+            matches = _keep_range(matches, [prices.max_price], facets.vendor_count, low=budget_min)
+    return matches
+
+def venue_facets(index, matches: int) -> Dict:
+    """Facet counts (areas, starting price, capacity) of a bitmap of matching venues"""
+    facets: FacetBitmaps = index.facet_bitmaps()
+    return {
+        "total": popcount(matches),
+        "areas": area_counts(index, count_by(matches, facets.venue_area)),
+        "price_ranges": bucket_counts(VENUE_PRICE_BUCKETS, count_by(matches, facets.venue_price)),
+        "capacity_ranges": bucket_counts(CAPACITY_BUCKETS, count_by(matches, facets.venue_capacity))
+    }
+
+def vendor_facets(index, matches: int) -> Dict:
+    """Facet counts (areas, starting price, vendor type) of a bitmap of matching vendors"""
+    facets: FacetBitmaps = index.facet_bitmaps()
+    type_counts = {index.vendor_type_keys[t]: n for t, n in count_by(matches, facets.vendor_type).items()}
+    return {
+        "total": popcount(matches),
+        "areas": area_counts(index, count_by(matches, facets.vendor_area)),
+        "price_ranges": bucket_counts(VENDOR_PRICE_BUCKETS, count_by(matches, facets.vendor_price)),
+        "vendor_types": dict(sorted(type_counts.items(), key=lambda item: (-item[1], item[0])))
+    }
+
+def bucket_case(column: str, edges: List[int]) -> str:
+    """SQL CASE expression giving the bucket number of a column, same buckets as bisect_right"""
+    whens = " ".join(f"WHEN {column} < {edge} THEN {k}" for k, edge in enumerate(edges))
+    return f"CASE {whens} ELSE {len(edges)} END"
@@ -0,0 +1,210 @@
+"""
+Synthetic Event Catalog Generator
+Produces event_data.json-shaped catalogs at any scale for load testing the search engine
+
+Usage:
+    python catalog_generator.py <output.json> [total_records] [seed]
+"""
+
+import json
+import math
+import random
+import sys
+from typing import Dict, List
+
+CITIES = [
+    ("delhi", "Delhi", "Delhi"), ("mumbai", "Mumbai", "Maharashtra"),
+    ("bangalore", "Bangalore", "Karnataka"), ("chennai", "Chennai", "Tamil Nadu"),
+    ("hyderabad", "Hyderabad", "Telangana"), ("pune", "Pune", "Maharashtra"),
+    ("kolkata", "Kolkata", "West Bengal"), ("gurgaon", "Gurgaon", "Haryana"),
+    ("noida", "Noida", "Uttar Pradesh"), ("kanpur", "Kanpur", "Uttar Pradesh"),
+    ("ahmedabad", "Ahmedabad", "Gujarat")
+]
+
+AREA_WORDS = ["Central", "North", "South", "East", "West", "Old", "New", "Park", "Lake", "Hill",
+              "Market", "Garden", "Station", "Fort", "Civil Lines", "Nagar", "Colony", "Vihar", "Enclave", "Bagh"]
+
+VENUE_PREFIXES = ["Royal", "Grand", "Imperial", "Golden", "Silver", "Crystal", "Heritage", "Regal",
+                  "Emerald", "Sapphire", "Lotus", "Palm", "Sea View", "Garden", "Metro", "Skyline"]
+VENUE_SUFFIXES = ["Banquet Hall", "Convention Center", "Palace", "Gardens", "Lawns", "Ballroom",
+                  "Resort", "Party Hall", "Event Space", "Rooftop"]
+
+AMENITIES = ["Central AC", "Valet Parking", "Sound System", "Stage", "Bridal Room", "Garden Area",
+             "Indoor Hall", "Catering Kitchen", "Parking", "Conference Setup", "AV Equipment", "WiFi",
+             "Business Lounge", "Catering", "Sea View", "Premium Decor", "Bridal Suite", "Dance Floor",
+             "Swimming Pool", "Rooftop Terrace", "Power Backup", "Green Room", "Projector", "Bar Counter"]
+
+EVENT_TYPES = ["wedding", "corporate", "birthday", "anniversary", "engagement", "reception",
+               "conference", "seminar", "product_launch", "baby_shower", "family_gathering",
+               "cultural_events", "exhibition", "workshop", "awards_ceremony", "small_wedding"]
+
+VENDOR_TYPES = {
+    "flowers": (["Bloom", "Petals", "Rose", "Lily", "Orchid"], ["Florists", "Floral Studio"],
+                ["Wedding & Event Decorations", "Designer Floral Arrangements", "Fresh Daily Flowers"],
+                (3000, 150000)),
+    "decoration": (["Creative", "Elegant", "Dream", "Royal"], ["Event Designers", "Decorators", "Occasions"],
+                   ["Theme Based Decorations", "Luxury Wedding Decorations", "Corporate & Theme Events"],
+                   (15000, 500000)),
+    "food": (["Spice Route", "Coastal", "Royal Tandoor", "Annapurna"], ["Catering", "Caterers", "Kitchens"],
+             ["Authentic Punjabi Cuisine", "Seafood & Continental Cuisine", "Traditional South Indian Cuisine"],
+             (200, 2000)),
+    "photography": (["Candid", "Pixel", "Memories", "Frame"], ["Studios", "Photography", "Films"],
+                    ["Wedding & Event Photography", "Corporate & Commercial Photography", "Candid Wedding Films"],
+                    (20000, 200000)),
+    "music_dj": (["Beat", "Rhythm", "Bass", "Groove"], ["DJs", "Entertainment", "Live Band"],
+                 ["Bollywood & Commercial Music", "Live Band & Sufi Nights", "Corporate Event Entertainment"],
+                 (15000, 150000)),
+    "transportation": (["Royal", "Swift", "City"], ["Cars", "Travels", "Rentals"],
+                       ["Luxury Car Rentals", "Group Transportation", "Premium Wedding & Corporate Cars"],
+                       (2500, 50000)),
+    "makeup_artist": (["Glam", "Blush", "Glow"], ["Studio", "Makeovers"],
+                      ["Bridal & Party Makeup", "Glamorous & Celebrity Style Events"], (5000, 80000)),
+    "tent_house": (["Shamiana", "Royal", "Utsav"], ["Tent House", "Tents & Events"],
+                   ["Wedding & Event Tents", "Traditional Shamiana Setup"], (10000, 300000))
+}
+
+VENDOR_SERVICES = ["Bridal Bouquets", "Stage Backdrop", "Theme Setup", "LED Lighting", "Live Counters",
+                   "Drone Coverage", "Sound & Lights", "Airport Transfers", "Same Day Edit", "Mandap Decoration"]
+
+def format_inr(amount: int) -> str:
+    """Format rupees with Indian digit grouping, e.g. 150000 -> ₹1,50,000"""
+    digits = str(int(amount))
+    if len(digits) > 3:
+        head, tail = digits[:-3], digits[-3:]
+        groups = []
+        while len(head) > 2:
+            groups.insert(0, head[-2:])
+            head = head[:-2]
+        if head:
+            groups.insert(0, head)
+        digits = ",".join(groups + [tail])
+    return f"₹{digits}"
+
+def _price_range(rng: random.Random, low: int, high: int, suffix: str = "") -> str:
+    """Price range string in the catalog's '₹min - ₹max' format"""
+    start = rng.randint(low, max(low, high // 2))
+    end = min(high, int(start * rng.uniform(1.3, 3.0)))
+    step = 100 if high < 10000 else 1000
+    start, end = start // step * step, max(start, end) // step * step
+    return f"{format_inr(start)} - {format_inr(end)}{suffix}"
+
+def _venue(rng: random.Random, area_name: str, city_name: str, serial: int) -> Dict:
+    capacity = rng.choice([50, 80, 100, 150, 200, 250, 300, 400, 500, 800, 1000, 1500, 2000])
+    price_floor = 10000 + capacity * rng.randint(100, 400)
+    return {
+        "name": f"{rng.choice(VENUE_PREFIXES)} {rng.choice(VENUE_SUFFIXES)} {serial}",
+        "address": f"{rng.randint(1, 250)}, {area_name}, {city_name}",
+        "capacity": capacity,
+        "price_range": _price_range(rng, price_floor, price_floor * 4),
+        "amenities": rng.sample(AMENITIES, rng.randint(3, 7)),
+        "contact": f"+91-{rng.randint(7000000000, 9999999999)}",
+        "email": f"bookings{serial}@example.com",
+        "rating": round(rng.uniform(3.2, 5.0), 1),
+        "suitable_for": rng.sample(EVENT_TYPES, rng.randint(2, 6))
+    }
+
+def _vendor(rng: random.Random, vendor_type: str, area_name: str, city_name: str, serial: int) -> Dict:
+    prefixes, suffixes, specialities, (low, high) = VENDOR_TYPES[vendor_type]
+    per_person = " per person" if vendor_type == "food" else ""
+    return {
+        "name": f"{rng.choice(prefixes)} {rng.choice(suffixes)} {serial}",
+        "speciality": rng.choice(specialities),
+        "price_range": _price_range(rng, low, high, per_person),
+        "services": rng.sample(VENDOR_SERVICES, rng.randint(2, 5)),
+        "contact": f"+91-{rng.randint(7000000000, 9999999999)}",
+        "email": f"hello{serial}@example.com",
+        "address": f"{area_name}, {city_name}",
+        "rating": round(rng.uniform(3.2, 5.0), 1),
+        "experience_years": rng.randint(1, 30)
+    }
+
+def _city_list(count: int) -> List[tuple]:
+    """Real catalog cities first, then numbered synthetic ones"""
+    cities = list(CITIES[:count])
+    for i in range(len(cities), count):
+        cities.append((f"city_{i + 1}", f"City {i + 1}", "Synthetic"))
+    return cities
+
+def generate_catalog(cities: int = 11,
+                     areas_per_city: int = 20,
+                     venues_per_area: int = 10,
+                     vendors_per_type: int = 5,
+                     vendor_types: List[str] = None,
+                     seed: int = 42) -> Dict:
+    """
+    Generate a catalog with the event_data.json schema
+
+    Args:
+        cities: Number of cities (the real catalog cities first, then synthetic ones)
+        areas_per_city: Areas in every city
+        venues_per_area: Venues in every area
+        vendors_per_type: Vendors of every type in every area
+        vendor_types: Vendor categories to generate (default: all known types)
+        seed: Random seed, so runs are repeatable
+
+    Returns:
+        Catalog dict ready for EventSearchEngine or json.dump
+    """
+    rng = random.Random(seed)
+    vendor_types = vendor_types or list(VENDOR_TYPES)
+    catalog = {"cities": {}, "vendor_categories": list(VENDOR_TYPES),
+               "price_ranges": {"venues": {}, "vendors": {}}}
+    serial = 0
+
+    for city_key, city_name, state in _city_list(cities):
+        areas = {}
+        for a in range(areas_per_city):
+            area_name = f"{AREA_WORDS[a % len(AREA_WORDS)]} {city_name}"
+            if a >= len(AREA_WORDS):
+                area_name += f" {a // len(AREA_WORDS) + 1}"
+            area_key = area_name.lower().replace(" ", "_")
+
+            venues = []
+            for _ in range(venues_per_area):
+                serial += 1
+                venues.append(_venue(rng, area_name, city_name, serial))
+
+            vendors = {}
+            for vendor_type in vendor_types:
+                vendors[vendor_type] = []
+                for _ in range(vendors_per_type):
+                    serial += 1
+                    vendors[vendor_type].append(_vendor(rng, vendor_type, area_name, city_name, serial))
+
+            areas[area_key] = {"name": area_name, "venues": venues, "vendors": vendors}
+
+        catalog["cities"][city_key] = {"name": city_name, "state": state, "areas": areas}
+
+    return catalog
+
+def generate_catalog_of_size(total_records: int, seed: int = 42,
+                             venues_per_area: int = 10, vendors_per_type: int = 5) -> Dict:
+    """
+    Generate a catalog with roughly `total_records` venues + vendors
+
+    Areas hold a fixed mix of venues and vendors, so scale comes from the number of areas.
+    Cities grow up to 50, beyond which areas per city grow instead.
+    """
+    records_per_area = venues_per_area + vendors_per_type * len(VENDOR_TYPES)
+    area_count = max(1, round(total_records / records_per_area))
+    cities = min(50, max(1, area_count // 20))
+    return generate_catalog(cities=cities,
+                            areas_per_city=math.ceil(area_count / cities),
+                            venues_per_area=venues_per_area,
+                            vendors_per_type=vendors_per_type,
+                            seed=seed)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python catalog_generator.py <output.json> [total_records] [seed]")
+        sys.exit(1)
+
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    generated = generate_catalog_of_size(size, seed=int(sys.argv[3]) if len(sys.argv) > 3 else 42)
+    with open(sys.argv[1], "w", encoding="utf-8") as f:
+        json.dump(generated, f, ensure_ascii=False)
+
+    venue_count = sum(len(a["venues"]) for c in generated["cities"].values() for a in c["areas"].values())
+    vendor_count = sum(len(v) for c in generated["cities"].values() for a in c["areas"].values()
+                       for v in a["vendors"].values())
+    print(f"✅ Wrote {sys.argv[1]}: {len(generated['cities'])} cities, {venue_count} venues, {vendor_count} vendors")
@@ -0,0 +1,191 @@
+"""
+Shared-Memory Event Catalog
+Publishes the compiled catalog into multiprocessing.shared_memory so every uvicorn worker
+searches one copy instead of loading event_data.json itself
+
+One loader process compiles the catalog to the binary snapshot format (catalog_snapshot.py)
+and copies it into a data segment "<name>_<generation>". A small control segment "<name>"
+records the current generation and data segment. Workers attach read-only (EVENT_CATALOG_SHM),
+so catalog memory does not grow with the worker count. To reload, the loader publishes the
+next generation and unlinks the previous segment; workers watching the control segment
+re-attach, and queries still running on the old segment keep their mapping until they finish.
+
+Only the snapshot columns are shared. The NumPy columns of vectorized mode are zero-copy views
+of the segment, but everything an index derives on first use (venue range indexes, facet
+bitmaps, the location resolver, the BM25 text index, similarity vectors, the availability
+calendar) is built in each worker's own memory, once per attached generation.
+
+Usage:
+    python catalog_shm.py event_data.json [name] [poll seconds]    # publish, republish on change
+"""
+
+import json
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple
+
+from catalog_snapshot import SnapshotCatalogIndex, build_snapshot
+from event_index import CatalogIndex
+
+DEFAULT_SEGMENT = "event_catalog"
+CONTROL_MAGIC = b"EVSHM001"
+# magic | generation | data segment name (NUL padded)
+_CONTROL = struct.Struct("<8sQ64s")
+
+# Segments created by this process (the tracker registration is theirs to keep)
+_created_segments = set()
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> shared_memory.SharedMemory:
+    """Open or create a segment; only the creating (loader) process tracks it for cleanup"""
+    try:
+        return shared_memory.SharedMemory(name, create=create, size=size, track=create)
+    except TypeError:
+        # Python < 3.13 registers every attach with the resource tracker, which would unlink
+        # the loader's segments when a worker exits
+        segment = shared_memory.SharedMemory(name, create=create, size=size)
+        if create:
+            _created_segments.add(name)
+        elif os.name == "posix" and name not in _created_segments:
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+def read_control(name: str = DEFAULT_SEGMENT) -> Optional[Tuple[int, str]]:
+    """(generation, data segment name) currently published under `name`, None if nothing is"""
+    try:
+        control = _open_segment(name)
+    except FileNotFoundError:
+        return None
+    try:
+        # The loader rewrites the record in place; retry until two reads agree
+        previous = None
+        while True:
+            record = bytes(control.buf[:_CONTROL.size])
+            if record == previous:
+                break
+            previous = record
+    finally:
+        control.close()
+
+    magic, generation, segment = _CONTROL.unpack(record)
+    if magic != CONTROL_MAGIC:
+        return None
+    return generation, segment.rstrip(b"\0").decode("ascii")
+
+def attach_catalog(name: str = DEFAULT_SEGMENT) -> SnapshotCatalogIndex:
+    """
+    Attach to the catalog published under `name`
+
+    Returns:
+        A read-only index over the shared segment (its `generation` says which publish it is)
+
+    Raises:
+        FileNotFoundError: No catalog is published under `name`
+    """
+    for _ in range(3):
+        control = read_control(name)
+        if control is None:
+            raise FileNotFoundError(f"no event catalog published in shared memory as '{name}'")
+        generation, segment_name = control
+        try:
+            segment = _open_segment(segment_name)
+        except FileNotFoundError:
+            # Republished (and the old segment unlinked) between the two opens
+            continue
+        index = SnapshotCatalogIndex(segment.buf, keep_alive=segment)
+        index.generation = generation
+        return index
+    raise FileNotFoundError(f"event catalog '{name}' kept changing while attaching")
+
+class CatalogPublisher:
+    """
+    Loader side: owns the control segment and the current data segment
+
+    Segments are unlinked by close() (or by the resource tracker if the loader dies), after
+    which already-attached workers keep serving the last generation until they restart.
+    """
+
+    def __init__(self, name: str = DEFAULT_SEGMENT):
+        self.name = name
+        self.generation = 0
+        self.segment: Optional[shared_memory.SharedMemory] = None
+        previous = read_control(name)
+        if previous is not None:
+            # Continue the numbering of a loader that exited without cleaning up
+            self.generation = previous[0]
+            self._unlink(previous[1])
+            self._unlink(name)
+        self.control = _open_segment(name, create=True, size=_CONTROL.size)
+
+    def publish(self, index: CatalogIndex) -> int:
+        """Copy a compiled catalog into a new segment and point the control segment at it"""
+        writer, tables = build_snapshot(index)
+        head, offsets, size = writer.layout(tables)
+        generation = self.generation + 1
+        segment_name = f"{self.name}_{generation}"
+        self._unlink(segment_name)
+        segment = _open_segment(segment_name, create=True, size=size)
+        writer.write_into(segment.buf, head, offsets)
+
+        self.control.buf[:_CONTROL.size] = _CONTROL.pack(CONTROL_MAGIC, generation, segment_name.encode("ascii"))
+        previous, self.segment, self.generation = self.segment, segment, generation
+        if previous is not None:
+            previous.close()
+            previous.unlink()
+            _created_segments.discard(previous.name)
+        return generation
+
+    def publish_file(self, data_file: str) -> int:
+        """Compile a catalog JSON file and publish it"""
+        with open(data_file, "r", encoding="utf-8") as f:
+            return self.publish(CatalogIndex(json.load(f)))
+
+    def close(self):
+        """Unlink the control and data segments"""
+        for segment in (self.segment, self.control):
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+                _created_segments.discard(segment.name)
+        self.segment = self.control = None
+
+    @staticmethod
+    def _unlink(name: str):
+        try:
+            segment = shared_memory.SharedMemory(name)
+        except FileNotFoundError:
+            return
+        segment.close()
+        segment.unlink()
+
+def serve(data_file: str, name: str = DEFAULT_SEGMENT, interval: float = 2.0):
+    """Publish data_file, then republish whenever it changes (mtime/size polling) until interrupted"""
+    publisher = CatalogPublisher(name)
+    signature = None
+    try:
+        while True:
+            try:
+                stat = os.stat(data_file)
+                if (stat.st_mtime_ns, stat.st_size) != signature:
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                    generation = publisher.publish_file(data_file)
+                    print(f"✅ Published {data_file} as '{name}' (generation {generation})")
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Catalog publish failed, workers keep the current one: {e}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+        print(f"🛑 Unpublished '{name}'")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python catalog_shm.py <event_data.json> [name] [poll seconds]")
+        sys.exit(1)
+
+    serve(sys.argv[1],
+          sys.argv[2] if len(sys.argv) > 2 else DEFAULT_SEGMENT,
+          float(sys.argv[3]) if len(sys.argv) > 3 else 2.0)
@@ -0,0 +1,397 @@
+"""
+Binary Catalog Snapshot
+Compiles event_data.json into a memory-mappable file that EventSearchEngine can open without parsing JSON
+
+Layout (little-endian, every section 8-byte aligned):
+    magic "EVSNAP01" | u64 manifest length | manifest JSON | sections...
+
+The manifest holds the small lookup tables (cities, areas, vocabularies) and the offset of every
+section. Sections are fixed-width numeric columns, offset-indexed string tables (u64 offsets +
+UTF-8 blob) and grouped id lists (u64 offsets + i32 ids). Opening a snapshot only reads the
+manifest; record JSON is decoded one row at a time when a result is materialized, and worker
+processes mapping the same file share one page-cached copy.
+
+Usage:
+    python catalog_snapshot.py event_data.json event_data.snapshot
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+from event_index import CatalogIndex, _catalog_versions
+
+SNAPSHOT_MAGIC = b"EVSNAP01"
+SNAPSHOT_FORMAT = 2
+_HEADER = struct.Struct("<8sQ")
+
+def is_snapshot(path: str) -> bool:
+    """True if the file starts with the snapshot magic"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+class _SnapshotWriter:
+    """Accumulates sections and writes them behind the manifest"""
+
+    def __init__(self):
+        self.payloads: List[tuple] = []
+
+    def add(self, name: str, fmt: str, data: bytes):
+        self.payloads.append((name, fmt, data))
+
+    def add_array(self, name: str, values: array):
+        if sys.byteorder != "little":
+            values = array(values.typecode, values)
+            values.byteswap()
+        self.add(name, values.typecode, values.tobytes())
+
+    def add_strings(self, name: str, strings: Sequence[str]):
+        offsets = array("q", [0])
+        blob = bytearray()
+        for text in strings:
+            blob += text.encode("utf-8")
+            offsets.append(len(blob))
+        self.add_array(name + ".offsets", offsets)
+        self.add(name + ".blob", "B", bytes(blob))
+
+    def add_groups(self, name: str, groups: Sequence[Sequence[int]]):
+        offsets = array("q", [0])
+        ids = array("i")
+        for group in groups:
+            ids.extend(group)
+            offsets.append(len(ids))
+        self.add_array(name + ".offsets", offsets)
+        self.add_array(name + ".ids", ids)
+
+    def layout(self, tables: Dict) -> Tuple[bytes, Dict[str, int], int]:
+        """Header + manifest bytes, section offsets and total size of the snapshot"""
+        # Section offsets depend on the manifest size, which depends on the offsets: size the
+        # manifest with placeholder offsets first, then pad it to that fixed length
+        def manifest_bytes(offsets):
+            sections = {name: [offsets.get(name, 0), len(data), fmt]
+                        for name, fmt, data in self.payloads}
+            return json.dumps({"format": SNAPSHOT_FORMAT, "tables": tables, "sections": sections},
+                              ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        placeholder = {name: 1 << 62 for name, _, _ in self.payloads}
+        manifest_size = _align(len(manifest_bytes(placeholder)))
+
+        offsets = {}
+        position = _HEADER.size + manifest_size
+        for name, _, data in self.payloads:
+            offsets[name] = position
+            position = _align(position + len(data))
+
+        manifest = manifest_bytes(offsets).ljust(manifest_size, b" ")
+        return _HEADER.pack(SNAPSHOT_MAGIC, manifest_size) + manifest, offsets, position
+
+    def write(self, path: str, tables: Dict):
+        """
+        Write the snapshot next to `path` and rename it into place
+
+        Processes that have the old file mapped keep reading its (unlinked) pages; truncating
+        it in place would fault them with SIGBUS.
+        """
+        head, offsets, size = self.layout(tables)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(head)
+            for name, _, data in self.payloads:
+                f.seek(offsets[name])
+                f.write(data)
+            f.truncate(size)
+        os.replace(tmp_path, path)
+
+    def write_into(self, buffer, head: bytes, offsets: Dict[str, int]):
+        """Copy a laid-out snapshot into a writable buffer of at least the layout size"""
+        with memoryview(buffer) as view:
+            view[:len(head)] = head
+            for name, _, data in self.payloads:
+                view[offsets[name]:offsets[name] + len(data)] = data
+
+def write_snapshot(index: CatalogIndex, path: str):
+    """Serialize a compiled CatalogIndex to a snapshot file"""
+    writer, tables = build_snapshot(index)
+    writer.write(path, tables)
+
+def build_snapshot(index: CatalogIndex) -> Tuple[_SnapshotWriter, Dict]:
+    """Encode every section of a compiled CatalogIndex; returns (writer, manifest tables)"""
+    index = index.compacted()
+    writer = _SnapshotWriter()
+    event_types = sorted(index.event_type_bits, key=index.event_type_bits.get)
+    word_count = max(1, (len(event_types) + 63) // 64)
+    amenity_vocab = sorted(index.venues_by_amenity)
+    amenity_ids = {amenity: i for i, amenity in enumerate(amenity_vocab)}
+    speciality_vocab = sorted(index.vendors_by_speciality_token)
+    type_count = len(index.vendor_type_keys)
+
+    # Venue columns
+    for name in ("venue_city", "venue_area", "venue_capacity", "venue_min_price",
+                 "venue_max_price", "venue_rating", "venue_rank_prior", "venue_capacity_inv",
+                 "venue_price_span_inv"):
+        writer.add_array(name, getattr(index, name))
+    words = array("Q")
+    for mask in index.venue_event_mask:
+        for _ in range(word_count):
+            words.append(mask & 0xFFFFFFFFFFFFFFFF)
+            mask >>= 64
+    writer.add_array("venue_event_words", words)
+    writer.add_strings("venue_records", [json.dumps(r, ensure_ascii=False, separators=(",", ":"))
+                                         for r in index.venue_records])
+    writer.add_groups("venue_amenities", [sorted(amenity_ids[a] for a in amenities)
+                                          for amenities in index.venue_amenities])
+
+    # Vendor columns
+    for name in ("vendor_city", "vendor_area", "vendor_type", "vendor_min_price",
+                 "vendor_max_price", "vendor_rating"):
+        writer.add_array(name, getattr(index, name))
+    writer.add_strings("vendor_records", [json.dumps(r, ensure_ascii=False, separators=(",", ":"))
+                                          for r in index.vendor_records])
+    writer.add_strings("vendor_speciality", index.vendor_speciality)
+
+    # Location lists and posting lists
+    writer.add_groups("area_venues", index.area_venues)
+    writer.add_groups("area_vendors", [index.area_vendors[a].get(t, [])
+                                       for a in range(len(index.area_keys)) for t in range(type_count)])
+    writer.add_groups("venues_by_event_type", [index.venues_by_event_type.get(e, []) for e in event_types])
+    writer.add_groups("venues_by_amenity", [index.venues_by_amenity[a] for a in amenity_vocab])
+    writer.add_groups("vendors_by_speciality_token",
+                      [index.vendors_by_speciality_token[t] for t in speciality_vocab])
+
+    return writer, {
+        "venue_count": len(index.venue_records),
+        "vendor_count": len(index.vendor_records),
+        "event_words": word_count,
+        "vendor_categories": index.vendor_categories,
+        "city_keys": index.city_keys,
+        "city_names": index.city_names,
+        "area_keys": index.area_keys,
+        "area_names": index.area_names,
+        "area_city": list(index.area_city),
+        "event_types": event_types,
+        "vendor_types": index.vendor_type_keys,
+        "amenities": amenity_vocab,
+        "speciality_tokens": speciality_vocab
+    }
+
+def compile_snapshot(data_file: str, snapshot_file: str) -> CatalogIndex:
+    """Compile a catalog JSON file straight to a snapshot"""
+    with open(data_file, "r", encoding="utf-8") as f:
+        index = CatalogIndex(json.load(f))
+    write_snapshot(index, snapshot_file)
+    return index
+
+class _StringColumn:
+    """Offset-indexed string table read straight out of the buffer"""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+class _RecordColumn(_StringColumn):
+    """Record JSON decoded on access, one row at a time"""
+
+    def __getitem__(self, i: int) -> Dict:
+        return json.loads(super().__getitem__(i))
+
+class _Groups:
+    """Grouped id lists: group g is ids[offsets[g]:offsets[g + 1]]"""
+
+    def __init__(self, offsets, ids):
+        self.offsets = offsets
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, group: int):
+        return self.ids[self.offsets[group]:self.offsets[group + 1]]
+
+    def __iter__(self):
+        return (self[g] for g in range(len(self)))
+
+class _MaskColumn:
+    """Event-type bitmasks reassembled from 64-bit words"""
+
+    def __init__(self, words, word_count: int):
+        self.words = words
+        self.word_count = word_count
+
+    def __len__(self):
+        return len(self.words) // self.word_count
+
+    def __getitem__(self, i: int) -> int:
+        base = i * self.word_count
+        mask = 0
+        for word in range(self.word_count - 1, -1, -1):
+            mask = (mask << 64) | self.words[base + word]
+        return mask
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+class _AmenityColumn:
+    """Per-venue amenity sets from grouped amenity ids"""
+
+    def __init__(self, groups: _Groups, vocab: List[str]):
+        self.groups = groups
+        self.vocab = vocab
+
+    def __len__(self):
+        return len(self.groups)
+
+    def __getitem__(self, i: int) -> frozenset:
+        return frozenset(self.vocab[a] for a in self.groups[i])
+
+class _AreaVendors:
+    """Per-area {vendor type id: vendor ids} dicts, built on access"""
+
+    def __init__(self, groups: _Groups, type_count: int):
+        self.groups = groups
+        self.type_count = type_count
+
+    def __len__(self):
+        return len(self.groups) // self.type_count if self.type_count else 0
+
+    def __getitem__(self, area_id: int) -> Dict[int, Sequence[int]]:
+        base = area_id * self.type_count
+        vendors_by_type = {}
+        for type_id in range(self.type_count):
+            ids = self.groups[base + type_id]
+            if len(ids):
+                vendors_by_type[type_id] = ids
+        return vendors_by_type
+
+class SnapshotCatalogIndex(CatalogIndex):
+    """
+    CatalogIndex backed by a snapshot buffer (mmap or shared memory)
+
+    Columns are memoryviews over the buffer, so nothing proportional to the catalog size is
+    parsed or copied when the snapshot is opened. The index is read-only.
+    """
+
+    read_only = True
+
+    def __init__(self, buffer, keep_alive=None):
+        """Lay the index out over a snapshot buffer; keep_alive holds the object owning it"""
+        self.version = next(_catalog_versions)
+        self._buffer = memoryview(buffer)
+
+        magic, manifest_size = _HEADER.unpack_from(self._buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("not an event catalog snapshot")
+        manifest = json.loads(bytes(self._buffer[_HEADER.size:_HEADER.size + manifest_size]))
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"unsupported snapshot format {manifest.get('format')}")
+        if sys.byteorder != "little":
+            raise ValueError("snapshots are little-endian; this platform is not")
+        self._sections = manifest["sections"]
+        self.retired_venues = self.retired_vendors = frozenset()
+        tables = manifest["tables"]
+
+        # Location tables and vocabularies
+        self.vendor_categories = tables["vendor_categories"]
+        self.city_keys = tables["city_keys"]
+        self.city_names = tables["city_names"]
+        self.city_ids = {key: i for i, key in enumerate(self.city_keys)}
+        self.area_keys = tables["area_keys"]
+        self.area_names = tables["area_names"]
+        self.area_city = tables["area_city"]
+        self.city_areas = [[] for _ in self.city_keys]
+        self.area_ids = {}
+        for area_id, area_key in enumerate(self.area_keys):
+            self.city_areas[self.area_city[area_id]].append(area_id)
+            self.area_ids.setdefault(area_key, []).append(area_id)
+        self.event_type_bits = {event_type: bit for bit, event_type in enumerate(tables["event_types"])}
+        self.vendor_type_keys = tables["vendor_types"]
+        self.vendor_type_ids = {key: i for i, key in enumerate(self.vendor_type_keys)}
+
+        # Venue columns
+        self.venue_city = self._column("venue_city")
+        self.venue_area = self._column("venue_area")
+        self.venue_capacity = self._column("venue_capacity")
+        self.venue_min_price = self._column("venue_min_price")
+        self.venue_max_price = self._column("venue_max_price")
+        self.venue_rating = self._column("venue_rating")
+        self.venue_rank_prior = self._column("venue_rank_prior")
+        self.venue_capacity_inv = self._column("venue_capacity_inv")
+        self.venue_price_span_inv = self._column("venue_price_span_inv")
+        self.venue_event_mask = _MaskColumn(self._column("venue_event_words"), tables["event_words"])
+        self.venue_records = _RecordColumn(self._column("venue_records.offsets"),
+                                           self._column("venue_records.blob"))
+        self.venue_amenities = _AmenityColumn(self._groups("venue_amenities"), tables["amenities"])
+
+        # Vendor columns
+        self.vendor_city = self._column("vendor_city")
+        self.vendor_area = self._column("vendor_area")
+        self.vendor_type = self._column("vendor_type")
+        self.vendor_min_price = self._column("vendor_min_price")
+        self.vendor_max_price = self._column("vendor_max_price")
+        self.vendor_rating = self._column("vendor_rating")
+        self.vendor_records = _RecordColumn(self._column("vendor_records.offsets"),
+                                            self._column("vendor_records.blob"))
+        self.vendor_speciality = _StringColumn(self._column("vendor_speciality.offsets"),
+                                               self._column("vendor_speciality.blob"))
+
+        # Location lists and posting lists
+        self.area_venues = self._groups("area_venues")
+        self.area_vendors = _AreaVendors(self._groups("area_vendors"), len(self.vendor_type_keys))
+        event_postings = self._groups("venues_by_event_type")
+        self.venues_by_event_type = {e: event_postings[i] for i, e in enumerate(tables["event_types"])}
+        amenity_postings = self._groups("venues_by_amenity")
+        self.venues_by_amenity = {a: amenity_postings[i] for i, a in enumerate(tables["amenities"])}
+        token_postings = self._groups("vendors_by_speciality_token")
+        self.vendors_by_speciality_token = {t: token_postings[i]
+                                            for i, t in enumerate(tables["speciality_tokens"])}
+        self._speciality_token_cache = {}
+
+        self._venue_scopes = {}
+        self._vendor_prices = None
+        self._numpy_columns = None
+        self._facet_bitmaps = None
+        self._location_resolver = None
+        self._venue_similarity = None
+        self._text_index = None
+        self._availability = None
+        # Assigned last so it is released last: the owner must outlive every view of its buffer
+        self._keep_alive = keep_alive
+
+    def _column(self, name: str):
+        offset, length, fmt = self._sections[name]
+        return self._buffer[offset:offset + length].cast(fmt)
+
+    def _groups(self, name: str) -> _Groups:
+        return _Groups(self._column(name + ".offsets"), self._column(name + ".ids"))
+
+def open_snapshot(path: str) -> SnapshotCatalogIndex:
+    """Memory-map a snapshot file read-only and return an index over it"""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return SnapshotCatalogIndex(mapped, keep_alive=mapped)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python catalog_snapshot.py <event_data.json> <snapshot file>")
+        sys.exit(1)
+
+    compiled = compile_snapshot(sys.argv[1], sys.argv[2])
+    print(f"✅ Wrote {sys.argv[2]}: {len(compiled.venue_records)} venues, {len(compiled.vendor_records)} vendors")
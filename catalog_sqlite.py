@@ -0,0 +1,517 @@
+"""
+SQLite Catalog Backend
+Runs EventSearchEngine venue/vendor searches against an indexed SQLite database instead of an in-memory catalog
+
+Build the database once from the JSON catalog:
+    python catalog_sqlite.py event_data.json event_catalog.db
+
+then point the engine at it:
+    EventSearchEngine(backend=SQLiteCatalogBackend("event_catalog.db"))
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from catalog_facets import (CAPACITY_BUCKETS, CAPACITY_EDGES, VENDOR_PRICE_BUCKETS, VENDOR_PRICE_EDGES,
+                            VENUE_PRICE_BUCKETS, VENUE_PRICE_EDGES, bucket_case, bucket_counts)
+from event_index import CatalogIndex
+from location_resolver import LocationResolver
+from text_index import text_terms, vendor_document, venue_document
+from venue_availability import booked_days
+from venue_similarity import VenueSimilarity
+from venue_ranking import VenueScorer
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+-- Free-text search: rowid is the venue/vendor id, terms its text_index.text_terms joined by spaces
+CREATE VIRTUAL TABLE venue_text USING fts5(terms, content='');
+CREATE VIRTUAL TABLE vendor_text USING fts5(terms, content='');
+CREATE TABLE cities (id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE, name TEXT NOT NULL);
+CREATE TABLE areas (
+    id INTEGER PRIMARY KEY,
+    city_id INTEGER NOT NULL REFERENCES cities(id),
+    key TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE venues (
+    id INTEGER PRIMARY KEY,
+    city_id INTEGER NOT NULL,
+    area_id INTEGER NOT NULL,
+    capacity INTEGER NOT NULL,
+    min_price INTEGER NOT NULL,
+    max_price INTEGER NOT NULL,
+    rating REAL NOT NULL,
+    rank_prior REAL NOT NULL,
+    capacity_inv REAL NOT NULL,
+    price_span_inv REAL NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE TABLE venue_event_types (event_type TEXT NOT NULL, venue_id INTEGER NOT NULL, PRIMARY KEY (event_type, venue_id)) WITHOUT ROWID;
+CREATE TABLE venue_amenities (amenity TEXT NOT NULL, venue_id INTEGER NOT NULL, PRIMARY KEY (amenity, venue_id)) WITHOUT ROWID;
+CREATE TABLE venue_bookings (day TEXT NOT NULL, venue_id INTEGER NOT NULL, PRIMARY KEY (day, venue_id)) WITHOUT ROWID;
+CREATE TABLE vendors (
+    id INTEGER PRIMARY KEY,
+    city_id INTEGER NOT NULL,
+    area_id INTEGER NOT NULL,
+    vendor_type TEXT NOT NULL,
+    min_price INTEGER NOT NULL,
+    max_price INTEGER NOT NULL,
+    rating REAL NOT NULL,
+    speciality TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+
+CREATE INDEX areas_by_key ON areas (key, city_id);
+CREATE INDEX venues_by_location ON venues (city_id, area_id, rating DESC);
+CREATE INDEX venues_by_capacity ON venues (capacity);
+CREATE INDEX venues_by_min_price ON venues (min_price);
+CREATE INDEX venues_by_max_price ON venues (max_price);
+CREATE INDEX venues_by_rating ON venues (rating DESC, id);
+CREATE INDEX vendors_by_type_location ON vendors (vendor_type, city_id, area_id, rating DESC);
+CREATE INDEX vendors_by_location ON vendors (city_id, area_id);
+CREATE INDEX vendors_by_min_price ON vendors (min_price);
+CREATE INDEX vendors_by_max_price ON vendors (max_price);
+CREATE INDEX vendors_by_rating ON vendors (rating DESC, id);
+"""
+
+def build_sqlite_catalog(index: CatalogIndex, db_path: str):
+    """Write a compiled CatalogIndex into a fresh SQLite database"""
+    index = index.compacted()
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.execute("INSERT INTO meta VALUES ('vendor_categories', ?)", (json.dumps(index.vendor_categories),))
+        conn.executemany("INSERT INTO cities VALUES (?, ?, ?)",
+                         zip(range(len(index.city_keys)), index.city_keys, index.city_names))
+        conn.executemany("INSERT INTO areas VALUES (?, ?, ?, ?)",
+                         zip(range(len(index.area_keys)), index.area_city, index.area_keys, index.area_names))
+
+        conn.executemany("INSERT INTO venues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", (
+            (i, index.venue_city[i], index.venue_area[i], index.venue_capacity[i],
+             index.venue_min_price[i], index.venue_max_price[i], index.venue_rating[i],
+             index.venue_rank_prior[i], index.venue_capacity_inv[i], index.venue_price_span_inv[i],
+             json.dumps(index.venue_records[i], ensure_ascii=False))
+            for i in range(len(index.venue_records))
+        ))
+        conn.executemany("INSERT INTO venue_event_types VALUES (?, ?)", (
+            (event_type, venue_id)
+            for event_type, venue_ids in index.venues_by_event_type.items() for venue_id in venue_ids
+        ))
+        conn.executemany("INSERT INTO venue_amenities VALUES (?, ?)", (
+            (amenity, venue_id)
+            for amenity, venue_ids in index.venues_by_amenity.items() for venue_id in venue_ids
+        ))
+        conn.executemany("INSERT OR IGNORE INTO venue_bookings VALUES (?, ?)", (
+            (day.isoformat(), i)
+            for i in range(len(index.venue_records)) for day in booked_days(index.venue_records[i])
+        ))
+
+        conn.executemany("INSERT INTO vendors VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", (
+            (i, index.vendor_city[i], index.vendor_area[i], index.vendor_type_keys[index.vendor_type[i]],
+             index.vendor_min_price[i], index.vendor_max_price[i], index.vendor_rating[i],
+             index.vendor_speciality[i], json.dumps(index.vendor_records[i], ensure_ascii=False))
+            for i in range(len(index.vendor_records))
+        ))
+        conn.executemany("INSERT INTO venue_text (rowid, terms) VALUES (?, ?)", (
+            (i, " ".join(text_terms(venue_document(index.venue_records[i]))))
+            for i in range(len(index.venue_records))
+        ))
+        conn.executemany("INSERT INTO vendor_text (rowid, terms) VALUES (?, ?)", (
+            (i, " ".join(text_terms(vendor_document(index.vendor_records[i]))))
+            for i in range(len(index.vendor_records))
+        ))
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+
+class SQLiteCatalogBackend:
+    """
+    Catalog storage backend over a SQLite database built by build_sqlite_catalog
+
+    Only the rows a query returns are read into memory, so the catalog does not have to stay
+    resident in every worker. Each thread gets its own read-only connection, reopened when
+    build_sqlite_catalog replaces the file (an open connection keeps reading the old inode).
+    """
+
+    def __init__(self, db_path: str):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"SQLite catalog {db_path} not found")
+        self.db_path = db_path
+        self._local = threading.local()
+        self._resolver: Optional[Tuple[Tuple[int, int, int], LocationResolver]] = None
+        self._similarity: Optional[Tuple[Tuple[int, int, int], VenueSimilarity]] = None
+
+    def _connect(self) -> Tuple[Tuple[int, int, int], sqlite3.Connection]:
+        """This thread's connection and the file version it reads, reopened if the file changed"""
+        version = self.version
+        opened = getattr(self._local, "opened", None)
+        if opened is None or opened[0] != version:
+            # the old connection is not closed here: a cursor still being read holds on to it
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            opened = self._local.opened = (version, conn)
+        return opened
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self._connect()[1]
+
+    @property
+    def version(self) -> Tuple[int, int, int]:
+        """Changes whenever the database file is rebuilt (used for result cache invalidation)"""
+        stat = os.stat(self.db_path)
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _query(self, sql: str, params: List, limit: Optional[int], after: Optional[Tuple[float, int]] = None):
+        """
+        Run a ranked SELECT, appending LIMIT when the caller wants only the top rows
+
+        `after` keeps only rows ranked below a (rank_key, id) position; the total column
+        still counts every match because the window is evaluated before that filter.
+        """
+        if after is not None:
+            sql = (f"SELECT * FROM ({sql}) WHERE rank_key < ? OR (rank_key = ? AND id > ?) "
+                   f"ORDER BY rank_key DESC, id")
+            params = params + [after[0], after[0], after[1]]
+        if limit is None:
+            return self.conn.execute(sql, params)
+        return self.conn.execute(sql + " LIMIT ?", params + [max(limit, 0)])
+
+    def location_resolver(self) -> LocationResolver:
+        """Fuzzy city/area matcher over the cities/areas tables, rebuilt when the database changes"""
+        version, conn = self._connect()
+        if self._resolver is None or self._resolver[0] != version:
+            cities = conn.execute("SELECT key, name FROM cities ORDER BY id").fetchall()
+            areas = conn.execute("SELECT key, name, city_id FROM areas ORDER BY id").fetchall()
+            self._resolver = (version, LocationResolver([c[0] for c in cities], [c[1] for c in cities],
+                                                        [a[0] for a in areas], [a[1] for a in areas],
+                                                        [a[2] for a in areas]))
+        return self._resolver[1]
+
+    def _location_filter(self, table: str, city: Optional[str], area: Optional[str]) -> Tuple[List[str], List]:
+        """WHERE clauses restricting rows to a city/area (keys, names, aliases or misspellings)"""
+        clauses, params = [], []
+        if not city and not area:
+            return clauses, params
+        resolver = self.location_resolver()
+        city_id = resolver.city_id(city) if city else None
+        if city:
+            clauses.append(f"{table}.city_id = ?")
+            params.append(-1 if city_id is None else city_id)
+        if area:
+            area_id = resolver.area_id(area, city_id) if city_id is not None or not city else None
+            clauses.append(f"{table}.area_id IN (SELECT id FROM areas WHERE key = ?)")
+            params.append(area.lower() if area_id is None else resolver.area_keys[area_id])
+        return clauses, params
+
+    def _venue_where(self, city: Optional[str], area: Optional[str], capacity: Optional[int],
+                     budget_min: Optional[int], budget_max: Optional[int], event_type: Optional[str],
+                     amenities: Optional[List[str]], available: Optional[Tuple[date, date]] = None) -> Tuple[str, List]:
+        """WHERE clause (over venues aliased v) for the search_venues filters"""
+        clauses, params = self._location_filter("v", city, area)
+        if capacity:
+            clauses.append("v.capacity >= ?")
+            params.append(capacity)
+        if budget_min:
+            clauses.append("v.max_price >= ?")
+            params.append(budget_min)
+        if budget_max:
+            clauses.append("v.min_price <= ?")
+            params.append(budget_max)
+        if event_type:
+            clauses.append("v.id IN (SELECT venue_id FROM venue_event_types WHERE event_type = ?)")
+            params.append(event_type.lower())
+        for amenity in {a.strip().lower() for a in amenities or [] if a and a.strip()}:
+            clauses.append("v.id IN (SELECT venue_id FROM venue_amenities WHERE amenity = ?)")
+            params.append(amenity)
+        if available:
+            clauses.append("v.id NOT IN (SELECT venue_id FROM venue_bookings WHERE day BETWEEN ? AND ?)")
+            params += [available[0].isoformat(), available[1].isoformat()]
+        return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _vendor_where(self, city: Optional[str], area: Optional[str], vendor_type: Optional[str],
+                      budget_min: Optional[int], budget_max: Optional[int],
+                      speciality: Optional[str]) -> Tuple[str, List]:
+        """WHERE clause (over vendors aliased d) for the search_vendors filters"""
+        clauses, params = self._location_filter("d", city, area)
+        if vendor_type:
+            clauses.append("d.vendor_type = ?")
+            params.append(vendor_type)
+        if budget_min:
+            clauses.append("d.max_price >= ?")
+            params.append(budget_min)
+        if budget_max:
+            clauses.append("d.min_price <= ?")
+            params.append(budget_max)
+        if speciality:
+            clauses.append("instr(d.speciality, ?) > 0")
+            params.append(speciality.lower())
+        return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def search_venues(self,
+                      city: str = None,
+                      area: str = None,
+                      capacity: int = None,
+                      budget_min: int = None,
+                      budget_max: int = None,
+                      event_type: str = None,
+                      amenities: List[str] = None,
+                      limit: int = None,
+                      after: Tuple[float, int] = None,
+                      scorer: VenueScorer = None,
+                      available: Tuple[date, date] = None,
+                      text: str = None) -> Tuple[List[Dict], int, List[Tuple[float, int]]]:
+        """
+        Venue search with EventSearchEngine.search_venues semantics
+
+        Ranked by rating, or by relevance score when a VenueScorer is given. Returns (rows,
+        total matches, (rating or score, id) ranking key of every row); `after` resumes below
+        a ranking key from an earlier page. `available` keeps venues free on every day of a
+        (first, last) date range. `text` keeps only venues sharing a term with it, ranked by
+        the FTS5 bm25() score.
+        """
+        where, params = self._venue_where(city, area, capacity, budget_min, budget_max, event_type, amenities,
+                                          available)
+        rank_expr, rank_params = scorer.sql("v") if scorer is not None else ("v.rating", [])
+        text_join, join_params = self._text_join("venue_text", "v", text)
+        if text_join:
+            rank_expr, rank_params = "t.score", []
+        params = join_params + params
+        rows = self._query(f"""
+            SELECT v.record, c.name, a.name, c.key, a.key, COUNT(*) OVER () AS total, {rank_expr} AS rank_key, v.id
+            FROM venues v
+            {text_join}
+            JOIN cities c ON c.id = v.city_id
+            JOIN areas a ON a.id = v.area_id
+            {where}
+            ORDER BY rank_key DESC, v.id
+        """, rank_params + params, limit, after)
+
+        venues, keys, total = [], [], 0
+        for record, city_name, area_name, city_key, area_key, total, rating, venue_id in rows:
+            venue = json.loads(record)
+            venue["city"] = city_name
+            venue["area"] = area_name
+            venue["city_key"] = city_key
+            venue["area_key"] = area_key
+            venues.append(venue)
+            keys.append((rating, venue_id))
+        if not venues:
+            total = self.conn.execute(f"SELECT COUNT(*) FROM venues v {text_join} {where}", params).fetchone()[0]
+        return venues, total, keys
+
+    @staticmethod
+    def _text_join(fts_table: str, alias: str, text: Optional[str]) -> Tuple[str, List]:
+        """
+        JOIN restricting rows to the FTS5 matches of free text, exposing each one's score as t.score
+
+        The query ORs the text's terms (sorted, as in BM25Index.scores) so the summed bm25()
+        equals the in-memory index's score. No join when the text has no searchable terms.
+        """
+        terms = sorted(set(text_terms(text))) if text else []
+        if not terms:
+            return "", []
+        match = " OR ".join(f'"{term}"' for term in terms)
+        return (f"JOIN (SELECT rowid AS id, -bm25({fts_table}) AS score FROM {fts_table} "
+                f"WHERE {fts_table} MATCH ?) t ON t.id = {alias}.id"), [match]
+
+    def venue_similarity(self) -> VenueSimilarity:
+        """Venue feature vectors (same features as the in-memory index), rebuilt when the database changes"""
+        version, conn = self._connect()
+        if self._similarity is None or self._similarity[0] != version:
+            rows = conn.execute(
+                "SELECT id, capacity, min_price, max_price, rating, city_id FROM venues ORDER BY id").fetchall()
+            size = rows[-1][0] + 1 if rows else 0
+            columns = [[0] * size for _ in range(5)]
+            for venue_id, *values in rows:
+                for column, value in zip(columns, values):
+                    column[venue_id] = value
+            postings = []
+            for table, key in (("venue_amenities", "amenity"), ("venue_event_types", "event_type")):
+                grouped = {}
+                for value, venue_id in conn.execute(f"SELECT {key}, venue_id FROM {table} ORDER BY venue_id"):
+                    grouped.setdefault(value, []).append(venue_id)
+                postings.append(grouped)
+            self._similarity = (version, VenueSimilarity([row[0] for row in rows], *columns, *postings))
+        return self._similarity[1]
+
+    def find_venue_id(self, name: str) -> Optional[int]:
+        """Id of the venue named `name` (case-insensitive), else of the first whose name contains it"""
+        needle = name.strip().lower()
+        for condition in ("lower(json_extract(record, '$.name')) = ?", "instr(lower(json_extract(record, '$.name')), ?) > 0"):
+            row = self.conn.execute(f"SELECT id FROM venues WHERE {condition} ORDER BY id LIMIT 1", (needle,)).fetchone()
+            if row is not None:
+                return row[0]
+        return None
+
+    def venue_city_id(self, venue_id: int) -> Optional[int]:
+        row = self.conn.execute("SELECT city_id FROM venues WHERE id = ?", (venue_id,)).fetchone()
+        return None if row is None else row[0]
+
+    def venues_by_id(self, venue_ids: List[int]) -> List[Dict]:
+        """Venue rows (search_venues format) for ids, in the given order"""
+        if not venue_ids:
+            return []
+        rows = self.conn.execute(f"""
+            SELECT v.id, v.record, c.name, a.name, c.key, a.key
+            FROM venues v JOIN cities c ON c.id = v.city_id JOIN areas a ON a.id = v.area_id
+            WHERE v.id IN ({", ".join("?" * len(venue_ids))})
+        """, list(venue_ids))
+        venues = {}
+        for venue_id, record, city_name, area_name, city_key, area_key in rows:
+            venue = json.loads(record)
+            venue["city"] = city_name
+            venue["area"] = area_name
+            venue["city_key"] = city_key
+            venue["area_key"] = area_key
+            venues[venue_id] = venue
+        return [venues[i] for i in venue_ids if i in venues]
+
+    def search_vendors(self,
+                       city: str = None,
+                       area: str = None,
+                       vendor_type: str = None,
+                       budget_min: int = None,
+                       budget_max: int = None,
+                       speciality: str = None,
+                       limit: int = None,
+                       after: Tuple[float, int] = None,
+                       text: str = None) -> Tuple[List[Dict], int, List[Tuple[float, int]]]:
+        """Vendor search with EventSearchEngine.search_vendors semantics; returns like search_venues"""
+        where, params = self._vendor_where(city, area, vendor_type, budget_min, budget_max, speciality)
+        text_join, join_params = self._text_join("vendor_text", "d", text)
+        rank_expr = "t.score" if text_join else "d.rating"
+        params = join_params + params
+        rows = self._query(f"""
+            SELECT d.record, c.name, a.name, c.key, a.key, d.vendor_type, COUNT(*) OVER () AS total, {rank_expr} AS rank_key, d.id
+            FROM vendors d
+            {text_join}
+            JOIN cities c ON c.id = d.city_id
+            JOIN areas a ON a.id = d.area_id
+            {where}
+            ORDER BY rank_key DESC, d.id
+        """, params, limit, after)
+
+        vendors, keys, total = [], [], 0
+        for record, city_name, area_name, city_key, area_key, vtype, total, rating, vendor_id in rows:
+            vendor = json.loads(record)
+            vendor["city"] = city_name
+            vendor["area"] = area_name
+            vendor["city_key"] = city_key
+            vendor["area_key"] = area_key
+            vendor["vendor_type"] = vtype
+            vendors.append(vendor)
+            keys.append((rating, vendor_id))
+        if not vendors:
+            total = self.conn.execute(f"SELECT COUNT(*) FROM vendors d {text_join} {where}", params).fetchone()[0]
+        return vendors, total, keys
+
+    def _area_counts(self, table: str, alias: str, where: str, params: List) -> List[Dict]:
+        """Area facet entries (catalog_facets format), most matches first"""
+        rows = self.conn.execute(f"""
+            SELECT a.key, a.name, c.key, COUNT(*) AS n
+            FROM {table} {alias} JOIN areas a ON a.id = {alias}.area_id JOIN cities c ON c.id = a.city_id
+            {where}
+            GROUP BY a.id ORDER BY n DESC, a.id
+        """, params)
+        return [{"area": key, "area_name": name, "city": city_key, "count": n} for key, name, city_key, n in rows]
+
+    def _bucket_counts(self, table: str, alias: str, column: str, edges: List[int], where: str,
+                       params: List) -> Dict[int, int]:
+        """{bucket number: matches} for a bucketed column"""
+        bucket = bucket_case(f"{alias}.{column}", edges)
+        return dict(self.conn.execute(f"SELECT {bucket} AS bucket, COUNT(*) FROM {table} {alias} {where} GROUP BY bucket",
+                                      params).fetchall())
+
+    def venue_facets(self, city: str = None, area: str = None, capacity: int = None, budget_min: int = None,
+                     budget_max: int = None, event_type: str = None, amenities: List[str] = None) -> Dict:
+        """Facet counts of the venues matching search_venues filters (catalog_facets.venue_facets format)"""
+        where, params = self._venue_where(city, area, capacity, budget_min, budget_max, event_type, amenities)
+        return {
+            "total": self.conn.execute(f"SELECT COUNT(*) FROM venues v {where}", params).fetchone()[0],
+            "areas": self._area_counts("venues", "v", where, params),
+            "price_ranges": bucket_counts(VENUE_PRICE_BUCKETS, self._bucket_counts(
+                "venues", "v", "min_price", VENUE_PRICE_EDGES, where, params)),
+            "capacity_ranges": bucket_counts(CAPACITY_BUCKETS, self._bucket_counts(
+                "venues", "v", "capacity", CAPACITY_EDGES, where, params))
+        }
+
+    def vendor_facets(self, city: str = None, area: str = None, vendor_type: str = None, budget_min: int = None,
+                      budget_max: int = None, speciality: str = None) -> Dict:
+        """Facet counts of the vendors matching search_vendors filters (catalog_facets.vendor_facets format)"""
+        where, params = self._vendor_where(city, area, vendor_type, budget_min, budget_max, speciality)
+        type_rows = self.conn.execute(f"""
+            SELECT d.vendor_type, COUNT(*) AS n FROM vendors d {where}
+            GROUP BY d.vendor_type ORDER BY n DESC, d.vendor_type
+        """, params)
+        return {
+            "total": self.conn.execute(f"SELECT COUNT(*) FROM vendors d {where}", params).fetchone()[0],
+            "areas": self._area_counts("vendors", "d", where, params),
+            "price_ranges": bucket_counts(VENDOR_PRICE_BUCKETS, self._bucket_counts(
+                "vendors", "d", "min_price", VENDOR_PRICE_EDGES, where, params)),
+            "vendor_types": dict(type_rows.fetchall())
+        }
+
+    def venue_coverage(self, capacity: int = None, budget_min: int = None,
+                       budget_max: int = None) -> Dict[str, Dict[str, int]]:
+        """{city_key: {event_type: venue_count}} for venues passing the capacity/budget filters"""
+        clauses, params = [], []
+        if capacity:
+            clauses.append("v.capacity >= ?")
+            params.append(capacity)
+        if budget_min:
+            clauses.append("v.max_price >= ?")
+            params.append(budget_min)
+        if budget_max:
+            clauses.append("v.min_price <= ?")
+            params.append(budget_max)
+
+        coverage = {city_key: {} for city_key in self.get_city_keys()}
+        sql = f"""
+            SELECT c.key, e.event_type, COUNT(*)
+            FROM venues v
+            JOIN venue_event_types e ON e.venue_id = v.id
+            JOIN cities c ON c.id = v.city_id
+            {"WHERE " + " AND ".join(clauses) if clauses else ""}
+            GROUP BY c.key, e.event_type
+        """
+        for city_key, event_type, count in self.conn.execute(sql, params):
+            coverage[city_key][event_type] = count
+        return coverage
+
+    def get_city_keys(self) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT key FROM cities ORDER BY id")]
+
+    def get_city_areas(self, city: str) -> List[str]:
+        city_id = self.location_resolver().city_id(city)
+        if city_id is None:
+            return []
+        return [row[0] for row in self.conn.execute("SELECT key FROM areas WHERE city_id = ? ORDER BY id", (city_id,))]
+
+    def get_all_cities(self) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT name FROM cities ORDER BY id")]
+
+    def get_vendor_categories(self) -> List[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'vendor_categories'").fetchone()
+        return json.loads(row[0]) if row else []
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python catalog_sqlite.py <event_data.json> <catalog.db>")
+        sys.exit(1)
+
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        compiled = CatalogIndex(json.load(f))
+    build_sqlite_catalog(compiled, sys.argv[2])
+    print(f"✅ Wrote {sys.argv[2]}: {len(compiled.venue_records)} venues, {len(compiled.vendor_records)} vendors")
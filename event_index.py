@@ -0,0 +1,938 @@
+"""
+Compiled Catalog Index
+Flattens event_data.json into typed parallel arrays so venue/vendor searches never walk the nested dicts
+"""
+
+import itertools
+import re
+from array import array
+from datetime import date
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Mapping
+from typing import List, Dict, Iterable, Optional, Set, Tuple
+
+from catalog_facets import FacetBitmaps
+from location_resolver import LocationResolver
+from text_index import CatalogTextIndex
+from venue_availability import AvailabilityCalendar
+from venue_similarity import VenueSimilarity
+from venue_ranking import capacity_inverse, price_span_inverse, rating_prior
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Every compiled index (and every later change to one) gets a new catalog version
+_catalog_versions = itertools.count(1)
+
+def extract_price_range(price_str: str) -> Tuple[int, int]:
+    """Extract min and max price from price range string"""
+    if not price_str:
+        return (0, 0)
+
+    # Remove currency symbols and commas
+    clean_str = re.sub(r'[₹,]', '', price_str)
+
+    # Find numbers
+    numbers = re.findall(r'\d+', clean_str)
+
+    if len(numbers) >= 2:
+        return (int(numbers[0]), int(numbers[1]))
+    elif len(numbers) == 1:
+        num = int(numbers[0])
+        return (num, num)
+    else:
+        return (0, 0)
+
+def tokenize(text: str) -> List[str]:
+    """Split free text into lowercase alphanumeric tokens"""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+def _contains(sorted_ids: List[int], item: int) -> bool:
+    """Membership test on an ascending id list"""
+    pos = bisect_left(sorted_ids, item)
+    return pos < len(sorted_ids) and sorted_ids[pos] == item
+
+def intersect_postings(postings: List[List[int]]) -> List[int]:
+    """
+    Intersect ascending id lists
+
+    Starts from the shortest list and probes the others with binary search, so the cost
+    is proportional to the smallest posting list rather than to the catalog size.
+    """
+    if not postings:
+        return []
+
+    ordered = sorted(postings, key=len)
+    result = ordered[0]
+    for other in ordered[1:]:
+        if not result:
+            break
+        result = [item for item in result if _contains(other, item)]
+    return list(result)
+
+def _with_id(sorted_ids: List[int], item: int) -> List[int]:
+    """Copy of an ascending id list with an id added (the list itself if already present)"""
+    if _contains(sorted_ids, item):
+        return sorted_ids
+    ids = list(sorted_ids)
+    insort(ids, item)
+    return ids
+
+def _without_id(sorted_ids: List[int], item: int) -> List[int]:
+    """Copy of an ascending id list with an id dropped (the list itself if absent)"""
+    pos = bisect_left(sorted_ids, item)
+    if pos < len(sorted_ids) and sorted_ids[pos] == item:
+        return sorted_ids[:pos] + sorted_ids[pos + 1:]
+    return sorted_ids
+
+def _repost(postings: Dict[str, List[int]], record_id: int, old_keys: Set[str], new_keys: Set[str]):
+    """Move a record between posting lists, swapping in a fresh copy of each list it joins or leaves"""
+    for key in old_keys - new_keys:
+        if key in postings:
+            postings[key] = _without_id(postings[key], record_id)
+    for key in new_keys - old_keys:
+        postings[key] = _with_id(postings.get(key, []), record_id)
+
+def union_postings(postings: Iterable[List[int]]) -> List[int]:
+    """Merge id lists into one ascending list without duplicates"""
+    merged = set()
+    for posting in postings:
+        merged.update(posting)
+    return sorted(merged)
+
+class SortedColumnIndex:
+    """Venue ids ordered by one numeric column, answering range predicates with bisect"""
+
+    __slots__ = ("keys", "ids")
+
+    def __init__(self, column, venue_ids: Iterable[int]):
+        pairs = sorted((column[i], i) for i in venue_ids)
+        self.keys = [key for key, _ in pairs]
+        self.ids = [venue_id for _, venue_id in pairs]
+
+    def copy(self) -> "SortedColumnIndex":
+        clone = SortedColumnIndex.__new__(SortedColumnIndex)
+        clone.keys = list(self.keys)
+        clone.ids = list(self.ids)
+        return clone
+
+    def count_at_least(self, low) -> int:
+        return len(self.keys) - bisect_left(self.keys, low)
+
+    def count_at_most(self, high) -> int:
+        return bisect_right(self.keys, high)
+
+    def at_least(self, low) -> List[int]:
+        return self.ids[bisect_left(self.keys, low):]
+
+    def at_most(self, high) -> List[int]:
+        return self.ids[:bisect_right(self.keys, high)]
+
+    def _position(self, key, venue_id: int) -> int:
+        """Slot of (key, venue_id) in the (key, id) order"""
+        low = bisect_left(self.keys, key)
+        high = bisect_right(self.keys, key, low)
+        return bisect_left(self.ids, venue_id, low, high)
+
+    # insert/remove edit keys and ids one after the other; only call them on a private copy
+    def insert(self, key, venue_id: int):
+        pos = self._position(key, venue_id)
+        self.keys.insert(pos, key)
+        self.ids.insert(pos, venue_id)
+
+    def remove(self, key, venue_id: int):
+        pos = self._position(key, venue_id)
+        if pos < len(self.ids) and self.ids[pos] == venue_id and self.keys[pos] == key:
+            del self.keys[pos]
+            del self.ids[pos]
+
+class VenueScopeIndex:
+    """
+    Sorted capacity and price-interval indexes for the venues of one city, area or the whole catalog
+
+    A venue's [min_price, max_price] overlaps a budget window [low, high] when min_price <= high
+    and max_price >= low. Each side is a prefix/suffix of one sorted array, so the smaller side
+    can be found in O(log n) and returned as the candidate set.
+    """
+
+    __slots__ = ("size", "capacity", "min_price", "max_price")
+
+    def __init__(self, index: "CatalogIndex", venue_ids: List[int]):
+        self.size = len(venue_ids)
+        self.capacity = SortedColumnIndex(index.venue_capacity, venue_ids)
+        self.min_price = SortedColumnIndex(index.venue_min_price, venue_ids)
+        self.max_price = SortedColumnIndex(index.venue_max_price, venue_ids)
+
+    def copy(self) -> "VenueScopeIndex":
+        """Independent copy to patch while readers keep using this one"""
+        clone = VenueScopeIndex.__new__(VenueScopeIndex)
+        clone.size = self.size
+        clone.capacity = self.capacity.copy()
+        clone.min_price = self.min_price.copy()
+        clone.max_price = self.max_price.copy()
+        return clone
+
+    def add(self, index: "CatalogIndex", venue_id: int):
+        """Insert a venue using its current column values"""
+        self.size += 1
+        self.capacity.insert(index.venue_capacity[venue_id], venue_id)
+        self.min_price.insert(index.venue_min_price[venue_id], venue_id)
+        self.max_price.insert(index.venue_max_price[venue_id], venue_id)
+
+    def remove(self, index: "CatalogIndex", venue_id: int):
+        """Remove a venue; call before its column values change"""
+        self.size -= 1
+        self.capacity.remove(index.venue_capacity[venue_id], venue_id)
+        self.min_price.remove(index.venue_min_price[venue_id], venue_id)
+        self.max_price.remove(index.venue_max_price[venue_id], venue_id)
+
+    def capacity_count(self, capacity: int) -> int:
+        """Number of venues holding at least `capacity` guests"""
+        return self.capacity.count_at_least(capacity)
+
+    def capacity_ids(self, capacity: int) -> List[int]:
+        """Venues holding at least `capacity` guests"""
+        return self.capacity.at_least(capacity)
+
+    def price_count(self, budget_min: Optional[int], budget_max: Optional[int]) -> int:
+        """Size of the cheaper side of the price-overlap predicate"""
+        count = self.size
+        if budget_max:
+            count = min(count, self.min_price.count_at_most(budget_max))
+        if budget_min:
+            count = min(count, self.max_price.count_at_least(budget_min))
+        return count
+
+    def price_ids(self, budget_min: Optional[int], budget_max: Optional[int]) -> List[int]:
+        """Venues on the cheaper side of the price-overlap predicate (the other side is left to the caller)"""
+        max_side = self.min_price.count_at_most(budget_max) if budget_max else self.size
+        min_side = self.max_price.count_at_least(budget_min) if budget_min else self.size
+        if budget_max and max_side <= min_side:
+            return self.min_price.at_most(budget_max)
+        return self.max_price.at_least(budget_min)
+
+class VendorPriceIndex:
+    """Sorted min/max price indexes over the live vendors (the price half of a VenueScopeIndex)"""
+
+    __slots__ = ("min_price", "max_price")
+
+    def __init__(self, index: "CatalogIndex", vendor_ids: Iterable[int]):
+        vendor_ids = list(vendor_ids)
+        self.min_price = SortedColumnIndex(index.vendor_min_price, vendor_ids)
+        self.max_price = SortedColumnIndex(index.vendor_max_price, vendor_ids)
+
+    def copy(self) -> "VendorPriceIndex":
+        """Independent copy to patch while readers keep using this one"""
+        clone = VendorPriceIndex.__new__(VendorPriceIndex)
+        clone.min_price = self.min_price.copy()
+        clone.max_price = self.max_price.copy()
+        return clone
+
+    def add(self, index: "CatalogIndex", vendor_id: int):
+        """Insert a vendor using its current column values"""
+        self.min_price.insert(index.vendor_min_price[vendor_id], vendor_id)
+        self.max_price.insert(index.vendor_max_price[vendor_id], vendor_id)
+
+    def remove(self, index: "CatalogIndex", vendor_id: int):
+        """Remove a vendor; call before its column values change"""
+        self.min_price.remove(index.vendor_min_price[vendor_id], vendor_id)
+        self.max_price.remove(index.vendor_max_price[vendor_id], vendor_id)
+
+class NumpyColumns:
+    """
+    NumPy views of the catalog columns for whole-catalog boolean-mask evaluation
+
+    Over a read-only index (snapshot file or shared memory) the arrays are zero-copy, read-only
+    views of the buffer, so every process shares one copy. The columns of a mutable index are
+    copied instead: array.array cannot grow while NumPy holds its buffer.
+
+    Event-type bitmasks are split into 64-bit words (one column per word) so the vocabulary
+    can grow past 64 event types.
+    """
+
+    def __init__(self, index: "CatalogIndex"):
+        zero_copy = index.read_only
+
+        def column(values, dtype):
+            if zero_copy and isinstance(values, memoryview) and values.itemsize == np.dtype(dtype).itemsize:
+                return np.frombuffer(values, dtype=dtype)
+            return np.array(values, dtype=dtype)
+
+        self.venue_count = len(index.venue_records)
+        self.venue_city = column(index.venue_city, np.int32)
+        self.venue_area = column(index.venue_area, np.int32)
+        self.venue_capacity = column(index.venue_capacity, np.int64)
+        self.venue_min_price = column(index.venue_min_price, np.int64)
+        self.venue_max_price = column(index.venue_max_price, np.int64)
+        self.venue_rating = column(index.venue_rating, np.float64)
+        self.venue_rank_prior = column(index.venue_rank_prior, np.float64)
+        self.venue_capacity_inv = column(index.venue_capacity_inv, np.float64)
+        self.venue_price_span_inv = column(index.venue_price_span_inv, np.float64)
+        self.venue_live = np.ones(self.venue_count, dtype=bool)
+        self.venue_live[list(index.retired_venues)] = False
+
+        word_count = max(1, (len(index.event_type_bits) + 63) // 64)
+        words = getattr(index.venue_event_mask, "words", None)
+        if zero_copy and isinstance(words, memoryview) and index.venue_event_mask.word_count >= word_count:
+            self.venue_event_words = np.frombuffer(words, dtype=np.uint64).reshape(
+                self.venue_count, index.venue_event_mask.word_count)
+        else:
+            self.venue_event_words = np.zeros((self.venue_count, word_count), dtype=np.uint64)
+            for venue_id, mask in enumerate(index.venue_event_mask):
+                word = 0
+                while mask:
+                    self.venue_event_words[venue_id, word] = mask & 0xFFFFFFFFFFFFFFFF
+                    mask >>= 64
+                    word += 1
+
+        self.vendor_count = len(index.vendor_records)
+        self.vendor_city = column(index.vendor_city, np.int32)
+        self.vendor_area = column(index.vendor_area, np.int32)
+        self.vendor_type = column(index.vendor_type, np.int32)
+        self.vendor_min_price = column(index.vendor_min_price, np.int64)
+        self.vendor_max_price = column(index.vendor_max_price, np.int64)
+        self.vendor_rating = column(index.vendor_rating, np.float64)
+        self.vendor_live = np.ones(self.vendor_count, dtype=bool)
+        self.vendor_live[list(index.retired_vendors)] = False
+
+    def event_type_column(self, bit: int):
+        """Boolean column: venue is suitable for the event type at `bit`"""
+        word, offset = divmod(bit, 64)
+        return ((self.venue_event_words[:, word] >> np.uint64(offset)) & np.uint64(1)).astype(bool)
+
+    @staticmethod
+    def posting_mask(posting: List[int], size: int):
+        """Boolean column with True at every id of a posting list"""
+        mask = np.zeros(size, dtype=bool)
+        mask[np.asarray(posting, dtype=np.int64)] = True
+        return mask
+
+class ResultView(Mapping):
+    """
+    Read-only search result that references the catalog record instead of copying it
+
+    Behaves like the dict search results used to be (indexing, get, iteration, ==), with the
+    location keys computed from the index columns on access. Call dict(view) or
+    view.to_dict() to serialize at the API/tool edge.
+    """
+
+    __slots__ = ("_index", "_id", "_record")
+    EXTRA_KEYS: Tuple[str, ...] = ()
+
+    def __init__(self, index: "CatalogIndex", record_id: int, record: Dict):
+        self._index = index
+        self._id = record_id
+        self._record = record
+
+    def _extra(self, key: str):
+        raise NotImplementedError
+
+    def __getitem__(self, key: str):
+        if key in self.EXTRA_KEYS:
+            return self._extra(key)
+        return self._record[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.EXTRA_KEYS or key in self._record
+
+    def __iter__(self):
+        yield from self._record
+        for key in self.EXTRA_KEYS:
+            if key not in self._record:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._record) + sum(1 for key in self.EXTRA_KEYS if key not in self._record)
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict:
+        """Plain dict of the result, optionally restricted to `fields` (missing fields are skipped)"""
+        if fields is None:
+            return dict(self)
+        return {key: self[key] for key in fields if key in self}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+class VenueView(ResultView):
+    """Venue search result: the catalog record plus city, area, city_key and area_key"""
+
+    __slots__ = ()
+    EXTRA_KEYS = ("city", "area", "city_key", "area_key")
+
+    def _extra(self, key: str):
+        index = self._index
+        if key == "city":
+            return index.city_names[index.venue_city[self._id]]
+        if key == "area":
+            return index.area_names[index.venue_area[self._id]]
+        if key == "city_key":
+            return index.city_keys[index.venue_city[self._id]]
+        return index.area_keys[index.venue_area[self._id]]
+
+class VendorView(ResultView):
+    """Vendor search result: the catalog record plus location keys and vendor_type"""
+
+    __slots__ = ()
+    EXTRA_KEYS = ("city", "area", "city_key", "area_key", "vendor_type")
+
+    def _extra(self, key: str):
+        index = self._index
+        if key == "city":
+            return index.city_names[index.vendor_city[self._id]]
+        if key == "area":
+            return index.area_names[index.vendor_area[self._id]]
+        if key == "city_key":
+            return index.city_keys[index.vendor_city[self._id]]
+        if key == "area_key":
+            return index.area_keys[index.vendor_area[self._id]]
+        return index.vendor_type_keys[index.vendor_type[self._id]]
+
+class CatalogIndex:
+    """
+    Columnar view of the event catalog
+
+    Venues and vendors get integer ids in catalog order (city → area → record), and every
+    filterable attribute lives in a parallel array indexed by that id. Price strings are parsed
+    once here instead of on every query.
+
+    add_*/update_*/retire_* change single records without locking readers out: a posting list or
+    range index a record joins or leaves is copied, patched and swapped in with one assignment,
+    so a reader already walking the old list never sees it half-edited. The record's own column
+    slots (venue_records, venue_capacity, venue_event_mask, ...) are overwritten in place, one
+    column at a time, so a query racing an update can see that one record half-changed; reload
+    a snapshot instead when readers need the catalog to move as a whole. New records get the
+    highest id and are appended, which leaves earlier positions alone. Callers serialize the
+    writers.
+    """
+
+    read_only = False
+
+    def __init__(self, data: Dict):
+        """Compile the nested cities → areas → venues/vendors dict into flat columns"""
+        self.version = next(_catalog_versions)
+        self.vendor_categories: List[str] = list(data.get("vendor_categories", []))
+
+        # Location tables
+        self.city_keys: List[str] = []
+        self.city_names: List[str] = []
+        self.city_ids: Dict[str, int] = {}
+        self.city_areas: List[List[int]] = []
+        self.area_keys: List[str] = []
+        self.area_names: List[str] = []
+        self.area_city = array('i')
+        self.area_ids: Dict[str, List[int]] = {}  # area key -> area ids (same key may exist in several cities)
+
+        # Categorical vocabularies
+        self.event_type_bits: Dict[str, int] = {}
+        self.vendor_type_keys: List[str] = []
+        self.vendor_type_ids: Dict[str, int] = {}
+
+        # Venue columns
+        self.venue_records: List[Dict] = []
+        self.venue_city = array('i')
+        self.venue_area = array('i')
+        self.venue_capacity = array('q')
+        self.venue_min_price = array('q')
+        self.venue_max_price = array('q')
+        self.venue_rating = array('d')
+        self.venue_event_mask: List[int] = []
+        # Query-independent ranking factors (see venue_ranking.py)
+        self.venue_rank_prior = array('d')
+        self.venue_capacity_inv = array('d')
+        self.venue_price_span_inv = array('d')
+
+        # Vendor columns
+        self.vendor_records: List[Dict] = []
+        self.vendor_city = array('i')
+        self.vendor_area = array('i')
+        self.vendor_type = array('i')
+        self.vendor_min_price = array('q')
+        self.vendor_max_price = array('q')
+        self.vendor_rating = array('d')
+        self.vendor_speciality: List[str] = []
+
+        self.venue_amenities: List[frozenset] = []
+
+        # Per-area id lists, in catalog order
+        self.area_venues: List[List[int]] = []
+        self.area_vendors: List[Dict[int, List[int]]] = []
+
+        # Inverted posting lists (ascending ids)
+        self.venues_by_event_type: Dict[str, List[int]] = {}
+        self.venues_by_amenity: Dict[str, List[int]] = {}
+        self.vendors_by_speciality_token: Dict[str, List[int]] = {}
+        self._speciality_token_cache: Dict[str, List[int]] = {}
+
+        # Sorted capacity/price indexes, built per location scope on first use
+        self._venue_scopes: Dict[Tuple[str, int], VenueScopeIndex] = {}
+        self._vendor_prices: Optional[VendorPriceIndex] = None
+        self._numpy_columns: Optional[NumpyColumns] = None
+        self._facet_bitmaps: Optional[FacetBitmaps] = None
+        self._location_resolver: Optional[LocationResolver] = None
+        self._venue_similarity: Optional[VenueSimilarity] = None
+        self._text_index: Optional[CatalogTextIndex] = None
+        self._availability: Optional[AvailabilityCalendar] = None  # patched in place by venue changes
+
+        # Retired records keep their id (and column slots) but leave every list and posting
+        self.retired_venues = set()
+        self.retired_vendors = set()
+
+        for city_key, city_data in data.get("cities", {}).items():
+            self._add_city(city_key, city_data)
+
+    def _add_city(self, city_key: str, city_data: Dict):
+        """Append one city and all of its areas to the index"""
+        city_id = len(self.city_keys)
+        self.city_keys.append(city_key)
+        self.city_names.append(city_data.get("name", city_key))
+        self.city_ids[city_key] = city_id
+        self.city_areas.append([])
+
+        for area_key, area_data in city_data.get("areas", {}).items():
+            area_id = self._add_area(city_id, area_key, area_data.get("name", area_key))
+
+            for venue in area_data.get("venues", []):
+                self._add_venue(city_id, area_id, venue)
+
+            for vtype, vendors in area_data.get("vendors", {}).items():
+                for vendor in vendors:
+                    self._add_vendor(city_id, area_id, vtype, vendor)
+
+    def _add_area(self, city_id: int, area_key: str, area_name: str) -> int:
+        """Append an empty area to a city and return its id"""
+        area_id = len(self.area_keys)
+        self.area_keys.append(area_key)
+        self.area_names.append(area_name)
+        self.area_city.append(city_id)
+        self.area_ids.setdefault(area_key, []).append(area_id)
+        self.city_areas[city_id].append(area_id)
+        self.area_venues.append([])
+        self.area_vendors.append({})
+        return area_id
+
+    def _add_venue(self, city_id: int, area_id: int, venue: Dict) -> int:
+        """Append a venue record to the venue columns and return its id"""
+        venue_id = len(self.venue_records)
+        min_price, max_price = extract_price_range(venue.get("price_range", ""))
+
+        self.venue_records.append(venue)
+        self.venue_city.append(city_id)
+        self.venue_area.append(area_id)
+        self.venue_capacity.append(int(venue.get("capacity", 0) or 0))
+        self.venue_min_price.append(min_price)
+        self.venue_max_price.append(max_price)
+        self.venue_rating.append(float(venue.get("rating", 0) or 0))
+        self.venue_event_mask.append(self._event_mask_for(venue.get("suitable_for", []), create=True))
+        self.venue_rank_prior.append(rating_prior(self.venue_rating[venue_id]))
+        self.venue_capacity_inv.append(capacity_inverse(self.venue_capacity[venue_id]))
+        self.venue_price_span_inv.append(price_span_inverse(min_price, max_price))
+        self.area_venues[area_id].append(venue_id)
+
+        for event_type in set(venue.get("suitable_for", [])):
+            self.venues_by_event_type.setdefault(event_type, []).append(venue_id)
+
+        amenities = frozenset(a.strip().lower() for a in venue.get("amenities", []))
+        self.venue_amenities.append(amenities)
+        for amenity in amenities:
+            self.venues_by_amenity.setdefault(amenity, []).append(venue_id)
+        return venue_id
+
+    def _add_vendor(self, city_id: int, area_id: int, vtype: str, vendor: Dict) -> int:
+        """Append a vendor record to the vendor columns and return its id"""
+        vendor_id = len(self.vendor_records)
+        min_price, max_price = extract_price_range(vendor.get("price_range", ""))
+
+        type_id = self.vendor_type_ids.get(vtype)
+        if type_id is None:
+            type_id = len(self.vendor_type_keys)
+            self.vendor_type_keys.append(vtype)
+            self.vendor_type_ids[vtype] = type_id
+
+        self.vendor_records.append(vendor)
+        self.vendor_city.append(city_id)
+        self.vendor_area.append(area_id)
+        self.vendor_type.append(type_id)
+        self.vendor_min_price.append(min_price)
+        self.vendor_max_price.append(max_price)
+        self.vendor_rating.append(float(vendor.get("rating", 0) or 0))
+        self.vendor_speciality.append((vendor.get("speciality", "") or "").lower())
+        self.area_vendors[area_id].setdefault(type_id, []).append(vendor_id)
+
+        for token in set(tokenize(vendor.get("speciality", ""))):
+            self.vendors_by_speciality_token.setdefault(token, []).append(vendor_id)
+        self._speciality_token_cache.clear()
+        return vendor_id
+
+    def _event_mask_for(self, event_types: List[str], create: bool = False) -> int:
+        """Build the event-type bitmask for a list of event type names"""
+        mask = 0
+        for event_type in event_types:
+            bit = self.event_type_bits.get(event_type)
+            if bit is None:
+                if not create:
+                    continue
+                bit = len(self.event_type_bits)
+                self.event_type_bits[event_type] = bit
+            mask |= 1 << bit
+        return mask
+
+    def _location(self, city_key: str, area_key: str, city_name: str = None, area_name: str = None) -> Tuple[int, int]:
+        """City and area ids for a location, creating either one if it is new"""
+        city_id = self.city_ids.get(city_key)
+        if city_id is None:
+            self._add_city(city_key, {"name": city_name or city_key.replace("_", " ").title()})
+            city_id = self.city_ids[city_key]
+            if self._location_resolver is not None:
+                self._location_resolver.add_city(city_id, city_key, self.city_names[city_id])
+        for area_id in self.city_areas[city_id]:
+            if self.area_keys[area_id] == area_key:
+                return city_id, area_id
+        area_id = self._add_area(city_id, area_key, area_name or area_key.replace("_", " ").title())
+        if self._location_resolver is not None:
+            self._location_resolver.add_area(area_id, area_key, self.area_names[area_id], city_id)
+        return city_id, area_id
+
+    def _changed(self):
+        """Give the catalog a new version and drop caches derived from whole columns"""
+        self.version = next(_catalog_versions)
+        self._numpy_columns = None
+        self._speciality_token_cache.clear()
+
+    def _scope_copies(self, venue_id: int) -> Dict[Tuple[str, int], VenueScopeIndex]:
+        """Private copies of the already-built range indexes whose scope contains the venue"""
+        scope_keys = (("all", 0), ("city", self.venue_city[venue_id]), ("area", self.venue_area[venue_id]))
+        return {key: self._venue_scopes[key].copy() for key in scope_keys if key in self._venue_scopes}
+
+    def _set_similarity_row(self, venue_id: int):
+        """Patch the built similarity vectors for an added/updated venue, or drop them if they cannot take it"""
+        if self._venue_similarity is not None and not self._venue_similarity.set_venue(self, venue_id):
+            self._venue_similarity = None
+
+    def _check_live(self, kind: str, record_id: int):
+        records, retired = ((self.venue_records, self.retired_venues) if kind == "venue"
+                            else (self.vendor_records, self.retired_vendors))
+        if not 0 <= record_id < len(records) or record_id in retired:
+            raise KeyError(f"No active {kind} with id {record_id}")
+
+    def add_venue(self, city_key: str, area_key: str, venue: Dict,
+                  city_name: str = None, area_name: str = None) -> int:
+        """Index a new venue in place and return its id"""
+        city_id, area_id = self._location(city_key, area_key, city_name, area_name)
+        venue_id = self._add_venue(city_id, area_id, venue)
+        scopes = self._scope_copies(venue_id)
+        for scope in scopes.values():
+            scope.add(self, venue_id)
+        self._venue_scopes.update(scopes)
+        if self._facet_bitmaps is not None:
+            self._facet_bitmaps.add_venue(self, venue_id)
+        if self._availability is not None:
+            self._availability.set_venue(venue_id, venue)
+        if self._text_index is not None:
+            self._text_index.set_venue(venue_id, None, venue)
+        self._set_similarity_row(venue_id)
+        self._changed()
+        return venue_id
+
+    def update_venue(self, venue_id: int, venue: Dict):
+        """Replace a venue record, moving it between capacity/price/event-type/amenity entries"""
+        self._check_live("venue", venue_id)
+        old_record = self.venue_records[venue_id]
+        old_event_types = set(old_record.get("suitable_for", []))
+        old_amenities = self.venue_amenities[venue_id]
+        scopes = self._scope_copies(venue_id)
+        for scope in scopes.values():
+            scope.remove(self, venue_id)
+        if self._facet_bitmaps is not None:
+            self._facet_bitmaps.remove_venue(self, venue_id)
+
+        min_price, max_price = extract_price_range(venue.get("price_range", ""))
+        self.venue_records[venue_id] = venue
+        self.venue_capacity[venue_id] = int(venue.get("capacity", 0) or 0)
+        self.venue_min_price[venue_id] = min_price
+        self.venue_max_price[venue_id] = max_price
+        self.venue_rating[venue_id] = float(venue.get("rating", 0) or 0)
+        self.venue_event_mask[venue_id] = self._event_mask_for(venue.get("suitable_for", []), create=True)
+        self.venue_rank_prior[venue_id] = rating_prior(self.venue_rating[venue_id])
+        self.venue_capacity_inv[venue_id] = capacity_inverse(self.venue_capacity[venue_id])
+        self.venue_price_span_inv[venue_id] = price_span_inverse(min_price, max_price)
+        self.venue_amenities[venue_id] = frozenset(a.strip().lower() for a in venue.get("amenities", []))
+
+        _repost(self.venues_by_event_type, venue_id, old_event_types, set(venue.get("suitable_for", [])))
+        _repost(self.venues_by_amenity, venue_id, set(old_amenities), set(self.venue_amenities[venue_id]))
+        for scope in scopes.values():
+            scope.add(self, venue_id)
+        self._venue_scopes.update(scopes)
+        if self._facet_bitmaps is not None:
+            self._facet_bitmaps.add_venue(self, venue_id)
+        if self._availability is not None:
+            self._availability.set_venue(venue_id, venue)
+        if self._text_index is not None:
+            self._text_index.set_venue(venue_id, old_record, venue)
+        self._set_similarity_row(venue_id)
+        self._changed()
+
+    def retire_venue(self, venue_id: int):
+        """Take a venue out of every index; its id is never reused"""
+        self._check_live("venue", venue_id)
+        scopes = self._scope_copies(venue_id)
+        for scope in scopes.values():
+            scope.remove(self, venue_id)
+        self._venue_scopes.update(scopes)
+        _repost(self.venues_by_event_type, venue_id, set(self.venue_records[venue_id].get("suitable_for", [])), set())
+        _repost(self.venues_by_amenity, venue_id, set(self.venue_amenities[venue_id]), set())
+        area_id = self.venue_area[venue_id]
+        self.area_venues[area_id] = _without_id(self.area_venues[area_id], venue_id)
+        self.retired_venues.add(venue_id)
+        if self._facet_bitmaps is not None:
+            self._facet_bitmaps.remove_venue(self, venue_id)
+        if self._availability is not None:
+            self._availability.set_venue(venue_id, None)
+        if self._venue_similarity is not None:
+            self._venue_similarity.remove_venue(venue_id)
+        if self._text_index is not None:
+            self._text_index.set_venue(venue_id, self.venue_records[venue_id], None)
+        self._changed()
+
+    def add_vendor(self, city_key: str, area_key: str, vendor_type: str, vendor: Dict,
+                   city_name: str = None, area_name: str = None) -> int:
+        """Index a new vendor in place and return its id"""
+        city_id, area_id = self._location(city_key, area_key, city_name, area_name)
+        vendor_id = self._add_vendor(city_id, area_id, vendor_type, vendor)
+        if self._vendor_prices is not None:
+            prices = self._vendor_prices.copy()
+            prices.add(self, vendor_id)
+            self._vendor_prices = prices
+        if self._facet_bitmaps is not None:
+            self._facet_bitmaps.add_vendor(self, vendor_id)
+        if self._text_index is not None:
+            self._text_index.set_vendor(vendor_id, None, vendor)
+        self._changed()
+        return vendor_id
+
+    def update_vendor(self, vendor_id: int, vendor: Dict):
+        """Replace a vendor record (price, rating, speciality, ...) in place"""
+        self._check_live("vendor", vendor_id)
+        old_record = self.vendor_records[vendor_id]
+        old_tokens = set(tokenize(old_record.get("speciality", "")))
+        prices = self._vendor_prices.copy() if self._vendor_prices is not None else None
+        if prices is not None:
+            prices.remove(self, vendor_id)
+        if self._facet_bitmaps is not None:
+            self._facet_bitmaps.remove_vendor(self, vendor_id)
+
+        min_price, max_price = extract_price_range(vendor.get("price_range", ""))
+        self.vendor_records[vendor_id] = vendor
+        self.vendor_min_price[vendor_id] = min_price
+        self.vendor_max_price[vendor_id] = max_price
+        self.vendor_rating[vendor_id] = float(vendor.get("rating", 0) or 0)
+        self.vendor_speciality[vendor_id] = (vendor.get("speciality", "") or "").lower()
+        _repost(self.vendors_by_speciality_token, vendor_id, old_tokens,
+                set(tokenize(vendor.get("speciality", ""))))
+        if prices is not None:
+            prices.add(self, vendor_id)
+            self._vendor_prices = prices
+        if self._facet_bitmaps is not None:
+            self._facet_bitmaps.add_vendor(self, vendor_id)
+        if self._text_index is not None:
+            self._text_index.set_vendor(vendor_id, old_record, vendor)
+        self._changed()
+
+    def retire_vendor(self, vendor_id: int):
+        """Take a vendor out of every index; its id is never reused"""
+        self._check_live("vendor", vendor_id)
+        _repost(self.vendors_by_speciality_token, vendor_id,
+                set(tokenize(self.vendor_records[vendor_id].get("speciality", ""))), set())
+        by_type = self.area_vendors[self.vendor_area[vendor_id]]
+        vendor_type = self.vendor_type[vendor_id]
+        by_type[vendor_type] = _without_id(by_type[vendor_type], vendor_id)
+        if self._vendor_prices is not None:
+            prices = self._vendor_prices.copy()
+            prices.remove(self, vendor_id)
+            self._vendor_prices = prices
+        self.retired_vendors.add(vendor_id)
+        if self._facet_bitmaps is not None:
+            self._facet_bitmaps.remove_vendor(self, vendor_id)
+        if self._text_index is not None:
+            self._text_index.set_vendor(vendor_id, self.vendor_records[vendor_id], None)
+        self._changed()
+
+    def export_data(self) -> Dict:
+        """Nested cities → areas → venues/vendors dict of the active records"""
+        cities = {}
+        for city_id, city_key in enumerate(self.city_keys):
+            areas = {}
+            for area_id in self.city_areas[city_id]:
+                vendors = {}
+                for type_id, vendor_ids in self.area_vendors[area_id].items():
+                    vendors[self.vendor_type_keys[type_id]] = [self.vendor_records[i] for i in vendor_ids]
+                areas[self.area_keys[area_id]] = {
+                    "name": self.area_names[area_id],
+                    "venues": [self.venue_records[i] for i in self.area_venues[area_id]],
+                    "vendors": vendors
+                }
+            cities[city_key] = {"name": self.city_names[city_id], "areas": areas}
+        return {"cities": cities, "vendor_categories": list(self.vendor_categories)}
+
+    def compacted(self) -> "CatalogIndex":
+        """This index, or a freshly compiled one without retired id slots if records were retired"""
+        if not self.retired_venues and not self.retired_vendors:
+            return self
+        return CatalogIndex(self.export_data())
+
+    def event_type_mask(self, event_type: str) -> int:
+        """Bitmask for a single event type, 0 if no venue is suitable for it"""
+        bit = self.event_type_bits.get(event_type)
+        return 0 if bit is None else 1 << bit
+
+    def speciality_candidates(self, speciality: str) -> Optional[List[int]]:
+        """
+        Vendor ids whose speciality may contain the given text
+
+        Every query token must fall inside a single speciality token, so each one maps to the
+        union of postings for the vocabulary tokens that contain it. The result is a superset of
+        the substring matches; callers still confirm with the substring test. Returns None when
+        the text has no tokens to look up.
+        """
+        query_tokens = tokenize(speciality)
+        if not query_tokens:
+            return None
+
+        postings = []
+        for token in set(query_tokens):
+            posting = self._speciality_token_cache.get(token)
+            if posting is None:
+                posting = union_postings(
+                    ids for vocab_token, ids in self.vendors_by_speciality_token.items()
+                    if token in vocab_token
+                )
+                self._speciality_token_cache[token] = posting
+            postings.append(posting)
+        return intersect_postings(postings)
+
+    def location_resolver(self) -> LocationResolver:
+        """Fuzzy city/area name matcher over the location tables, built on first use"""
+        if self._location_resolver is None:
+            self._location_resolver = LocationResolver.from_index(self)
+        return self._location_resolver
+
+    def resolve_city(self, city: str) -> Optional[int]:
+        """City id for a city key, name, alias or misspelling; None if nothing is close"""
+        city_id = self.city_ids.get(city.lower())
+        if city_id is None:
+            city_id = self.location_resolver().city_id(city)
+        return city_id
+
+    def resolve_areas(self, city: Optional[str] = None, area: Optional[str] = None) -> List[int]:
+        """
+        Resolve optional city/area names to area ids in catalog order
+
+        Exact keys are plain dict lookups; anything else (display names, aliases, typos)
+        goes through the location resolver.
+        """
+        if city:
+            city_id = self.resolve_city(city)
+            if city_id is None:
+                return []
+            area_ids = self.city_areas[city_id]
+            if area:
+                area_key = area.lower()
+                matched = [a for a in area_ids if self.area_keys[a] == area_key]
+                if not matched:
+                    area_id = self.location_resolver().area_id(area, city_id)
+                    matched = [] if area_id is None else [area_id]
+                area_ids = matched
+            return area_ids
+
+        if area:
+            area_ids = self.area_ids.get(area.lower())
+            if area_ids is None:
+                area_id = self.location_resolver().area_id(area)
+                area_ids = [] if area_id is None else self.area_ids[self.area_keys[area_id]]
+            return area_ids
+
+        return list(range(len(self.area_keys)))
+
+    def venue_scopes(self, city: Optional[str] = None, area: Optional[str] = None) -> List[VenueScopeIndex]:
+        """Sorted range indexes covering the venues of a city/area filter"""
+        if city or area:
+            area_ids = self.resolve_areas(city, area)
+            if city and not area:
+                scope_keys = [("city", self.area_city[a]) for a in area_ids[:1]]
+            else:
+                scope_keys = [("area", a) for a in area_ids]
+        else:
+            scope_keys = [("all", 0)]
+
+        scopes = []
+        for scope_key in scope_keys:
+            scope = self._venue_scopes.get(scope_key)
+            if scope is None:
+                scope = VenueScopeIndex(self, self._scope_venue_ids(scope_key))
+                self._venue_scopes[scope_key] = scope
+            scopes.append(scope)
+        return scopes
+
+    def _scope_venue_ids(self, scope_key: Tuple[str, int]) -> List[int]:
+        """All venue ids inside a location scope"""
+        kind, scope_id = scope_key
+        if kind == "area":
+            return self.area_venues[scope_id]
+        if kind == "city":
+            return [i for a in self.city_areas[scope_id] for i in self.area_venues[a]]
+        return [i for venue_ids in self.area_venues for i in venue_ids]
+
+    def numpy_columns(self) -> NumpyColumns:
+        """NumPy view of the columns, built on first use (requires numpy)"""
+        if self._numpy_columns is None:
+            if not NUMPY_AVAILABLE:
+                raise RuntimeError("numpy is required for vectorized catalog queries")
+            self._numpy_columns = NumpyColumns(self)
+        return self._numpy_columns
+
+    def vendor_prices(self) -> VendorPriceIndex:
+        """Sorted price indexes over the live vendors, built on first use"""
+        if self._vendor_prices is None:
+            self._vendor_prices = VendorPriceIndex(
+                self, (i for i in range(len(self.vendor_records)) if i not in self.retired_vendors))
+        return self._vendor_prices
+
+    def facet_bitmaps(self) -> FacetBitmaps:
+        """Per-area/bucket/type id bitmaps for facet counts, built on first use"""
+        if self._facet_bitmaps is None:
+            self._facet_bitmaps = FacetBitmaps(self)
+        return self._facet_bitmaps
+
+    def venue_similarity(self) -> VenueSimilarity:
+        """Venue feature vectors for nearest-neighbour queries, built on first use"""
+        if self._venue_similarity is None:
+            self._venue_similarity = VenueSimilarity.from_index(self)
+        return self._venue_similarity
+
+    def text_index(self) -> CatalogTextIndex:
+        """BM25 indexes over venue and vendor text, built on first use"""
+        if self._text_index is None:
+            self._text_index = CatalogTextIndex.from_index(self)
+        return self._text_index
+
+    def availability(self) -> AvailabilityCalendar:
+        """Booked-venue day bitsets from today on, built on first use (and again when the day changes)"""
+        today = date.today()
+        if self._availability is None or self._availability.start != today:
+            self._availability = AvailabilityCalendar.from_records(
+                ((i, record) for i, record in enumerate(self.venue_records) if i not in self.retired_venues), today
+            )
+        return self._availability
+
+    def venue_result(self, venue_id: int) -> VenueView:
+        """Venue search result with its location info (a view over the catalog record, not a copy)"""
+        return VenueView(self, venue_id, self.venue_records[venue_id])
+
+    def vendor_result(self, vendor_id: int) -> VendorView:
+        """Vendor search result with its location and type info (a view over the catalog record, not a copy)"""
+        return VendorView(self, vendor_id, self.vendor_records[vendor_id])
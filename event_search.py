@@ -3,33 +3,675 @@ Event Search and Recommendation System
 Provides intelligent search and recommendations for venues and vendors
 """
 
+import base64
+import heapq
+import itertools
 import json
-import re
-from typing import List, Dict, Optional, Tuple
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date
+from functools import wraps
+from typing import List, Dict, Iterable, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: journal writers in several processes are not serialized
+    fcntl = None
+
+from budget_estimator import BUDGET_MULTIPLIERS, budget_scenarios, estimate_budget
+from catalog_facets import vendor_facets, vendor_matches, venue_facets, venue_matches
+from catalog_shm import attach_catalog, read_control
+from catalog_snapshot import is_snapshot, open_snapshot
+from catalog_sqlite import SQLiteCatalogBackend
+from event_index import CatalogIndex, NumpyColumns, NUMPY_AVAILABLE, extract_price_range, intersect_postings, np
+from keyword_detector import QueryKeywordDetector, default_detector
+from package_optimizer import Option, best_combination, cheapest_cost, pareto_options, quoted_cost
+from venue_availability import booked_days, booking_window, iso_days, parse_date
+from venue_ranking import VenueScorer, check_ranking
+from query_cache import (QueryCache, cached_query, lower_or_none, number_or_none, string_set, string_tuple,
+                         budget_preferences)
+
+class SearchResults(list):
+    """
+    List of result dicts that also remembers how many records matched before truncation
+    
+    `next_cursor` resumes the same search after the last result (None on the last page).
+    """
+    
+    def __init__(self, items=(), total: int = None, next_cursor: str = None):
+        super().__init__(items)
+        self.total = len(self) if total is None else total
+        self.next_cursor = next_cursor
+
+def encode_cursor(rating: float, record_id: int) -> str:
+    """Opaque page cursor: the (rating, id) ranking position of the last result served"""
+    return base64.urlsafe_b64encode(json.dumps([rating, record_id]).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """Inverse of encode_cursor; raises ValueError for anything it did not produce"""
+    try:
+        rating, record_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return float(rating), int(record_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+def after_cursor(ids: List[int], rating_col, position: Tuple[float, int]) -> List[int]:
+    """Ids ranked after `position` in (rating desc, id asc) order"""
+    rating, last_id = position
+    return [i for i in ids if rating_col[i] < rating or (rating_col[i] == rating and i > last_id)]
+
+def numpy_after_cursor(ids, ratings, position: Tuple[float, int]):
+    """Vectorized counterpart of after_cursor"""
+    rating, last_id = position
+    id_ratings = ratings[ids]
+    return ids[(id_ratings < rating) | ((id_ratings == rating) & (ids > last_id))]
+
+def result_page(top_ids: List[int], make_result, rating_col, total: int, remaining: int,
+                fields: Optional[List[str]]) -> SearchResults:
+    """Materialize a page of results (projected to `fields` if given) with its next cursor"""
+    if not fields:
+        items = [make_result(i) for i in top_ids]
+    else:
+        items = [make_result(i).to_dict(fields) for i in top_ids]
+    next_cursor = None
+    if top_ids and remaining > len(top_ids):
+        next_cursor = encode_cursor(rating_col[top_ids[-1]], top_ids[-1])
+    return SearchResults(items, total=total, next_cursor=next_cursor)
+
+def project(rows: List[Dict], fields: Optional[List[str]]) -> List[Dict]:
+    """Keep only `fields` of each result row"""
+    if not fields:
+        return rows
+    return [{key: row[key] for key in fields if key in row} for row in rows]
+
+def top_by_rating(ids: List[int], rating_col, limit: Optional[int]) -> List[int]:
+    """
+    Order ids by rating, or any per-id score, (highest first, catalog order on ties), keeping at most `limit`
+    
+    With a limit this is a bounded heap selection, O(n log k) instead of a full sort.
+    """
+    key = lambda i: (-rating_col[i], i)
+    if limit is not None and limit < len(ids):
+        return heapq.nsmallest(max(limit, 0), ids, key=key)
+    return sorted(ids, key=key)
+
+def numpy_top_by_rating(ids, ratings, limit: Optional[int]) -> List[int]:
+    """Vectorized counterpart of top_by_rating for an array of matching ids"""
+    order = np.lexsort((ids, -ratings[ids]))
+    if limit is not None:
+        order = order[:max(limit, 0)]
+    return ids[order].tolist()
+
+def text_rank_column(scores: Dict[int, float], size: int):
+    """Float column (size long) holding each id's text score, 0 elsewhere"""
+    column = np.zeros(size)
+    if scores:
+        ids = np.fromiter(scores.keys(), dtype=np.int64, count=len(scores))
+        column[ids] = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+    return column
+
+def on_snapshot(method):
+    """Run an engine method, and every query it makes, against a single catalog snapshot"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.pinned_index():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class EventSearchEngine:
-    def __init__(self, data_file: str = "event_data.json"):
-        """Initialize the search engine with event data"""
+    def __init__(self, data_file: str = "event_data.json", vectorized: bool = False,
+                 cache_size: int = 1024, cache_ttl: Optional[float] = 300.0,
+                 backend: Optional[SQLiteCatalogBackend] = None,
+                 keyword_detector: Optional[QueryKeywordDetector] = None,
+                 journal_file: Optional[str] = None,
+                 shared_catalog: Optional[str] = None):
+        """
+        Initialize the search engine with event data
+        
+        Args:
+            data_file: Path to the catalog JSON, or to a binary snapshot compiled by catalog_snapshot.py
+            vectorized: Evaluate filters as NumPy boolean array ops over the whole catalog
+                        (for bulk sweeps and very large cities; needs numpy)
+            cache_size: Max memoized query results (0 disables the cache)
+            cache_ttl: Seconds a memoized result stays valid (None for no expiry)
+            backend: Storage backend that answers searches instead of the in-memory
+                     catalog (e.g. SQLiteCatalogBackend); data_file is not loaded then
+            keyword_detector: Query keyword tables for get_recommendations (default: keyword_detector.py tables)
+            journal_file: Append-only log of catalog mutations replayed on top of data_file at
+                          load (default: "<data_file>.journal"); engines in other processes
+                          sharing it pick up each other's changes (see follow_journal)
+            shared_catalog: Name of a catalog published to shared memory by catalog_shm.py;
+                            attached read-only instead of loading data_file, and reloads
+                            follow the loader's republishes
+        """
         self.data_file = data_file
-        self.data = self._load_data()
+        self.shared_catalog = shared_catalog
+        self.journal_file = journal_file or f"{data_file}.journal"
+        self._pinned = threading.local()
+        self._reload_lock = threading.Lock()
+        self._reload_stop = threading.Event()
+        self._reload_thread = None
+        self._loaded_signature = self._file_signature()
+        # (inode, byte offset) of the journal entries applied to the current index
+        self._journal_position: Tuple[Optional[int], int] = (None, 0)
+        self.backend = backend
+        if backend is not None:
+            self.data = None
+            self.index = CatalogIndex({"cities": {}})
+        else:
+            try:
+                self.data, self.index, self._journal_position = self._read_catalog()
+            except FileNotFoundError as e:
+                print(f"❌ Event catalog not found: {e}")
+                self.data = {"cities": {}}
+                self.index = CatalogIndex(self.data)
+        
+        if vectorized and not NUMPY_AVAILABLE:
+            print("⚠️ numpy not installed, vectorized search disabled")
+        self.vectorized = vectorized and NUMPY_AVAILABLE
+        self.cache = QueryCache(cache_size, cache_ttl) if cache_size else None
+        self.keyword_detector = keyword_detector or default_detector
+    
+    def _read_catalog(self) -> Tuple[Optional[Dict], CatalogIndex, Tuple[Optional[int], int]]:
+        """
+        Load data_file and return (catalog dict, compiled index, journal position replayed to)
+        
+        Snapshots are memory-mapped (or attached from shared memory) as-is and have no catalog dict (None).
+        """
+        if self.shared_catalog is not None:
+            return None, attach_catalog(self.shared_catalog), (None, 0)
+        if is_snapshot(self.data_file):
+            return None, open_snapshot(self.data_file), (None, 0)
+        
+        with open(self.data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        index = CatalogIndex(data)
+        position = self._replay_journal(data, index, (None, 0))
+        return data, index, position
+    
+    @property
+    def index(self) -> CatalogIndex:
+        """The compiled catalog queries run against (the pinned snapshot inside pinned_index())"""
+        pinned = getattr(self._pinned, "index", None)
+        return pinned if pinned is not None else self._index
+    
+    @index.setter
+    def index(self, index: CatalogIndex):
+        # A single reference assignment, so readers see either the old or the new index
+        self._index = index
+    
+    @property
+    def catalog_version(self):
+        """Identifies the catalog currently served; changes on every reload or rebuild"""
+        if self.backend is not None:
+            return self.backend.version
+        return self.index.version
     
-    def _load_data(self) -> Dict:
-        """Load event data from JSON file"""
+    @contextmanager
+    def pinned_index(self):
+        """
+        Keep every query made in this block (on this thread) on one catalog snapshot
+        
+        Pins against reload(): a catalog swapped in mid-block is not seen. Single-record
+        mutations patch the pinned index itself, so they still show up inside the block.
+        """
+        pinned = getattr(self._pinned, "index", None)
+        if pinned is not None:
+            yield pinned
+            return
+        
+        self._pinned.index = self._index
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            yield self._pinned.index
+        finally:
+            self._pinned.index = None
+    
+    def reload(self) -> bool:
+        """
+        Re-read data_file (JSON or snapshot), or re-attach the shared catalog, and swap it in
+        
+        The new index is fully built before the one assignment that publishes it, so queries
+        see either the old catalog or the new one. Queries already running keep the index they
+        started with. A file that is missing or fails to parse leaves the current catalog in place.
+        
+        Returns:
+            True if a new catalog was swapped in
+        """
+        # Mutations wait for the rebuild, so none lands on the index being replaced
+        with self._reload_lock:
+            try:
+                index = self._load_catalog()
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Event data reload failed, keeping current catalog: {e}")
+                return False
+        
+        print(f"🔄 Event catalog reloaded: {len(index.venue_records)} venues, {len(index.vendor_records)} vendors")
+        return True
+    
+    def _load_catalog(self) -> CatalogIndex:
+        """Read the catalog and swap it in (caller holds _reload_lock); returns the new index"""
+        signature = self._file_signature()
+        data, index, position = self._read_catalog()
+        self.data = data
+        self.index = index
+        self._loaded_signature = signature
+        self._journal_position = position
+        return index
+    
+    def follow_journal(self):
+        """
+        Apply the changes other processes (e.g. other uvicorn workers) appended to the journal
+        
+        A compacted journal or a changed data_file means the entries this index has applied
+        are gone, so the catalog is reloaded instead.
+        """
+        with self._reload_lock:
+            if not self._follow_journal():
+                try:
+                    self._load_catalog()
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Event data reload failed, keeping current catalog: {e}")
+    
+    def _follow_journal(self) -> bool:
+        """Apply new journal entries (caller holds _reload_lock); False when a full reload is needed"""
+        if self.data is None:
+            return True
+        if self._file_signature() != self._loaded_signature:
+            return False
+        inode, offset = self._journal_position
+        try:
+            stat = os.stat(self.journal_file)
         except FileNotFoundError:
-            print(f"❌ Event data file {self.data_file} not found")
-            return {"cities": {}}
+            return offset == 0
+        if (inode is not None and stat.st_ino != inode) or stat.st_size < offset:
+            return False
+        if (stat.st_ino, stat.st_size) != (inode, offset):
+            self._journal_position = self._replay_journal(self.data, self._index, self._journal_position)
+        return True
+    
+    def _journal_behind(self) -> bool:
+        """True when the journal file differs from what the current index has applied"""
+        if self.data is None:
+            return False
+        try:
+            stat = os.stat(self.journal_file)
+        except OSError:
+            return self._journal_position[1] > 0
+        return (stat.st_ino, stat.st_size) != self._journal_position
+    
+    @contextmanager
+    def _journal_lock(self):
+        """Exclusive lock shared by every process writing this journal (mutations, compaction)"""
+        with open(self.journal_file + ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            yield
+    
+    def start_auto_reload(self, interval: float = 2.0, data_file: bool = True):
+        """
+        Watch data_file (mtime/size polling), or the shared catalog generation, and reload on change
+        
+        The journal is watched too, so changes made by other processes are applied within
+        `interval` seconds. data_file=False follows only the journal (and its compactions).
+        """
+        if self._reload_thread is not None and self._reload_thread.is_alive():
+            return
+        
+        self._reload_stop.clear()
+        self._reload_thread = threading.Thread(
+            target=self._watch_data_file, args=(interval, data_file), name="event-catalog-reload", daemon=True
+        )
+        self._reload_thread.start()
+    
+    def stop_auto_reload(self):
+        """Stop the data_file watcher thread"""
+        self._reload_stop.set()
+        if self._reload_thread is not None:
+            self._reload_thread.join()
+            self._reload_thread = None
+    
+    def _watch_data_file(self, interval: float, data_file: bool = True):
+        """Watcher loop: rebuild off the request path whenever the file signature changes, else follow the journal"""
+        while not self._reload_stop.wait(interval):
+            signature = self._file_signature()
+            if data_file and signature is not None and signature != self._loaded_signature:
+                self.reload()
+            elif self._journal_behind():
+                self.follow_journal()
+    
+    def _file_signature(self) -> Optional[Tuple[int, ...]]:
+        """(mtime_ns, size) of data_file, or (generation,) of the shared catalog; None if unavailable"""
+        if self.shared_catalog is not None:
+            control = read_control(self.shared_catalog)
+            return None if control is None else (control[0],)
+        try:
+            stat = os.stat(self.data_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def add_venue(self, city: str, area: str, venue: Dict,
+                  city_name: str = None, area_name: str = None) -> int:
+        """
+        Add a venue to the live catalog (journaled, no rebuild)
+        
+        Args:
+            city: City key (created if new, named city_name)
+            area: Area key within the city (created if new, named area_name)
+            venue: Venue record in the event_data.json format
+        
+        Returns:
+            The new venue id, used by update_venue/retire_venue
+        """
+        return self._mutate({"op": "add_venue", "city": city.lower(), "area": area.lower(), "record": venue,
+                             "city_name": city_name, "area_name": area_name})
+    
+    def update_venue(self, venue_id: int, changes: Dict) -> Dict:
+        """Merge changed fields (price_range, capacity, rating, ...) into a venue; returns the new record"""
+        return self._mutate({"op": "update_venue", "id": venue_id, "changes": changes})
+    
+    def retire_venue(self, venue_id: int):
+        """Remove a venue from search results for good"""
+        self._mutate({"op": "retire_venue", "id": venue_id})
+    
+    def book_venue(self, venue_id: int, date_from: str, date_to: str = None) -> Dict:
+        """
+        Mark a venue booked from date_from to date_to (inclusive, one day when omitted)
+        
+        Returns:
+            The new venue record (its booked_dates list)
+        
+        Raises:
+            ValueError: Invalid or past dates, or the venue is already booked on one of the days
+        """
+        first, last = booking_window(date_from, date_to)
+        return self._mutate({"op": "book_venue", "id": venue_id, "dates": iso_days(first, last)})
+    
+    def release_venue(self, venue_id: int, date_from: str, date_to: str = None) -> Dict:
+        """Remove the bookings of a venue from date_from to date_to; returns the new record"""
+        first = parse_date(date_from)
+        last = parse_date(date_to) if date_to else first
+        return self._mutate({"op": "release_venue", "id": venue_id, "dates": iso_days(first, last)})
+    
+    def add_vendor(self, city: str, area: str, vendor_type: str, vendor: Dict,
+                   city_name: str = None, area_name: str = None) -> int:
+        """Add a vendor to the live catalog (journaled, no rebuild); returns its id"""
+        return self._mutate({"op": "add_vendor", "city": city.lower(), "area": area.lower(),
+                             "vendor_type": vendor_type, "record": vendor,
+                             "city_name": city_name, "area_name": area_name})
     
+    def update_vendor(self, vendor_id: int, changes: Dict) -> Dict:
+        """Merge changed fields (price_range, rating, ...) into a vendor; returns the new record"""
+        return self._mutate({"op": "update_vendor", "id": vendor_id, "changes": changes})
+    
+    def retire_vendor(self, vendor_id: int):
+        """Remove a vendor from search results for good"""
+        self._mutate({"op": "retire_vendor", "id": vendor_id})
+    
+    def _mutate(self, change: Dict):
+        """
+        Validate a change, append it to the journal, then apply it to the live index
+        
+        Changes to existing records are journaled with the record's key (city, area, name, and
+        vendor type) next to its id, so a replay onto an edited data_file finds the same record.
+        
+        The journal lock is held from catching up on other processes' entries to appending this
+        one, so validation (e.g. the "already booked" check) sees every earlier change.
+        """
+        with self._reload_lock:
+            if self.backend is not None or self.data is None or self._index.read_only:
+                raise RuntimeError("Catalog mutations need the in-memory JSON catalog")
+            with self._journal_lock():
+                if not self._follow_journal():
+                    self._load_catalog()
+                index = self._index
+                self._validate_change(index, change)
+                if "id" in change:
+                    change = {**change, "key": self._record_key(index, change)}
+                
+                with open(self.journal_file, "ab") as f:
+                    f.write((json.dumps(change, ensure_ascii=False) + "\n").encode("utf-8"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self._journal_position = (os.fstat(f.fileno()).st_ino, f.tell())
+                return self._apply_change(self.data, index, change)
+    
+    @staticmethod
+    def _record_key(index: CatalogIndex, change: Dict) -> Dict:
+        """Stable key of the record a change targets (ids are positions and shift when data_file is edited)"""
+        record_id = change["id"]
+        if change["op"].endswith("_venue"):
+            area_id = index.venue_area[record_id]
+            return {"city": index.city_keys[index.area_city[area_id]], "area": index.area_keys[area_id],
+                    "name": index.venue_records[record_id].get("name")}
+        area_id = index.vendor_area[record_id]
+        return {"city": index.city_keys[index.area_city[area_id]], "area": index.area_keys[area_id],
+                "vendor_type": index.vendor_type_keys[index.vendor_type[record_id]],
+                "name": index.vendor_records[record_id].get("name")}
+    
+    @staticmethod
+    def _rebase_change(index: CatalogIndex, change: Dict) -> Dict:
+        """
+        Point a journaled change at the record its key names in this catalog
+        
+        The journaled id wins when several records share the key. Entries written before keys
+        were journaled keep their id.
+        
+        Raises:
+            KeyError: No active record has the key any more
+        """
+        key = change.get("key")
+        if key is None:
+            return change
+        city_id = index.city_ids.get(key["city"])
+        area_ids = [] if city_id is None else [a for a in index.city_areas[city_id] if index.area_keys[a] == key["area"]]
+        if change["op"].endswith("_venue"):
+            records = index.venue_records
+            candidates = [i for a in area_ids for i in index.area_venues[a]]
+        else:
+            records = index.vendor_records
+            type_id = index.vendor_type_ids.get(key["vendor_type"])
+            candidates = [i for a in area_ids for i in index.area_vendors[a].get(type_id, ())]
+        matches = [i for i in candidates if records[i].get("name") == key["name"]]
+        if not matches:
+            raise KeyError(f"'{key['name']}' is no longer in {key['area']}, {key['city']}")
+        return {**change, "id": change["id"] if change["id"] in matches else matches[0]}
+    
+    @staticmethod
+    def _validate_change(index: CatalogIndex, change: Dict):
+        """Raise ValueError/KeyError for a change that cannot be applied, before it is journaled"""
+        op = change["op"]
+        kind = "venue" if op.endswith("_venue") else "vendor"
+        if op.startswith("add_"):
+            if not change["city"] or not change["area"]:
+                raise ValueError("city and area are required")
+            if kind == "vendor" and not change["vendor_type"]:
+                raise ValueError("vendor_type is required")
+            record = change["record"]
+        else:
+            records, retired = ((index.venue_records, index.retired_venues) if kind == "venue"
+                                else (index.vendor_records, index.retired_vendors))
+            if not isinstance(change["id"], int) or not 0 <= change["id"] < len(records) or change["id"] in retired:
+                raise KeyError(f"No active {kind} with id {change['id']}")
+            if not isinstance(change.get("changes", {}), dict):
+                raise ValueError("changes must be an object")
+            record = {**records[change["id"]], **change.get("changes", {})}
+        
+        if not isinstance(record, dict) or not record.get("name"):
+            raise ValueError(f"A {kind} record needs a name")
+        int(record.get("capacity", 0) or 0)
+        float(record.get("rating", 0) or 0)
+        if not isinstance(record.get("booked_dates", None) or [], list):
+            raise ValueError("booked_dates must be a list of YYYY-MM-DD dates")
+        for day in record.get("booked_dates", None) or []:
+            parse_date(day)
+        if op == "book_venue":
+            taken = sorted(set(change["dates"]) & {d.isoformat() for d in booked_days(record)})
+            if taken:
+                raise ValueError(f"Venue {change['id']} is already booked on {', '.join(taken)}")
+    
+    @staticmethod
+    def _apply_change(data: Dict, index: CatalogIndex, change: Dict):
+        """Apply one journaled change to the catalog dict and the index"""
+        op = change["op"]
+        if op in ("add_venue", "add_vendor"):
+            city = data.setdefault("cities", {}).setdefault(
+                change["city"], {"name": change.get("city_name") or change["city"].replace("_", " ").title(), "areas": {}}
+            )
+            area = city.setdefault("areas", {}).setdefault(
+                change["area"], {"name": change.get("area_name") or change["area"].replace("_", " ").title()}
+            )
+            if op == "add_venue":
+                area.setdefault("venues", []).append(change["record"])
+                return index.add_venue(change["city"], change["area"], change["record"], city["name"], area["name"])
+            area.setdefault("vendors", {}).setdefault(change["vendor_type"], []).append(change["record"])
+            return index.add_vendor(change["city"], change["area"], change["vendor_type"], change["record"],
+                                    city["name"], area["name"])
+        
+        record_id = change["id"]
+        if op.endswith("_venue"):
+            old = index.venue_records[record_id]
+            area_id = index.venue_area[record_id]
+            records = data["cities"][index.city_keys[index.area_city[area_id]]]["areas"][index.area_keys[area_id]]["venues"]
+        else:
+            old = index.vendor_records[record_id]
+            area_id = index.vendor_area[record_id]
+            area = data["cities"][index.city_keys[index.area_city[area_id]]]["areas"][index.area_keys[area_id]]
+            records = area["vendors"][index.vendor_type_keys[index.vendor_type[record_id]]]
+        position = next(i for i, record in enumerate(records) if record is old)
+        
+        if op == "retire_venue":
+            del records[position]
+            index.retire_venue(record_id)
+            return None
+        if op == "retire_vendor":
+            del records[position]
+            index.retire_vendor(record_id)
+            return None
+        
+        changes = change.get("changes")
+        if op in ("book_venue", "release_venue"):
+            days = {d.isoformat() for d in booked_days(old)}
+            days = days | set(change["dates"]) if op == "book_venue" else days - set(change["dates"])
+            changes = {"booked_dates": sorted(days)}
+        new = {**old, **changes}
+        records[position] = new
+        if op.endswith("_venue"):
+            index.update_venue(record_id, new)
+        else:
+            index.update_vendor(record_id, new)
+        return new
+    
+    def _replay_journal(self, data: Dict, index: CatalogIndex,
+                        position: Tuple[Optional[int], int]) -> Tuple[Optional[int], int]:
+        """
+        Re-apply the journaled mutations after `position` to a catalog, matching records by key
+        
+        Returns the (inode, byte offset) position after the last complete entry; a line still
+        being written by another process is left for the next call.
+        """
+        try:
+            with open(self.journal_file, "rb") as f:
+                inode = os.fstat(f.fileno()).st_ino
+                f.seek(position[1])
+                chunk = f.read()
+        except FileNotFoundError:
+            return position
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        
+        applied = 0
+        for line_number, line in enumerate(complete.decode("utf-8").splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                change = self._rebase_change(index, json.loads(line))
+                self._validate_change(index, change)
+                self._apply_change(data, index, change)
+                applied += 1
+            except (ValueError, KeyError, TypeError, StopIteration) as e:
+                print(f"⚠️ Skipping catalog journal entry {line_number}: {e}")
+        if applied:
+            print(f"📒 Replayed {applied} catalog changes from {self.journal_file}")
+        return inode, position[1] + len(complete)
+    
+    def compact_journal(self):
+        """
+        Write the current catalog back to data_file and empty the journal
+        
+        The index is recompiled from the compacted file, so venue/vendor ids are reassigned
+        (retired ids disappear); look ids up again afterwards.
+        """
+        with self._reload_lock:
+            if self.backend is not None or self.data is None:
+                raise RuntimeError("Catalog mutations need the in-memory JSON catalog")
+            with self._journal_lock():
+                if not self._follow_journal():
+                    self._load_catalog()
+                tmp_file = self.data_file + ".tmp"
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(self.data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.data_file)
+                # A new (empty) journal file, so other processes see the old one was compacted
+                open(self.journal_file + ".tmp", "w").close()
+                os.replace(self.journal_file + ".tmp", self.journal_file)
+                self._loaded_signature = self._file_signature()
+                self._journal_position = (os.stat(self.journal_file).st_ino, 0)
+                self.index = CatalogIndex(self.data)
+    
+    def find_records(self, kind: str, name: str, city: str = None) -> List[Dict]:
+        """
+        Look up active venue/vendor ids by name for the mutation API
+        
+        Args:
+            kind: "venue" or "vendor"
+            name: Case-insensitive substring of the record name
+            city: Optional city key
+        
+        Returns:
+            [{"id": ..., "city_key": ..., "area_key": ..., "record": {...}}]
+        """
+        index = self.index
+        if kind == "venue":
+            records, areas, retired = index.venue_records, index.venue_area, index.retired_venues
+        else:
+            records, areas, retired = index.vendor_records, index.vendor_area, index.retired_vendors
+        needle = name.lower()
+        city_id = index.city_ids.get(city.lower()) if city else None
+        
+        matches = []
+        for record_id in range(len(records)):
+            if record_id in retired:
+                continue
+            area_id = areas[record_id]
+            if city and index.area_city[area_id] != city_id:
+                continue
+            if needle in records[record_id].get("name", "").lower():
+                matches.append({"id": record_id, "city_key": index.city_keys[index.area_city[area_id]],
+                                "area_key": index.area_keys[area_id], "record": records[record_id]})
+        return matches
+    
+    @cached_query(city=lower_or_none, area=lower_or_none, capacity=number_or_none,
+                  budget_min=number_or_none, budget_max=number_or_none,
+                  event_type=lower_or_none, amenities=string_set, fields=string_tuple, text=lower_or_none)
     def search_venues(self, 
                      city: str = None, 
                      area: str = None, 
                      capacity: int = None, 
                      budget_min: int = None, 
                      budget_max: int = None,
-                     event_type: str = None) -> List[Dict]:
+                     event_type: str = None,
+                     amenities: List[str] = None,
+                     limit: int = None,
+                     cursor: str = None,
+                     fields: List[str] = None,
+                     rank_by: str = "rating",
+                     date_from: str = None,
+                     date_to: str = None,
+                     text: str = None) -> List[Dict]:
         """
         Search for venues based on criteria
         
@@ -40,66 +682,254 @@ class EventSearchEngine:
             budget_min: Minimum budget in rupees
             budget_max: Maximum budget in rupees
             event_type: Type of event (e.g., 'wedding', 'corporate')
+            amenities: Amenities the venue must all offer (e.g., ['Bridal Room', 'Valet Parking'])
+            limit: Return only the top `limit` venues (all when None)
+            cursor: `next_cursor` of the previous page, to continue after its last venue
+            fields: Return only these keys of each venue (e.g., ['name', 'rating'])
+            rank_by: "rating" (highest rated first) or "relevance" (rating blended with how well
+                     capacity and price fit the request, see venue_ranking.py)
+            date_from: Only venues free on this day (YYYY-MM-DD, within AVAILABILITY_DAYS from today)
+            date_to: Last day of a multi-day event (inclusive; defaults to date_from)
+            text: Free-text intent (e.g., 'rooftop with live band'); only venues whose name,
+                  address or amenities share a term with it are kept, ranked by BM25 text
+                  relevance instead of rank_by (see text_index.py)
         
         Returns:
-            List of matching venues with details
+            List of matching venues with details; `.total` holds the match count before the limit
+            and `.next_cursor` the cursor for the next page (None when nothing is left)
         """
-        results = []
+        scorer = VenueScorer(capacity, budget_min, budget_max) if check_ranking(rank_by) == "relevance" else None
+        position = decode_cursor(cursor) if cursor else None
+        window = self._booking_window(date_from, date_to)
+        if self.backend is not None:
+            return self._backend_page(self.backend.search_venues, (
+                city, area, capacity, budget_min, budget_max, event_type, amenities
+            ), limit, position, fields, scorer=scorer, available=window, text=text)
+        text_scores = self._text_scores("venues", text)
+        if text_scores is not None and not text_scores:
+            return SearchResults([], total=0)
+        
+        index = self.index
+        text_ids = sorted(text_scores) if text_scores is not None else None
+        if self.vectorized:
+            cols = index.numpy_columns()
+            matched = self._vectorized_venue_ids(
+                index, cols, city, area, capacity, budget_min, budget_max, event_type, amenities, text_ids
+            )
+            if window:
+                matched = matched[~index.availability().numpy_booked(*window, cols.venue_count)[matched]]
+            if text_scores is not None:
+                rank_col = text_rank_column(text_scores, cols.venue_count)
+            else:
+                rank_col = scorer.numpy_scores(cols) if scorer else cols.venue_rating
+            remaining = numpy_after_cursor(matched, rank_col, position) if position else matched
+            top_ids = numpy_top_by_rating(remaining, rank_col, limit)
+            return result_page(top_ids, index.venue_result, rank_col, len(matched), len(remaining), fields)
         
-        # Search through all cities or specific city
-        cities_to_search = [city.lower()] if city else self.data["cities"].keys()
+        candidates, event_mask, required_amenities = self._venue_candidates(
+            index, city, area, capacity, budget_min, budget_max, event_type, amenities, text_ids
+        )
+        
+        matched = self._match_venues(index, candidates, capacity, budget_min, budget_max,
+                                     event_mask, required_amenities)
+        if window:
+            matched = index.availability().available(matched, *window)
+        if text_scores is not None:
+            rank_col = text_scores
+        else:
+            rank_col = scorer.scores(index, matched) if scorer else index.venue_rating
+        remaining = after_cursor(matched, rank_col, position) if position else matched
+        
+        # Top venues by rating or score (highest first); only those get materialized
+        top_ids = top_by_rating(remaining, rank_col, limit)
+        return result_page(top_ids, index.venue_result, rank_col, len(matched), len(remaining), fields)
+    
+    @staticmethod
+    def _booking_window(date_from: Optional[str], date_to: Optional[str]) -> Optional[Tuple[date, date]]:
+        """Validated (first, last) day of a date filter, None without one"""
+        if not date_from and not date_to:
+            return None
+        return booking_window(date_from or date_to, date_to)
+    
+    def _text_scores(self, kind: str, text: Optional[str]) -> Optional[Dict[int, float]]:
+        """BM25 scores of a free-text filter over "venues" or "vendors" ({} when nothing matches), None without one"""
+        if not text:
+            return None
+        text_index = self.index.text_index()
+        return (text_index.venues if kind == "venues" else text_index.vendors).scores(text)
+    
+    def _backend_page(self, search, args: Tuple, limit: Optional[int], position: Optional[Tuple[float, int]],
+                      fields: Optional[List[str]], **options) -> SearchResults:
+        """Run a backend search for one page; one extra row tells whether another page follows"""
+        fetch = limit + 1 if limit is not None and limit >= 0 else limit
+        rows, total, keys = search(*args, limit=fetch, after=position, **options)
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows, keys = rows[:limit], keys[:limit]
+            if keys:
+                next_cursor = encode_cursor(*keys[-1])
+        return SearchResults(project(rows, fields), total=total, next_cursor=next_cursor)
+    
+    def _match_venues(self, index: CatalogIndex, candidates: Iterable[int], capacity: Optional[int],
+                      budget_min: Optional[int], budget_max: Optional[int], event_mask: int,
+                      required_amenities: frozenset) -> List[int]:
+        """Keep the candidate venues that pass the capacity, budget, event-type and amenity checks"""
+        capacity_col = index.venue_capacity
+        min_price_col = index.venue_min_price
+        max_price_col = index.venue_max_price
+        event_mask_col = index.venue_event_mask
+        amenities_col = index.venue_amenities
         
-        for city_key in cities_to_search:
-            if city_key not in self.data["cities"]:
+        matched = []
+        for venue_id in candidates:
+            # Check capacity
+            if capacity and capacity_col[venue_id] < capacity:
                 continue
-                
-            city_data = self.data["cities"][city_key]
             
-            # Search through all areas or specific area
-            areas_to_search = [area.lower()] if area else city_data["areas"].keys()
+            # Check budget
+            if budget_min and max_price_col[venue_id] < budget_min:
+                continue
+            if budget_max and min_price_col[venue_id] > budget_max:
+                continue
             
-            for area_key in areas_to_search:
-                if area_key not in city_data["areas"]:
-                    continue
-                    
-                area_data = city_data["areas"][area_key]
-                
-                for venue in area_data.get("venues", []):
-                    # Check capacity
-                    if capacity and venue.get("capacity", 0) < capacity:
-                        continue
-                    
-                    # Check budget
-                    venue_price = self._extract_price_range(venue.get("price_range", ""))
-                    if budget_min and venue_price[1] < budget_min:
-                        continue
-                    if budget_max and venue_price[0] > budget_max:
-                        continue
-                    
-                    # Check event type
-                    if event_type and event_type.lower() not in venue.get("suitable_for", []):
-                        continue
-                    
-                    # Add location info to venue
-                    venue_result = venue.copy()
-                    venue_result["city"] = city_data["name"]
-                    venue_result["area"] = area_data["name"]
-                    venue_result["city_key"] = city_key
-                    venue_result["area_key"] = area_key
-                    
-                    results.append(venue_result)
-        
-        # Sort by rating (highest first)
-        results.sort(key=lambda x: x.get("rating", 0), reverse=True)
-        return results
+            # Check event type and amenities (only when no posting list enforced them)
+            if event_mask and not event_mask_col[venue_id] & event_mask:
+                continue
+            if required_amenities and not required_amenities <= amenities_col[venue_id]:
+                continue
+            
+            matched.append(venue_id)
+        return matched
+    
+    def _vectorized_venue_ids(self, index: CatalogIndex, cols: NumpyColumns, city: Optional[str],
+                              area: Optional[str], capacity: Optional[int], budget_min: Optional[int],
+                              budget_max: Optional[int], event_type: Optional[str],
+                              amenities: Optional[List[str]], text_ids: Optional[List[int]] = None):
+        """Evaluate every venue predicate as a boolean column op and return matching ids"""
+        mask = self._vectorized_venue_mask(index, cols, city, area, capacity, budget_min, budget_max)
+        if text_ids is not None:
+            mask &= cols.posting_mask(text_ids, cols.venue_count)
+        
+        if event_type:
+            bit = index.event_type_bits.get(event_type.lower())
+            if bit is None:
+                return np.empty(0, dtype=np.int64)
+            mask &= cols.event_type_column(bit)
+        
+        for amenity in {a.strip().lower() for a in amenities or [] if a and a.strip()}:
+            posting = index.venues_by_amenity.get(amenity)
+            if not posting:
+                return np.empty(0, dtype=np.int64)
+            mask &= cols.posting_mask(posting, cols.venue_count)
+        
+        return np.flatnonzero(mask)
+    
+    def _vectorized_venue_mask(self, index: CatalogIndex, cols: NumpyColumns, city: Optional[str],
+                               area: Optional[str], capacity: Optional[int], budget_min: Optional[int],
+                               budget_max: Optional[int]):
+        """Boolean column for the location, capacity and budget predicates"""
+        mask = cols.venue_live.copy()
+        if city or area:
+            mask &= np.isin(cols.venue_area, index.resolve_areas(city, area))
+        if capacity:
+            mask &= cols.venue_capacity >= capacity
+        if budget_min:
+            mask &= cols.venue_max_price >= budget_min
+        if budget_max:
+            mask &= cols.venue_min_price <= budget_max
+        return mask
+    
+    def _venue_candidates(self, index: CatalogIndex, city: Optional[str], area: Optional[str],
+                          capacity: Optional[int], budget_min: Optional[int], budget_max: Optional[int],
+                          event_type: Optional[str], amenities: Optional[List[str]],
+                          text_ids: Optional[List[int]] = None) -> Tuple[Iterable[int], int, frozenset]:
+        """
+        Choose the cheapest access path for a venue query
+        
+        Candidate sets come from one of: the location's venue lists, the intersection of the
+        event-type/amenity/free-text posting lists, or a bisect range over the sorted capacity or
+        price-interval index of the location. Each path's size is known up front (list lengths
+        and bisect counts), so the smallest one drives the scan. Capacity and budget are always
+        re-checked by the caller; the event-type mask and amenity set returned here are empty
+        when the chosen path already enforced them. Free-text matches (`text_ids`) are always
+        enforced here.
+        
+        Returns:
+            (candidate venue ids, event mask to check, amenities to check)
+        """
+        area_ids = index.resolve_areas(city, area)
+        if not area_ids:
+            return [], 0, frozenset()
+        
+        postings = []
+        event_mask = 0
+        if event_type:
+            event_key = event_type.lower()
+            posting = index.venues_by_event_type.get(event_key)
+            if not posting:
+                return [], 0, frozenset()
+            postings.append(posting)
+            event_mask = index.event_type_mask(event_key)
+        
+        required_amenities = frozenset(a.strip().lower() for a in amenities or [] if a and a.strip())
+        for amenity in required_amenities:
+            posting = index.venues_by_amenity.get(amenity)
+            if not posting:
+                return [], 0, frozenset()
+            postings.append(posting)
+        if text_ids is not None:
+            postings.append(text_ids)
+        
+        # Estimate every access path and keep the smallest
+        best_path = "location"
+        best_cost = sum(len(index.area_venues[a]) for a in area_ids)
+        if postings:
+            cost = min(len(p) for p in postings)
+            if cost < best_cost:
+                best_path, best_cost = "postings", cost
+        
+        scopes = index.venue_scopes(city, area) if (capacity or budget_min or budget_max) else []
+        if capacity:
+            cost = sum(scope.capacity_count(capacity) for scope in scopes)
+            if cost < best_cost:
+                best_path, best_cost = "capacity", cost
+        if budget_min or budget_max:
+            cost = sum(scope.price_count(budget_min, budget_max) for scope in scopes)
+            if cost < best_cost:
+                best_path, best_cost = "price", cost
+        
+        if best_path == "postings":
+            candidates = intersect_postings(postings)
+            if city or area:
+                allowed_areas = set(area_ids)
+                area_col = index.venue_area
+                candidates = [i for i in candidates if area_col[i] in allowed_areas]
+            return candidates, 0, frozenset()
+        
+        if best_path == "capacity":
+            candidates = itertools.chain.from_iterable(scope.capacity_ids(capacity) for scope in scopes)
+        elif best_path == "price":
+            candidates = itertools.chain.from_iterable(scope.price_ids(budget_min, budget_max) for scope in scopes)
+        else:
+            candidates = itertools.chain.from_iterable(index.area_venues[a] for a in area_ids)
+        if text_ids is not None:
+            text_matches = set(text_ids)
+            candidates = (i for i in candidates if i in text_matches)
+        return candidates, event_mask, required_amenities
     
+    @cached_query(city=lower_or_none, area=lower_or_none, budget_min=number_or_none,
+                  budget_max=number_or_none, speciality=lower_or_none, fields=string_tuple, text=lower_or_none)
     def search_vendors(self, 
                       city: str = None, 
                       area: str = None,
                       vendor_type: str = None, 
                       budget_min: int = None, 
                       budget_max: int = None,
-                      speciality: str = None) -> List[Dict]:
+                      speciality: str = None,
+                      limit: int = None,
+                      cursor: str = None,
+                      fields: List[str] = None,
+                      text: str = None) -> List[Dict]:
         """
         Search for vendors based on criteria
         
@@ -110,64 +940,497 @@ class EventSearchEngine:
             budget_min: Minimum budget in rupees
             budget_max: Maximum budget in rupees
             speciality: Vendor speciality (e.g., 'wedding', 'corporate')
+            limit: Return only the top `limit` vendors by rating (all when None)
+            cursor: `next_cursor` of the previous page, to continue after its last vendor
+            fields: Return only these keys of each vendor (e.g., ['name', 'price_range'])
+            text: Free-text intent; only vendors whose name, speciality or services share a term
+                  with it are kept, ranked by BM25 text relevance instead of rating
         
         Returns:
-            List of matching vendors with details
+            List of matching vendors with details; `.total` holds the match count before the limit
+            and `.next_cursor` the cursor for the next page (None when nothing is left)
         """
-        results = []
+        position = decode_cursor(cursor) if cursor else None
+        if self.backend is not None:
+            return self._backend_page(self.backend.search_vendors, (
+                city, area, vendor_type, budget_min, budget_max, speciality
+            ), limit, position, fields, text=text)
+        text_scores = self._text_scores("vendors", text)
+        if text_scores is not None and not text_scores:
+            return SearchResults([], total=0)
+        
+        index = self.index
+        text_ids = sorted(text_scores) if text_scores is not None else None
+        if self.vectorized:
+            cols = index.numpy_columns()
+            matched = self._vectorized_vendor_ids(
+                index, cols, city, area, vendor_type, budget_min, budget_max, speciality, text_ids
+            )
+            rank_col = text_rank_column(text_scores, cols.vendor_count) if text_scores is not None else cols.vendor_rating
+            remaining = numpy_after_cursor(matched, rank_col, position) if position else matched
+            top_ids = numpy_top_by_rating(remaining, rank_col, limit)
+            return result_page(top_ids, index.vendor_result, rank_col, len(matched), len(remaining), fields)
+        
+        candidates = self._vendor_candidates(index, city, area, vendor_type, speciality, text_ids)
+        matched = self._match_vendors(index, candidates, budget_min, budget_max, speciality)
+        rank_col = text_scores if text_scores is not None else index.vendor_rating
+        remaining = after_cursor(matched, rank_col, position) if position else matched
         
-        # Search through all cities or specific city
-        cities_to_search = [city.lower()] if city else self.data["cities"].keys()
+        # Top vendors by rating or text score (highest first); only those get materialized
+        top_ids = top_by_rating(remaining, rank_col, limit)
+        return result_page(top_ids, index.vendor_result, rank_col, len(matched), len(remaining), fields)
+    
+    def _match_vendors(self, index: CatalogIndex, candidates: Iterable[int], budget_min: Optional[int],
+                       budget_max: Optional[int], speciality: Optional[str]) -> List[int]:
+        """Keep the candidate vendors that pass the budget and speciality checks"""
+        min_price_col = index.vendor_min_price
+        max_price_col = index.vendor_max_price
+        speciality_col = index.vendor_speciality
+        speciality_lower = speciality.lower() if speciality else None
         
-        for city_key in cities_to_search:
-            if city_key not in self.data["cities"]:
+        matched = []
+        for vendor_id in candidates:
+            # Check budget
+            if budget_min and max_price_col[vendor_id] < budget_min:
+                continue
+            if budget_max and min_price_col[vendor_id] > budget_max:
                 continue
-                
-            city_data = self.data["cities"][city_key]
             
-            # Search through all areas or specific area
-            areas_to_search = [area.lower()] if area else city_data["areas"].keys()
+            # Check speciality
+            if speciality_lower and speciality_lower not in speciality_col[vendor_id]:
+                continue
             
-            for area_key in areas_to_search:
-                if area_key not in city_data["areas"]:
-                    continue
-                    
-                area_data = city_data["areas"][area_key]
-                vendors_data = area_data.get("vendors", {})
-                
-                # Search through all vendor types or specific type
-                vendor_types_to_search = [vendor_type] if vendor_type else vendors_data.keys()
-                
-                for vtype in vendor_types_to_search:
-                    if vtype not in vendors_data:
-                        continue
-                    
-                    for vendor in vendors_data[vtype]:
-                        # Check budget
-                        vendor_price = self._extract_price_range(vendor.get("price_range", ""))
-                        if budget_min and vendor_price[1] < budget_min:
+            matched.append(vendor_id)
+        return matched
+    
+    def _vectorized_vendor_ids(self, index: CatalogIndex, cols: NumpyColumns, city: Optional[str],
+                               area: Optional[str], vendor_type: Optional[str], budget_min: Optional[int],
+                               budget_max: Optional[int], speciality: Optional[str],
+                               text_ids: Optional[List[int]] = None):
+        """Evaluate vendor predicates as boolean column ops; speciality substrings are confirmed on survivors"""
+        mask = cols.vendor_live.copy()
+        if text_ids is not None:
+            mask &= cols.posting_mask(text_ids, cols.vendor_count)
+        if city or area:
+            mask &= np.isin(cols.vendor_area, index.resolve_areas(city, area))
+        if vendor_type:
+            type_id = index.vendor_type_ids.get(vendor_type)
+            if type_id is None:
+                return np.empty(0, dtype=np.int64)
+            mask &= cols.vendor_type == type_id
+        if budget_min:
+            mask &= cols.vendor_max_price >= budget_min
+        if budget_max:
+            mask &= cols.vendor_min_price <= budget_max
+        
+        if not speciality:
+            return np.flatnonzero(mask)
+        
+        speciality_ids = index.speciality_candidates(speciality)
+        if speciality_ids is not None:
+            mask &= cols.posting_mask(speciality_ids, cols.vendor_count)
+        ids = np.flatnonzero(mask)
+        speciality_lower = speciality.lower()
+        speciality_col = index.vendor_speciality
+        keep = np.fromiter((speciality_lower in speciality_col[i] for i in ids.tolist()), dtype=bool, count=len(ids))
+        return ids[keep]
+    
+    def _vendor_candidates(self, index: CatalogIndex, city: Optional[str], area: Optional[str],
+                           vendor_type: Optional[str], speciality: Optional[str],
+                           text_ids: Optional[List[int]] = None) -> Iterable[int]:
+        """
+        Choose the cheapest access path for a vendor query
+        
+        Uses the speciality token / free-text postings when they are smaller than the
+        location/type lists. Candidates always satisfy location, vendor type and the free-text
+        match; budget and the exact speciality substring test are left to the caller.
+        """
+        area_ids = index.resolve_areas(city, area)
+        if not area_ids:
+            return []
+        
+        type_id = None
+        if vendor_type:
+            type_id = index.vendor_type_ids.get(vendor_type)
+            if type_id is None:
+                return []
+            vendor_lists = [index.area_vendors[a].get(type_id, []) for a in area_ids]
+        else:
+            vendor_lists = [ids for a in area_ids for ids in index.area_vendors[a].values()]
+        
+        speciality_ids = index.speciality_candidates(speciality) if speciality else None
+        if text_ids is not None:
+            speciality_ids = text_ids if speciality_ids is None else intersect_postings([speciality_ids, text_ids])
+        if speciality_ids is not None and len(speciality_ids) < sum(len(ids) for ids in vendor_lists):
+            if city or area:
+                allowed_areas = set(area_ids)
+                area_col = index.vendor_area
+                speciality_ids = [i for i in speciality_ids if area_col[i] in allowed_areas]
+            if type_id is not None:
+                type_col = index.vendor_type
+                speciality_ids = [i for i in speciality_ids if type_col[i] == type_id]
+            return speciality_ids
+        
+        candidates = itertools.chain.from_iterable(vendor_lists)
+        if text_ids is not None:
+            text_matches = set(text_ids)
+            candidates = (i for i in candidates if i in text_matches)
+        return candidates
+    
+    @on_snapshot
+    def search_batch(self,
+                     city: str = None,
+                     area: str = None,
+                     venue_query: Dict = None,
+                     vendor_queries: List[Dict] = None,
+                     limit: int = 5) -> Dict:
+        """
+        Answer one venue query and several vendor sub-queries for the same location together
+        
+        The location is resolved once and its vendor lists are walked once; every vendor is
+        checked against all sub-queries for its type during that walk. The venue query goes
+        through the same access-path planner as search_venues.
+        
+        Args:
+            city: City name shared by all sub-queries
+            area: Area name shared by all sub-queries
+            venue_query: search_venues filters (capacity, budget_min, budget_max, event_type,
+                         amenities, limit, rank_by, date_from, date_to, text), or None to skip venues
+            vendor_queries: One dict per vendor category with vendor_type plus optional
+                            budget_min, budget_max, speciality and limit
+            limit: Top-k per category when a sub-query has no limit of its own
+        
+        Returns:
+            {"venues": SearchResults or None, "vendors": {vendor_type: SearchResults}}
+        """
+        vendor_queries = vendor_queries or []
+        vendor_types = [q.get("vendor_type") for q in vendor_queries]
+        if not all(vendor_types) or len(set(vendor_types)) != len(vendor_types):
+            raise ValueError("Each vendor sub-query needs its own distinct vendor_type")
+        
+        index = self.index
+        venues = self._batch_venues(index, city, area, venue_query, limit) if venue_query is not None else None
+        
+        if self.backend is not None or self.vectorized:
+            # SQL / whole-catalog column ops already answer each sub-query in a single pass
+            vendors = {q["vendor_type"]: self.search_vendors(
+                           city, area, q["vendor_type"], q.get("budget_min"), q.get("budget_max"),
+                           q.get("speciality"), q.get("limit", limit))
+                       for q in vendor_queries}
+            return {"venues": venues, "vendors": vendors}
+        
+        # Group sub-queries by vendor type id; unknown types simply match nothing
+        matched = {q["vendor_type"]: [] for q in vendor_queries}
+        by_type = {}
+        for q in vendor_queries:
+            type_id = index.vendor_type_ids.get(q["vendor_type"])
+            if type_id is not None:
+                speciality = q.get("speciality")
+                by_type.setdefault(type_id, []).append(
+                    (q.get("budget_min"), q.get("budget_max"), speciality.lower() if speciality else None,
+                     matched[q["vendor_type"]])
+                )
+        
+        min_price_col = index.vendor_min_price
+        max_price_col = index.vendor_max_price
+        speciality_col = index.vendor_speciality
+        for area_id in index.resolve_areas(city, area) if by_type else []:
+            area_lists = index.area_vendors[area_id]
+            for type_id, sub_queries in by_type.items():
+                for vendor_id in area_lists.get(type_id, ()):
+                    for budget_min, budget_max, speciality_lower, hits in sub_queries:
+                        if budget_min and max_price_col[vendor_id] < budget_min:
                             continue
-                        if budget_max and vendor_price[0] > budget_max:
+                        if budget_max and min_price_col[vendor_id] > budget_max:
                             continue
-                        
-                        # Check speciality
-                        if speciality and speciality.lower() not in vendor.get("speciality", "").lower():
+                        if speciality_lower and speciality_lower not in speciality_col[vendor_id]:
                             continue
-                        
-                        # Add location and type info to vendor
-                        vendor_result = vendor.copy()
-                        vendor_result["city"] = city_data["name"]
-                        vendor_result["area"] = area_data["name"]
-                        vendor_result["city_key"] = city_key
-                        vendor_result["area_key"] = area_key
-                        vendor_result["vendor_type"] = vtype
-                        
-                        results.append(vendor_result)
-        
-        # Sort by rating (highest first)
-        results.sort(key=lambda x: x.get("rating", 0), reverse=True)
-        return results
+                        hits.append(vendor_id)
+        
+        vendors = {}
+        for q in vendor_queries:
+            ids = matched[q["vendor_type"]]
+            top_ids = top_by_rating(ids, index.vendor_rating, q.get("limit", limit))
+            vendors[q["vendor_type"]] = SearchResults((index.vendor_result(i) for i in top_ids), total=len(ids))
+        
+        return {"venues": venues, "vendors": vendors}
+    
+    def _batch_venues(self, index: CatalogIndex, city: Optional[str], area: Optional[str],
+                      venue_query: Dict, limit: Optional[int]) -> SearchResults:
+        """Venue part of search_batch"""
+        if self.backend is not None or self.vectorized:
+            return self.search_venues(
+                city, area, venue_query.get("capacity"), venue_query.get("budget_min"),
+                venue_query.get("budget_max"), venue_query.get("event_type"), venue_query.get("amenities"),
+                venue_query.get("limit", limit), rank_by=venue_query.get("rank_by", "rating"),
+                date_from=venue_query.get("date_from"), date_to=venue_query.get("date_to"),
+                text=venue_query.get("text")
+            )
+        
+        capacity = venue_query.get("capacity")
+        budget_min = venue_query.get("budget_min")
+        budget_max = venue_query.get("budget_max")
+        relevance = check_ranking(venue_query.get("rank_by", "rating")) == "relevance"
+        text_scores = self._text_scores("venues", venue_query.get("text"))
+        if text_scores is not None and not text_scores:
+            return SearchResults([], total=0)
+        candidates, event_mask, required_amenities = self._venue_candidates(
+            index, city, area, capacity, budget_min, budget_max,
+            venue_query.get("event_type"), venue_query.get("amenities"),
+            sorted(text_scores) if text_scores is not None else None
+        )
+        matched = self._match_venues(index, candidates, capacity, budget_min, budget_max,
+                                     event_mask, required_amenities)
+        window = self._booking_window(venue_query.get("date_from"), venue_query.get("date_to"))
+        if window:
+            matched = index.availability().available(matched, *window)
+        if text_scores is not None:
+            rank_col = text_scores
+        else:
+            rank_col = VenueScorer(capacity, budget_min, budget_max).scores(index, matched) if relevance else index.venue_rating
+        top_ids = top_by_rating(matched, rank_col, venue_query.get("limit", limit))
+        return SearchResults((index.venue_result(i) for i in top_ids), total=len(matched))
+    
+    @cached_query(venue=lambda v: v.strip().lower() if isinstance(v, str) else v, city=lower_or_none,
+                  fields=string_tuple)
+    def similar_venues(self,
+                       venue: Union[int, str],
+                       limit: int = 5,
+                       city: str = None,
+                       same_city: bool = True,
+                       fields: List[str] = None) -> SearchResults:
+        """
+        Venues most like a given one (amenities, event types, price, capacity, rating)
+        
+        Args:
+            venue: Venue id, or name (exact, case-insensitive; else the first name containing it)
+            limit: Number of similar venues to return
+            city: Only venues in this city
+            same_city: Without `city`, only venues in the reference venue's city (default True)
+            fields: Return only these keys of each venue
+        
+        Returns:
+            Venues, most similar first, each with a "similarity" (cosine, -1..1); `.total` is
+            the number returned. Raises KeyError for an unknown venue.
+        """
+        backend = self.backend
+        index = self.index if backend is None else None
+        venue_id = venue if isinstance(venue, int) else (
+            backend.find_venue_id(venue) if backend is not None else self._find_venue_id(index, venue))
+        if venue_id is None:
+            raise KeyError(f"No venue named '{venue}'")
+        
+        city_id = None
+        if city:
+            city_id = backend.location_resolver().city_id(city) if backend is not None else index.resolve_city(city)
+            if city_id is None:
+                return SearchResults([], total=0)
+        elif same_city:
+            city_id = backend.venue_city_id(venue_id) if backend is not None else (
+                index.venue_city[venue_id] if 0 <= venue_id < len(index.venue_records) else None)
+        
+        similarity = backend.venue_similarity() if backend is not None else index.venue_similarity()
+        neighbours = similarity.neighbours(venue_id, limit, city_id)
+        rows = (backend.venues_by_id([i for i, _ in neighbours]) if backend is not None
+                else [index.venue_result(i).to_dict() for i, _ in neighbours])
+        for row, (_, score) in zip(rows, neighbours):
+            row["similarity"] = round(score, 4)
+        return SearchResults(project(rows, fields), total=len(rows))
+    
+    @staticmethod
+    def _find_venue_id(index: CatalogIndex, name: str) -> Optional[int]:
+        """Live venue named `name` (case-insensitive), else the first whose name contains it"""
+        needle = name.strip().lower()
+        live = [i for i in range(len(index.venue_records)) if i not in index.retired_venues]
+        names = {i: index.venue_records[i].get("name", "").lower() for i in live}
+        for matches in (lambda n: n == needle, lambda n: needle in n):
+            for venue_id in live:
+                if matches(names[venue_id]):
+                    return venue_id
+        return None
+    
+    @cached_query(vendor_types=string_tuple, city=lower_or_none, area=lower_or_none, event_type=lower_or_none)
+    def plan_event_package(self,
+                           budget: int,
+                           guest_count: int,
+                           vendor_types: List[str],
+                           city: str = None,
+                           area: str = None,
+                           event_type: str = None,
+                           include_venue: bool = True,
+                           date_from: str = None,
+                           date_to: str = None) -> Dict:
+        """
+        Best rated venue + one vendor per category whose combined starting cost fits the budget
+        
+        Candidates come from one search_batch over the location (venues big enough, suitable
+        for the event and free on the dates). Prices are not pre-filtered by the budget, so
+        cheapest_possible still says what the cheapest package would cost when nothing fits;
+        see package_optimizer.py for costs and the search.
+        
+        Args:
+            budget: Total budget in rupees for everything in the package
+            guest_count: Number of guests (venue capacity, per-person prices)
+            vendor_types: Vendor categories to include, one vendor each (e.g. ['food', 'music_dj'])
+            city, area, event_type, date_from, date_to: As in search_venues
+            include_venue: Pick a venue as well (default True)
+        
+        Returns:
+            {"feasible", "optimal" (search finished), "total_cost", "remaining_budget",
+             "average_rating", "venue": {... "quoted_cost"} or None, "vendors": {vendor_type: {...}},
+             "cheapest_possible": lowest cost of any package, "missing": categories without candidates}
+        """
+        if not budget or budget <= 0:
+            raise ValueError("budget must be positive")
+        if not guest_count or guest_count < 1:
+            raise ValueError("guest_count must be at least 1")
+        vendor_types = list(dict.fromkeys(vendor_types or []))
+        if not vendor_types and not include_venue:
+            raise ValueError("Nothing to plan: give vendor_types or include the venue")
+        
+        window = self._booking_window(date_from, date_to)
+        days = (window[1] - window[0]).days + 1 if window else 1
+        venue_query = None
+        if include_venue:
+            venue_query = {"capacity": guest_count, "event_type": event_type,
+                           "date_from": date_from, "date_to": date_to, "limit": None}
+        batch = self.search_batch(city, area, venue_query, [{"vendor_type": t, "limit": None} for t in vendor_types],
+                                  limit=None)
+        
+        names = (["venue"] if include_venue else []) + vendor_types
+        results = ([batch["venues"]] if include_venue else []) + [batch["vendors"][t] for t in vendor_types]
+        categories = [
+            pareto_options([Option(quoted_cost(r.get("price_range", ""), guest_count, days),
+                                   float(r.get("rating", 0) or 0), r) for r in rows])
+            for rows in results
+        ]
+        choice, optimal = best_combination(categories, budget)
+        
+        plan = {
+            "budget": budget,
+            "guest_count": guest_count,
+            "feasible": choice is not None,
+            "optimal": optimal,
+            "venue": None,
+            "vendors": {},
+            "cheapest_possible": cheapest_cost(categories),
+            "missing": [name for name, options in zip(names, categories) if not options]
+        }
+        if choice is not None:
+            total = sum(option.cost for option in choice)
+            picks = {name: {**dict(option.item), "quoted_cost": option.cost} for name, option in zip(names, choice)}
+            plan["venue"] = picks.pop("venue", None)
+            plan["vendors"] = picks
+            plan["total_cost"] = total
+            plan["remaining_budget"] = budget - total
+            plan["average_rating"] = round(sum(option.rating for option in choice) / len(choice), 2)
+        return plan
     
+    @cached_query(city=lower_or_none, area=lower_or_none, capacity=number_or_none,
+                  budget_min=number_or_none, budget_max=number_or_none,
+                  event_type=lower_or_none, amenities=string_set)
+    def venue_facets(self,
+                     city: str = None,
+                     area: str = None,
+                     capacity: int = None,
+                     budget_min: int = None,
+                     budget_max: int = None,
+                     event_type: str = None,
+                     amenities: List[str] = None) -> Dict:
+        """
+        Count the venues matching search_venues filters by area, price and capacity bucket
+        
+        Answers "12 wedding venues in Bandra, mostly in the ₹50k–1L range" without fetching
+        the venues: the filters become one bitmap (area/event-type/amenity bitmaps ANDed with
+        ranges of the sorted capacity/price indexes) and each facet count is a popcount.
+        
+        Returns:
+            {"total": matches, "areas": [{"area", "area_name", "city", "count"}] (most first),
+             "price_ranges": [{"label", "min", "max", "count"}] by starting price,
+             "capacity_ranges": [{"label", "min", "max", "count"}]}
+        """
+        if self.backend is not None:
+            return self.backend.venue_facets(city, area, capacity, budget_min, budget_max, event_type, amenities)
+        
+        index = self.index
+        return venue_facets(index, venue_matches(index, city, area, capacity, budget_min, budget_max,
+                                                 event_type, amenities))
+    
+    @cached_query(city=lower_or_none, area=lower_or_none, budget_min=number_or_none,
+                  budget_max=number_or_none, speciality=lower_or_none)
+    def vendor_facets(self,
+                      city: str = None,
+                      area: str = None,
+                      vendor_type: str = None,
+                      budget_min: int = None,
+                      budget_max: int = None,
+                      speciality: str = None) -> Dict:
+        """
+        Count the vendors matching search_vendors filters by area, price bucket and vendor type
+        
+        Returns:
+            {"total": matches, "areas": [...] (as venue_facets), "price_ranges": [...] by starting
+             price, "vendor_types": {vendor_type: count} (most first)}
+        """
+        if self.backend is not None:
+            return self.backend.vendor_facets(city, area, vendor_type, budget_min, budget_max, speciality)
+        
+        index = self.index
+        return vendor_facets(index, vendor_matches(index, city, area, vendor_type, budget_min, budget_max, speciality))
+    
+    def venue_coverage(self, 
+                       capacity: int = None, 
+                       budget_min: int = None, 
+                       budget_max: int = None) -> Dict[str, Dict[str, int]]:
+        """
+        Count matching venues for every city and event type in one sweep
+        
+        Answers "what can we offer in every city for every event type" without one
+        search_venues call per pair. Uses NumPy column ops in vectorized mode.
+        
+        Args:
+            capacity: Minimum capacity required
+            budget_min: Minimum budget in rupees
+            budget_max: Maximum budget in rupees
+        
+        Returns:
+            {city_key: {event_type: venue_count}} with zero counts left out
+        """
+        if self.backend is not None:
+            return self.backend.venue_coverage(capacity, budget_min, budget_max)
+        
+        index = self.index
+        coverage = {city_key: {} for city_key in index.city_keys}
+        
+        if self.vectorized:
+            cols = index.numpy_columns()
+            mask = self._vectorized_venue_mask(index, cols, None, None, capacity, budget_min, budget_max)
+            for event_type, bit in index.event_type_bits.items():
+                city_ids = cols.venue_city[mask & cols.event_type_column(bit)]
+                counts = np.bincount(city_ids, minlength=len(index.city_keys))
+                for city_id in np.flatnonzero(counts).tolist():
+                    coverage[index.city_keys[city_id]][event_type] = int(counts[city_id])
+            return coverage
+        
+        event_types = sorted(index.event_type_bits, key=index.event_type_bits.get)
+        candidates, _, _ = self._venue_candidates(index, None, None, capacity, budget_min, budget_max, None, None)
+        for venue_id in candidates:
+            if capacity and index.venue_capacity[venue_id] < capacity:
+                continue
+            if budget_min and index.venue_max_price[venue_id] < budget_min:
+                continue
+            if budget_max and index.venue_min_price[venue_id] > budget_max:
+                continue
+            
+            city_counts = coverage[index.city_keys[index.venue_city[venue_id]]]
+            mask = index.venue_event_mask[venue_id]
+            while mask:
+                bit = (mask & -mask).bit_length() - 1
+                city_counts[event_types[bit]] = city_counts.get(event_types[bit], 0) + 1
+                mask &= mask - 1
+        return coverage
+    
+    @cached_query(preferences=budget_preferences)
     def get_budget_estimate(self, 
                            event_type: str, 
                            guest_count: int, 
@@ -187,94 +1450,43 @@ class EventSearchEngine:
         """
         preferences = preferences or {}
         budget_level = preferences.get("budget_level", "medium")  # low, medium, high
+        return estimate_budget(event_type, guest_count, city, budget_level)
+    
+    @cached_query(event_types=string_tuple, guest_counts=string_tuple, cities=string_tuple,
+                  budget_levels=string_tuple)
+    def get_budget_matrix(self,
+                          event_types: List[str],
+                          guest_counts: List[int],
+                          cities: List[str] = None,
+                          budget_levels: List[str] = None,
+                          breakdown: bool = True) -> Dict:
+        """
+        Budget estimates for every combination of the given scenarios in one call
         
-        # Base cost per person based on city and budget level
-        city_multipliers = {
-            "mumbai": 1.4,
-            "delhi": 1.3,
-            "bangalore": 1.2,
-            "hyderabad": 1.1,
-            "chennai": 1.0,
-            "pune": 1.0,
-            "gurgaon": 1.3,
-            "noida": 1.1,
-            "kolkata": 0.9,
-            "kanpur": 0.8,
-            "ahmedabad": 0.9
-        }
-        
-        budget_multipliers = {
-            "low": 0.6,
-            "medium": 1.0,
-            "high": 1.8
-        }
-        
-        # Base costs per person
-        base_costs = {
-            "wedding": {
-                "venue": 800,
-                "food": 600,
-                "decoration": 400,
-                "flowers": 200,
-                "photography": 300,
-                "music_dj": 150,
-                "transportation": 100
-            },
-            "corporate": {
-                "venue": 500,
-                "food": 400,
-                "decoration": 200,
-                "flowers": 100,
-                "photography": 200,
-                "music_dj": 100,
-                "transportation": 80
-            },
-            "birthday": {
-                "venue": 300,
-                "food": 350,
-                "decoration": 250,
-                "flowers": 100,
-                "photography": 150,
-                "music_dj": 100,
-                "transportation": 50
-            }
-        }
-        
-        # Get base costs for event type
-        event_costs = base_costs.get(event_type, base_costs["birthday"])
-        
-        # Apply multipliers
-        city_mult = city_multipliers.get(city.lower() if city else "delhi", 1.0)
-        budget_mult = budget_multipliers.get(budget_level, 1.0)
-        
-        # Calculate costs
-        breakdown = {}
-        total_cost = 0
-        
-        for category, base_cost in event_costs.items():
-            category_cost = base_cost * guest_count * city_mult * budget_mult
-            breakdown[category] = {
-                "cost": round(category_cost),
-                "per_person": round(base_cost * city_mult * budget_mult)
-            }
-            total_cost += category_cost
-        
-        # Add contingency (15%)
-        contingency = total_cost * 0.15
-        final_total = total_cost + contingency
+        Args:
+            event_types: Event types to price
+            guest_counts: Guest counts to price
+            cities: Cities to compare (default: the single-estimate default city)
+            budget_levels: Budget levels to compare (default: low, medium and high)
+            breakdown: Include the per-category breakdown of every estimate
         
+        Returns:
+            The scenario axes plus "estimates", one get_budget_estimate result per combination,
+            ordered event type -> guest count -> city -> budget level
+        """
+        cities = list(cities) if cities else [None]
+        budget_levels = list(budget_levels) if budget_levels else list(BUDGET_MULTIPLIERS)
+        estimates = budget_scenarios(list(event_types), list(guest_counts), cities, budget_levels, breakdown)
         return {
-            "event_type": event_type,
-            "guest_count": guest_count,
-            "city": city,
-            "budget_level": budget_level,
-            "breakdown": breakdown,
-            "subtotal": round(total_cost),
-            "contingency": round(contingency),
-            "total_estimate": round(final_total),
-            "per_person_average": round(final_total / guest_count)
+            "event_types": list(event_types),
+            "guest_counts": list(guest_counts),
+            "cities": cities,
+            "budget_levels": budget_levels,
+            "estimates": estimates
         }
     
+    @on_snapshot
+    @cached_query()
     def get_recommendations(self, 
                            query: str, 
                            city: str = None, 
@@ -292,35 +1504,11 @@ class EventSearchEngine:
         Returns:
             Comprehensive recommendations
         """
-        # Parse query for keywords
-        query_lower = query.lower()
-        
-        # Detect event type
-        event_types = ["wedding", "corporate", "birthday", "anniversary", "engagement", 
-                      "reception", "conference", "seminar", "party"]
-        detected_event = None
-        for event_type in event_types:
-            if event_type in query_lower:
-                detected_event = event_type
-                break
-        
-        # Detect vendor types
-        vendor_keywords = {
-            "flowers": ["flower", "floral", "bouquet", "decoration"],
-            "food": ["food", "catering", "caterer", "cuisine", "meal"],
-            "music_dj": ["music", "dj", "band", "entertainment"],
-            "photography": ["photo", "photographer", "videography"],
-            "transportation": ["car", "transport", "vehicle", "cab"],
-            "decoration": ["decor", "decoration", "theme"]
-        }
-        
-        detected_vendors = []
-        for vendor_type, keywords in vendor_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                detected_vendors.append(vendor_type)
-        
-        # Extract numbers (for capacity/budget)
-        numbers = re.findall(r'\d+', query)
+        # Parse query for keywords: event type, vendor types, venue cues and numbers in one pass
+        detected = self.keyword_detector.detect(query)
+        detected_event = detected["event_type"]
+        detected_vendors = detected["vendor_types"]
+        numbers = detected["numbers"]
         
         # Determine capacity from query or parameter
         capacity = guest_count
@@ -332,30 +1520,29 @@ class EventSearchEngine:
                     capacity = num_val
                     break
         
-        # Search for venues
-        venues = []
-        if "venue" in query_lower or "hall" in query_lower or detected_event:
-            venues = self.search_venues(
-                city=city,
-                capacity=capacity,
-                budget_max=budget,
-                event_type=detected_event
-            )[:5]  # Top 5 venues
-        
-        # Search for vendors
-        vendors = {}
-        if detected_vendors or "vendor" in query_lower:
+        # Search venues and vendors together: one pass over the location for all categories
+        venue_query = None
+        if detected["venue_cue"] or detected_event:
+            venue_query = {"capacity": capacity, "budget_max": budget, "event_type": detected_event,
+                           "limit": 5}  # Top 5 venues
+        
+        vendor_queries = []
+        if detected_vendors or detected["vendor_cue"]:
             vendor_types_to_search = detected_vendors if detected_vendors else ["flowers", "food", "music_dj", "photography"]
-            
-            for vendor_type in vendor_types_to_search:
-                vendor_results = self.search_vendors(
-                    city=city,
-                    vendor_type=vendor_type,
-                    budget_max=budget
-                )[:3]  # Top 3 per category
-                
-                if vendor_results:
-                    vendors[vendor_type] = vendor_results
+            vendor_queries = [{"vendor_type": vendor_type, "budget_max": budget, "limit": 3}  # Top 3 per category
+                              for vendor_type in vendor_types_to_search]
+        
+        # Whatever the keyword list did not route ("rooftop with live band space") is matched as free text
+        routed = venue_query is not None or bool(vendor_queries)
+        if venue_query is None:
+            venue_query = {"capacity": capacity, "budget_max": budget, "text": query, "limit": 5}
+        
+        batch = self.search_batch(city=city, venue_query=venue_query, vendor_queries=vendor_queries)
+        venues = batch["venues"]
+        vendors = {vendor_type: results for vendor_type, results in batch["vendors"].items() if results}
+        if not routed:
+            for vendor in self.search_vendors(city=city, budget_max=budget, text=query, limit=6):
+                vendors.setdefault(vendor["vendor_type"], []).append(vendor)
         
         # Generate budget estimate
         budget_estimate = None
@@ -377,57 +1564,183 @@ class EventSearchEngine:
             "total_results": len(venues) + sum(len(v) for v in vendors.values())
         }
     
+    def cache_stats(self) -> Dict:
+        """Result cache counters (hits, misses, evictions, hit rate) for sizing the cache"""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
+    
     def _extract_price_range(self, price_str: str) -> Tuple[int, int]:
         """Extract min and max price from price range string"""
-        if not price_str:
-            return (0, 0)
-        
-        # Remove currency symbols and commas
-        clean_str = re.sub(r'[₹,]', '', price_str)
-        
-        # Find numbers
-        numbers = re.findall(r'\d+', clean_str)
-        
-        if len(numbers) >= 2:
-            return (int(numbers[0]), int(numbers[1]))
-        elif len(numbers) == 1:
-            num = int(numbers[0])
-            return (num, num)
-        else:
-            return (0, 0)
+        return extract_price_range(price_str)
     
     def get_city_areas(self, city: str) -> List[str]:
         """Get all areas in a city"""
-        city_key = city.lower()
-        if city_key in self.data["cities"]:
-            return list(self.data["cities"][city_key]["areas"].keys())
+        if self.backend is not None:
+            return self.backend.get_city_areas(city)
+        
+        index = self.index
+        city_id = index.resolve_city(city)
+        if city_id is not None:
+            return [index.area_keys[area_id] for area_id in index.city_areas[city_id]]
         return []
     
+    def resolve_location(self, city: str = None, area: str = None) -> Dict[str, Optional[str]]:
+        """
+        Catalog keys that a (possibly misspelled or aliased) city/area input is searched as
+        
+        Returns:
+            {"city": city key, "area": area key}, None for parts that are unset or unknown
+        """
+        resolver = self.backend.location_resolver() if self.backend is not None else self.index.location_resolver()
+        city_key, area_key = resolver.resolve(city, area)
+        return {"city": city_key, "area": area_key}
+    
     def get_all_cities(self) -> List[str]:
         """Get all available cities"""
-        return [city_data["name"] for city_data in self.data["cities"].values()]
+        if self.backend is not None:
+            return self.backend.get_all_cities()
+        return list(self.index.city_names)
     
     def get_vendor_categories(self) -> List[str]:
         """Get all available vendor categories"""
-        return self.data.get("vendor_categories", [])
+        if self.backend is not None:
+            return self.backend.get_vendor_categories()
+        return self.index.vendor_categories
+
+# Seconds between checks for journal entries written by other worker processes
+JOURNAL_POLL_INTERVAL = 1.0
+
+# Global search engine instance, built on first use (or warmed in the background at app
+# startup) so importing this module never waits for the catalog to load
+_engine: Optional[EventSearchEngine] = None
+_engine_lock = threading.Lock()
+_engine_error: Optional[str] = None
+_warm_thread: Optional[threading.Thread] = None
+
+def _create_search_engine() -> EventSearchEngine:
+    """
+    The engine the environment asks for: SQLite-backed when EVENT_CATALOG_DB is set, attached to
+    the catalog_shm.py loader's shared memory when EVENT_CATALOG_SHM is set, else event_data.json
+    """
+    catalog_db = os.getenv("EVENT_CATALOG_DB")
+    catalog_shm = os.getenv("EVENT_CATALOG_SHM")
+    if catalog_db:
+        engine = EventSearchEngine(backend=SQLiteCatalogBackend(catalog_db))
+    elif catalog_shm:
+        engine = EventSearchEngine(shared_catalog=catalog_shm)
+    else:
+        engine = EventSearchEngine()
+    
+    # Optional hot reload of event_data.json (seconds between file checks, 0 disables);
+    # shared-memory workers always follow the loader's republishes, and JSON catalogs always
+    # follow the mutation journal other workers write to
+    reload_interval = float(os.getenv("EVENT_DATA_RELOAD_INTERVAL", "0") or 0)
+    if catalog_shm and not catalog_db:
+        reload_interval = reload_interval or 2.0
+    if reload_interval > 0:
+        engine.start_auto_reload(reload_interval)
+    elif not catalog_db and not catalog_shm:
+        engine.start_auto_reload(JOURNAL_POLL_INTERVAL, data_file=False)
+    return engine
 
-# Initialize global search engine instance
-search_engine = EventSearchEngine()
+def get_search_engine() -> EventSearchEngine:
+    """The global search engine; the first caller builds it and concurrent callers wait for that build"""
+    global _engine, _engine_error
+    engine = _engine
+    if engine is None:
+        with _engine_lock:
+            if _engine is None:
+                try:
+                    _engine = _create_search_engine()
+                    _engine_error = None
+                except Exception as e:
+                    _engine_error = str(e)
+                    raise
+            engine = _engine
+    return engine
+
+def warm_search_engine() -> Optional[threading.Thread]:
+    """
+    Build the global engine in a daemon thread (call at app startup)
+    
+    Returns:
+        The warming thread, or None when the engine is already built
+    """
+    global _warm_thread
+    with _engine_lock:
+        if _engine is not None:
+            return None
+        if _warm_thread is None or not _warm_thread.is_alive():
+            def warm():
+                try:
+                    get_search_engine()
+                    print("✅ Event search engine ready")
+                except Exception as e:
+                    print(f"⚠️ Event search engine failed to load: {e}")
+            _warm_thread = threading.Thread(target=warm, name="search-engine-warmup", daemon=True)
+            _warm_thread.start()
+        return _warm_thread
+
+def search_engine_status() -> Dict:
+    """Readiness of the global engine for health checks (never triggers a build)"""
+    engine = _engine
+    return {
+        "ready": engine is not None,
+        "warming": engine is None and _warm_thread is not None and _warm_thread.is_alive(),
+        "error": _engine_error if engine is None else None,
+        "catalog_version": str(engine.catalog_version) if engine is not None else None
+    }
+
+def __getattr__(name: str):
+    """`from event_search import search_engine` still works (and builds the engine on the spot)"""
+    if name == "search_engine":
+        return get_search_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def search_venues_api(city: str = None, area: str = None, capacity: int = None, 
-                     budget_min: int = None, budget_max: int = None, event_type: str = None):
+                     budget_min: int = None, budget_max: int = None, event_type: str = None,
+                     amenities: List[str] = None, limit: int = None, cursor: str = None,
+                     fields: List[str] = None, rank_by: str = "rating", text: str = None):
     """API wrapper for venue search"""
-    return search_engine.search_venues(city, area, capacity, budget_min, budget_max, event_type)
+    return get_search_engine().search_venues(city, area, capacity, budget_min, budget_max, event_type, amenities,
+                                       limit, cursor, fields, rank_by, text=text)
 
 def search_vendors_api(city: str = None, area: str = None, vendor_type: str = None,
-                      budget_min: int = None, budget_max: int = None, speciality: str = None):
+                      budget_min: int = None, budget_max: int = None, speciality: str = None,
+                      limit: int = None, cursor: str = None, fields: List[str] = None, text: str = None):
     """API wrapper for vendor search"""
-    return search_engine.search_vendors(city, area, vendor_type, budget_min, budget_max, speciality)
+    return get_search_engine().search_vendors(city, area, vendor_type, budget_min, budget_max, speciality,
+                                        limit, cursor, fields, text)
+
+def search_batch_api(city: str = None, area: str = None, venue_query: Dict = None,
+                     vendor_queries: List[Dict] = None, limit: int = 5):
+    """API wrapper for batched venue + vendor search"""
+    return get_search_engine().search_batch(city, area, venue_query, vendor_queries, limit)
+
+def similar_venues_api(venue, limit: int = 5, city: str = None, same_city: bool = True):
+    """API wrapper for "more like this" venue recommendations"""
+    return get_search_engine().similar_venues(venue, limit, city, same_city)
+
+def plan_event_package_api(budget: int, guest_count: int, vendor_types: List[str], **options):
+    """API wrapper for the budget-constrained package optimizer"""
+    return get_search_engine().plan_event_package(budget, guest_count, vendor_types, **options)
+
+def get_facets_api(target: str = "venues", **filters):
+    """API wrapper for facet counts of venue or vendor matches"""
+    if target == "vendors":
+        return get_search_engine().vendor_facets(**filters)
+    return get_search_engine().venue_facets(**filters)
 
 def get_recommendations_api(query: str, city: str = None, budget: int = None, guest_count: int = None):
     """API wrapper for intelligent recommendations"""
-    return search_engine.get_recommendations(query, city, budget, guest_count)
+    return get_search_engine().get_recommendations(query, city, budget, guest_count)
 
 def get_budget_estimate_api(event_type: str, guest_count: int, city: str = None, preferences: Dict = None):
     """API wrapper for budget estimation"""
-    return search_engine.get_budget_estimate(event_type, guest_count, city, preferences)
\ No newline at end of file
+    return get_search_engine().get_budget_estimate(event_type, guest_count, city, preferences)
+
+def get_budget_matrix_api(event_types: List[str], guest_counts: List[int], cities: List[str] = None,
+                          budget_levels: List[str] = None, breakdown: bool = True):
+    """API wrapper for batch budget estimation"""
+    return get_search_engine().get_budget_matrix(event_types, guest_counts, cities, budget_levels, breakdown)
\ No newline at end of file
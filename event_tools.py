@@ -13,7 +13,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from event_search import search_engine
+    from event_search import get_search_engine
     SEARCH_AVAILABLE = True
 except ImportError:
     SEARCH_AVAILABLE = False
@@ -22,6 +22,12 @@ except ImportError:
 # Function registry for LLM tools
 AVAILABLE_FUNCTIONS = {}
 
+# Default fields returned per result; tools accept a narrower `fields` list to shrink the prompt
+VENUE_FIELDS = ["name", "address", "city", "area", "capacity", "price_range", "rating", "contact",
+                "amenities", "suitable_for"]
+VENDOR_FIELDS = ["name", "speciality", "city", "area", "price_range", "rating", "contact",
+                 "services", "experience_years"]
+
 def llm_tool(name: str, description: str, parameters: Dict[str, Any]):
     """
     Decorator to register functions as LLM tools
@@ -73,6 +79,44 @@ def llm_tool(name: str, description: str, parameters: Dict[str, Any]):
                 "type": "string",
                 "description": "Type of event",
                 "enum": ["wedding", "corporate", "birthday", "anniversary", "engagement", "reception"]
+            },
+            "amenities": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Amenities the venue must offer (e.g., Bridal Room, Valet Parking)"
+            },
+            "date_from": {
+                "type": "string",
+                "description": "Event date (YYYY-MM-DD); only venues free that day are returned"
+            },
+            "date_to": {
+                "type": "string",
+                "description": "Last day of a multi-day event (YYYY-MM-DD, optional)"
+            },
+            "text": {
+                "type": "string",
+                "description": "Free-text wishes matched against venue names, addresses and amenities (e.g., 'rooftop with live band near the metro'); results are then ranked by how well they match"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Number of top venues to return (default 5)",
+                "minimum": 1,
+                "maximum": 20
+            },
+            "sort_by": {
+                "type": "string",
+                "description": "relevance: best fit for the capacity and budget, weighted by rating; rating: highest rated first",
+                "enum": ["relevance", "rating"],
+                "default": "relevance"
+            },
+            "cursor": {
+                "type": "string",
+                "description": "next_cursor from a previous search_venues result, to get the next page"
+            },
+            "fields": {
+                "type": "array",
+                "items": {"type": "string", "enum": VENUE_FIELDS},
+                "description": "Only return these venue fields (default: all listed fields)"
             }
         },
         "required": []
@@ -80,51 +124,108 @@ def llm_tool(name: str, description: str, parameters: Dict[str, Any]):
 )
 def search_venues(city: Optional[str] = None, area: Optional[str] = None, 
                  capacity: Optional[int] = None, budget_max: Optional[int] = None, 
-                 event_type: Optional[str] = None) -> Dict:
+                 event_type: Optional[str] = None, amenities: Optional[List[str]] = None,
+                 limit: int = 5, cursor: Optional[str] = None, fields: Optional[List[str]] = None,
+                 sort_by: str = "relevance", date_from: Optional[str] = None, date_to: Optional[str] = None,
+                 text: Optional[str] = None) -> Dict:
     """Search for venues matching the criteria"""
     if not SEARCH_AVAILABLE:
         return {"error": "Search system not available"}
     
     try:
-        results = search_engine.search_venues(
+        # Results come back already projected to the LLM-facing fields
+        results = get_search_engine().search_venues(
             city=city,
             area=area, 
             capacity=capacity,
             budget_max=budget_max,
-            event_type=event_type
+            event_type=event_type,
+            amenities=amenities,
+            limit=limit,
+            cursor=cursor,
+            fields=[f for f in fields if f in VENUE_FIELDS] if fields else VENUE_FIELDS,
+            rank_by=sort_by,
+            date_from=date_from,
+            date_to=date_to,
+            text=text
         )
         
-        # Format results for LLM
-        formatted_results = []
-        for venue in results[:5]:  # Top 5 results
-            formatted_results.append({
-                "name": venue["name"],
-                "address": venue["address"],
-                "city": venue["city"],
-                "area": venue["area"],
-                "capacity": venue["capacity"],
-                "price_range": venue["price_range"],
-                "rating": venue["rating"],
-                "contact": venue["contact"],
-                "amenities": venue.get("amenities", []),
-                "suitable_for": venue.get("suitable_for", [])
-            })
-        
         return {
             "success": True,
-            "total_found": len(results),
-            "venues": formatted_results,
+            "total_found": results.total,
+            "venues": list(results),
+            "next_cursor": results.next_cursor,
             "search_criteria": {
                 "city": city,
                 "area": area,
                 "capacity": capacity,
                 "budget_max": budget_max,
-                "event_type": event_type
-            }
+                "event_type": event_type,
+                "amenities": amenities,
+                "date_from": date_from,
+                "date_to": date_to,
+                "text": text
+            },
+            # What misspelled or aliased locations were searched as (e.g. "bandraa" -> "bandra")
+            "matched_location": get_search_engine().resolve_location(city, area) if city or area else None
         }
     except Exception as e:
         return {"error": f"Venue search failed: {str(e)}"}
 
+@llm_tool(
+    name="find_similar_venues",
+    description="Find venues similar to one the user liked (amenities, event types, price, capacity and rating), e.g. 'show me more places like Metro Convention Center'",
+    parameters={
+        "type": "object",
+        "properties": {
+            "venue_name": {
+                "type": "string",
+                "description": "Name of the venue the user liked (as returned by search_venues)"
+            },
+            "city": {
+                "type": "string",
+                "description": "Look in this city instead of the liked venue's city",
+                "enum": ["delhi", "mumbai", "bangalore", "chennai", "hyderabad", "pune", "kolkata", "gurgaon", "noida", "kanpur", "ahmedabad"]
+            },
+            "any_city": {
+                "type": "boolean",
+                "description": "Look in every city (default false: same city as the liked venue)",
+                "default": False
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Number of similar venues to return (default 5)",
+                "minimum": 1,
+                "maximum": 20
+            }
+        },
+        "required": ["venue_name"]
+    }
+)
+def find_similar_venues(venue_name: str, city: Optional[str] = None, any_city: bool = False, limit: int = 5) -> Dict:
+    """Find venues similar to a named venue"""
+    if not SEARCH_AVAILABLE:
+        return {"error": "Search system not available"}
+    
+    try:
+        results = get_search_engine().similar_venues(
+            venue=venue_name,
+            limit=limit,
+            city=city,
+            same_city=not any_city,
+            fields=VENUE_FIELDS + ["similarity"]
+        )
+        return {
+            "success": True,
+            "venue_name": venue_name,
+            "similar_venues": list(results),
+            "total_found": results.total
+        }
+    except KeyError:
+        return {"error": f"No venue named '{venue_name}' found"}
+    except Exception as e:
+        return {"error": f"Similar venue search failed: {str(e)}"}
+
 @llm_tool(
     name="search_vendors",
     description="Search for event vendors like caterers, photographers, decorators, etc.",
@@ -148,55 +249,373 @@ def search_venues(city: Optional[str] = None, area: Optional[str] = None,
             "speciality": {
                 "type": "string",
                 "description": "Vendor speciality (e.g., wedding, corporate, traditional)"
+            },
+            "text": {
+                "type": "string",
+                "description": "Free-text wishes matched against vendor names, specialities and services (e.g., 'live pasta counter'); results are then ranked by how well they match"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Number of top-rated vendors to return (default 5)",
+                "minimum": 1,
+                "maximum": 20
+            },
+            "cursor": {
+                "type": "string",
+                "description": "next_cursor from a previous search_vendors result, to get the next page"
+            },
+            "fields": {
+                "type": "array",
+                "items": {"type": "string", "enum": VENDOR_FIELDS},
+                "description": "Only return these vendor fields (default: all listed fields)"
             }
         },
         "required": ["vendor_type"]
     }
 )
 def search_vendors(vendor_type: str, city: Optional[str] = None, 
-                  budget_max: Optional[int] = None, speciality: Optional[str] = None) -> Dict:
+                  budget_max: Optional[int] = None, speciality: Optional[str] = None,
+                  limit: int = 5, cursor: Optional[str] = None, fields: Optional[List[str]] = None,
+                  text: Optional[str] = None) -> Dict:
     """Search for vendors matching the criteria"""
     if not SEARCH_AVAILABLE:
         return {"error": "Search system not available"}
     
     try:
-        results = search_engine.search_vendors(
+        # Results come back already projected to the LLM-facing fields
+        results = get_search_engine().search_vendors(
             city=city,
             vendor_type=vendor_type,
             budget_max=budget_max,
-            speciality=speciality
+            speciality=speciality,
+            limit=limit,
+            cursor=cursor,
+            fields=[f for f in fields if f in VENDOR_FIELDS] if fields else VENDOR_FIELDS,
+            text=text
         )
         
-        # Format results for LLM
-        formatted_results = []
-        for vendor in results[:5]:  # Top 5 results
-            formatted_results.append({
-                "name": vendor["name"],
-                "speciality": vendor["speciality"],
-                "city": vendor["city"],
-                "area": vendor["area"],
-                "price_range": vendor["price_range"],
-                "rating": vendor["rating"],
-                "contact": vendor["contact"],
-                "services": vendor.get("services", []),
-                "experience_years": vendor.get("experience_years", 0)
-            })
-        
         return {
             "success": True,
-            "total_found": len(results),
+            "total_found": results.total,
             "vendor_type": vendor_type,
-            "vendors": formatted_results,
+            "vendors": list(results),
+            "next_cursor": results.next_cursor,
             "search_criteria": {
                 "city": city,
                 "vendor_type": vendor_type,
                 "budget_max": budget_max,
-                "speciality": speciality
+                "speciality": speciality,
+                "text": text
             }
         }
     except Exception as e:
         return {"error": f"Vendor search failed: {str(e)}"}
 
+@llm_tool(
+    name="get_search_facets",
+    description="Count matching venues or vendors by area, price range, capacity range and vendor type, e.g. to tell the user where the options are before listing them",
+    parameters={
+        "type": "object",
+        "properties": {
+            "target": {
+                "type": "string",
+                "description": "Count venues or vendors",
+                "enum": ["venues", "vendors"],
+                "default": "venues"
+            },
+            "city": {
+                "type": "string",
+                "description": "City name",
+                "enum": ["delhi", "mumbai", "bangalore", "chennai", "hyderabad", "pune", "kolkata", "gurgaon", "noida", "kanpur", "ahmedabad"]
+            },
+            "area": {
+                "type": "string",
+                "description": "Specific area within the city (optional)"
+            },
+            "capacity": {
+                "type": "integer",
+                "description": "Minimum number of guests (venues only)"
+            },
+            "budget_max": {
+                "type": "integer",
+                "description": "Maximum budget in rupees"
+            },
+            "event_type": {
+                "type": "string",
+                "description": "Type of event (venues only)",
+                "enum": ["wedding", "corporate", "birthday", "anniversary", "engagement", "reception"]
+            },
+            "vendor_type": {
+                "type": "string",
+                "description": "Type of vendor (vendors only; leave out to count every type)",
+                "enum": ["flowers", "decoration", "food", "photography", "music_dj", "transportation", "makeup_artist", "tent_house"]
+            },
+            "speciality": {
+                "type": "string",
+                "description": "Vendor speciality (vendors only)"
+            }
+        },
+        "required": []
+    }
+)
+def get_search_facets(target: str = "venues", city: Optional[str] = None, area: Optional[str] = None,
+                      capacity: Optional[int] = None, budget_max: Optional[int] = None,
+                      event_type: Optional[str] = None, vendor_type: Optional[str] = None,
+                      speciality: Optional[str] = None) -> Dict:
+    """Count venue/vendor matches per area, price range, capacity range and vendor type"""
+    if not SEARCH_AVAILABLE:
+        return {"error": "Search system not available"}
+    
+    try:
+        if target == "vendors":
+            facets = get_search_engine().vendor_facets(
+                city=city,
+                area=area,
+                vendor_type=vendor_type,
+                budget_max=budget_max,
+                speciality=speciality
+            )
+        else:
+            facets = get_search_engine().venue_facets(
+                city=city,
+                area=area,
+                capacity=capacity,
+                budget_max=budget_max,
+                event_type=event_type
+            )
+        
+        # Leave out empty ranges so the model only reads about options that exist
+        return {
+            "success": True,
+            "target": target,
+            "total_found": facets["total"],
+            **{name: [bucket for bucket in value if bucket["count"]] if name.endswith("_ranges") else value
+               for name, value in facets.items() if name != "total"}
+        }
+    except Exception as e:
+        return {"error": f"Facet search failed: {str(e)}"}
+
+@llm_tool(
+    name="search_event_package",
+    description="Find a venue and several vendor categories for one event in a single search (e.g., venue + caterer + photographer + decorator)",
+    parameters={
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "City name",
+                "enum": ["delhi", "mumbai", "bangalore", "chennai", "hyderabad", "pune", "kolkata", "gurgaon", "noida", "kanpur", "ahmedabad"]
+            },
+            "area": {
+                "type": "string",
+                "description": "Specific area within the city (optional)"
+            },
+            "include_venue": {
+                "type": "boolean",
+                "description": "Also search for venues (default true)",
+                "default": True
+            },
+            "capacity": {
+                "type": "integer",
+                "description": "Minimum number of people the venue should accommodate"
+            },
+            "venue_budget_max": {
+                "type": "integer",
+                "description": "Maximum venue budget in rupees"
+            },
+            "event_type": {
+                "type": "string",
+                "description": "Type of event",
+                "enum": ["wedding", "corporate", "birthday", "anniversary", "engagement", "reception"]
+            },
+            "date_from": {
+                "type": "string",
+                "description": "Event date (YYYY-MM-DD); only venues free that day are returned"
+            },
+            "date_to": {
+                "type": "string",
+                "description": "Last day of a multi-day event (YYYY-MM-DD, optional)"
+            },
+            "vendors": {
+                "type": "array",
+                "description": "Vendor categories to find, each with its own optional budget and speciality",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "vendor_type": {
+                            "type": "string",
+                            "enum": ["flowers", "decoration", "food", "photography", "music_dj", "transportation", "makeup_artist", "tent_house"]
+                        },
+                        "budget_max": {"type": "integer", "description": "Maximum budget in rupees"},
+                        "speciality": {"type": "string", "description": "Vendor speciality (e.g., wedding, corporate)"}
+                    },
+                    "required": ["vendor_type"]
+                }
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Number of top-rated results per category (default 3)",
+                "minimum": 1,
+                "maximum": 10
+            }
+        },
+        "required": ["vendors"]
+    }
+)
+def search_event_package(vendors: List[Dict[str, Any]], city: Optional[str] = None, area: Optional[str] = None,
+                         include_venue: bool = True, capacity: Optional[int] = None,
+                         venue_budget_max: Optional[int] = None, event_type: Optional[str] = None,
+                         date_from: Optional[str] = None, date_to: Optional[str] = None, limit: int = 3) -> Dict:
+    """Search a venue and several vendor categories in one round trip"""
+    if not SEARCH_AVAILABLE:
+        return {"error": "Search system not available"}
+    
+    try:
+        venue_query = None
+        if include_venue:
+            venue_query = {"capacity": capacity, "budget_max": venue_budget_max, "event_type": event_type,
+                           "rank_by": "relevance", "date_from": date_from, "date_to": date_to}
+        vendor_queries = [
+            {"vendor_type": v["vendor_type"], "budget_max": v.get("budget_max"), "speciality": v.get("speciality")}
+            for v in vendors
+        ]
+        batch = get_search_engine().search_batch(
+            city=city,
+            area=area,
+            venue_query=venue_query,
+            vendor_queries=vendor_queries,
+            limit=limit
+        )
+        
+        # Format results for LLM
+        result = {"success": True, "city": city, "area": area, "vendors": {}}
+        if batch["venues"] is not None:
+            result["venues"] = [{
+                "name": venue["name"],
+                "address": venue["address"],
+                "area": venue["area"],
+                "capacity": venue["capacity"],
+                "price_range": venue["price_range"],
+                "rating": venue["rating"],
+                "contact": venue["contact"]
+            } for venue in batch["venues"]]
+            result["total_venues_found"] = batch["venues"].total
+        
+        for vendor_type, results in batch["vendors"].items():
+            result["vendors"][vendor_type] = {
+                "total_found": results.total,
+                "top": [{
+                    "name": vendor["name"],
+                    "speciality": vendor["speciality"],
+                    "area": vendor["area"],
+                    "price_range": vendor["price_range"],
+                    "rating": vendor["rating"],
+                    "contact": vendor["contact"]
+                } for vendor in results]
+            }
+        
+        return result
+    except Exception as e:
+        return {"error": f"Package search failed: {str(e)}"}
+
+@llm_tool(
+    name="plan_event_package",
+    description="Pick the best rated venue plus one vendor per category that together fit a total budget, e.g. 'a venue plus catering, decor and a DJ under 3 lakh for 150 guests'",
+    parameters={
+        "type": "object",
+        "properties": {
+            "budget": {
+                "type": "integer",
+                "description": "Total budget in rupees for the whole package"
+            },
+            "guest_count": {
+                "type": "integer",
+                "description": "Number of guests",
+                "minimum": 1
+            },
+            "vendor_types": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["flowers", "decoration", "food", "photography", "music_dj", "transportation", "makeup_artist", "tent_house"]},
+                "description": "Vendor categories to include, one vendor each"
+            },
+            "city": {
+                "type": "string",
+                "description": "City name",
+                "enum": ["delhi", "mumbai", "bangalore", "chennai", "hyderabad", "pune", "kolkata", "gurgaon", "noida", "kanpur", "ahmedabad"]
+            },
+            "area": {
+                "type": "string",
+                "description": "Specific area within the city (optional)"
+            },
+            "event_type": {
+                "type": "string",
+                "description": "Type of event",
+                "enum": ["wedding", "corporate", "birthday", "anniversary", "engagement", "reception"]
+            },
+            "include_venue": {
+                "type": "boolean",
+                "description": "Include a venue in the package (default true)",
+                "default": True
+            },
+            "date_from": {
+                "type": "string",
+                "description": "Event date (YYYY-MM-DD); only venues free that day are considered"
+            },
+            "date_to": {
+                "type": "string",
+                "description": "Last day of a multi-day event (YYYY-MM-DD, optional)"
+            }
+        },
+        "required": ["budget", "guest_count", "vendor_types"]
+    }
+)
+def plan_event_package(budget: int, guest_count: int, vendor_types: List[str], city: Optional[str] = None,
+                       area: Optional[str] = None, event_type: Optional[str] = None, include_venue: bool = True,
+                       date_from: Optional[str] = None, date_to: Optional[str] = None) -> Dict:
+    """Choose the best rated venue + vendors combination within the budget"""
+    if not SEARCH_AVAILABLE:
+        return {"error": "Search system not available"}
+    
+    try:
+        plan = get_search_engine().plan_event_package(
+            budget=budget,
+            guest_count=guest_count,
+            vendor_types=vendor_types,
+            city=city,
+            area=area,
+            event_type=event_type,
+            include_venue=include_venue,
+            date_from=date_from,
+            date_to=date_to
+        )
+        
+        def pick(item, fields):
+            return {**{f: item.get(f) for f in fields}, "quoted_cost": item["quoted_cost"]}
+        
+        result = {
+            "success": True,
+            "feasible": plan["feasible"],
+            "budget": budget,
+            "guest_count": guest_count
+        }
+        if plan["feasible"]:
+            result.update({
+                "total_cost": plan["total_cost"],
+                "remaining_budget": plan["remaining_budget"],
+                "average_rating": plan["average_rating"],
+                "venue": pick(plan["venue"], ["name", "area", "capacity", "price_range", "rating", "contact"])
+                         if plan["venue"] else None,
+                "vendors": {vendor_type: pick(vendor, ["name", "area", "price_range", "rating", "contact"])
+                            for vendor_type, vendor in plan["vendors"].items()}
+            })
+        else:
+            # Tell the model what the cheapest package would cost (or which categories have nothing)
+            result["cheapest_possible"] = plan["cheapest_possible"]
+            result["missing"] = plan["missing"]
+        return result
+    except Exception as e:
+        return {"error": f"Package planning failed: {str(e)}"}
+
 @llm_tool(
     name="estimate_budget",
     description="Calculate detailed budget estimate for an event",
@@ -236,7 +655,7 @@ def estimate_budget(event_type: str, guest_count: int, city: Optional[str] = Non
     
     try:
         preferences = {"budget_level": budget_level}
-        result = search_engine.get_budget_estimate(
+        result = get_search_engine().get_budget_estimate(
             event_type=event_type,
             guest_count=guest_count,
             city=city,
@@ -258,6 +677,79 @@ def estimate_budget(event_type: str, guest_count: int, city: Optional[str] = Non
     except Exception as e:
         return {"error": f"Budget estimation failed: {str(e)}"}
 
+@llm_tool(
+    name="compare_budget_estimates",
+    description="Compare budget estimates across event types, guest counts, cities and budget levels in one call, e.g. low/medium/high in Delhi vs Gurgaon",
+    parameters={
+        "type": "object",
+        "properties": {
+            "event_types": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["wedding", "corporate", "birthday", "anniversary", "engagement"]},
+                "description": "Event types to compare"
+            },
+            "guest_counts": {
+                "type": "array",
+                "items": {"type": "integer", "minimum": 1},
+                "description": "Guest counts to compare"
+            },
+            "cities": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["delhi", "mumbai", "bangalore", "chennai", "hyderabad", "pune", "kolkata", "gurgaon", "noida", "kanpur", "ahmedabad"]},
+                "description": "Cities to compare"
+            },
+            "budget_levels": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["low", "medium", "high"]},
+                "description": "Budget levels to compare (default: low, medium and high)"
+            },
+            "include_breakdown": {
+                "type": "boolean",
+                "description": "Include the per-category breakdown of every estimate",
+                "default": False
+            }
+        },
+        "required": ["event_types", "guest_counts"]
+    }
+)
+def compare_budget_estimates(event_types: List[str], guest_counts: List[int], cities: Optional[List[str]] = None,
+                             budget_levels: Optional[List[str]] = None, include_breakdown: bool = False) -> Dict:
+    """Generate budget estimates for every combination of the requested scenarios"""
+    if not SEARCH_AVAILABLE:
+        return {"error": "Search system not available"}
+    
+    try:
+        result = get_search_engine().get_budget_matrix(
+            event_types=event_types,
+            guest_counts=guest_counts,
+            cities=cities,
+            budget_levels=budget_levels,
+            breakdown=include_breakdown
+        )
+        
+        return {
+            "success": True,
+            "event_types": result["event_types"],
+            "guest_counts": result["guest_counts"],
+            "cities": result["cities"],
+            "budget_levels": result["budget_levels"],
+            "scenarios": [
+                {
+                    "event_type": e["event_type"],
+                    "guest_count": e["guest_count"],
+                    "city": e["city"],
+                    "budget_level": e["budget_level"],
+                    "total_estimate": e["total_estimate"],
+                    "per_person_cost": e["per_person_average"],
+                    **({"breakdown": e["breakdown"]} if include_breakdown else {})
+                }
+                for e in result["estimates"]
+            ],
+            "total_scenarios": len(result["estimates"])
+        }
+    except Exception as e:
+        return {"error": f"Budget comparison failed: {str(e)}"}
+
 @llm_tool(
     name="get_recommendations",
     description="Get intelligent recommendations based on natural language query",
@@ -292,7 +784,7 @@ def get_recommendations(query: str, city: Optional[str] = None,
         return {"error": "Search system not available"}
     
     try:
-        result = search_engine.get_recommendations(
+        result = get_search_engine().get_recommendations(
             query=query,
             city=city,
             budget=budget,
@@ -304,8 +796,8 @@ def get_recommendations(query: str, city: Optional[str] = None,
             "query": result["query"],
             "detected_event_type": result.get("detected_event_type"),
             "capacity": result.get("capacity"),
-            "venues": result.get("venues", [])[:3],  # Top 3 venues
-            "vendors": {k: v[:2] for k, v in result.get("vendors", {}).items()},  # Top 2 per vendor type
+            "venues": [dict(v) for v in result.get("venues", [])[:3]],  # Top 3 venues
+            "vendors": {k: [dict(r) for r in v[:2]] for k, v in result.get("vendors", {}).items()},  # Top 2 per vendor type
             "budget_estimate": result.get("budget_estimate"),
             "total_results": result.get("total_results", 0)
         }
@@ -333,7 +825,7 @@ def get_cities_and_areas(city: Optional[str] = None) -> Dict:
     
     try:
         if city:
-            areas = search_engine.get_city_areas(city)
+            areas = get_search_engine().get_city_areas(city)
             return {
                 "success": True,
                 "city": city,
@@ -341,7 +833,7 @@ def get_cities_and_areas(city: Optional[str] = None) -> Dict:
                 "total_areas": len(areas)
             }
         else:
-            cities = search_engine.get_all_cities()
+            cities = get_search_engine().get_all_cities()
             return {
                 "success": True,
                 "cities": cities,
@@ -384,8 +876,13 @@ __all__ = [
     'call_function', 
     'AVAILABLE_FUNCTIONS',
     'search_venues',
+    'find_similar_venues',
     'search_vendors', 
+    'get_search_facets',
+    'search_event_package',
+    'plan_event_package',
     'estimate_budget',
+    'compare_budget_estimates',
     'get_recommendations',
     'get_cities_and_areas'
 ]
\ No newline at end of file
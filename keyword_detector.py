@@ -0,0 +1,155 @@
+"""
+Query Keyword Detector
+Single-pass Aho-Corasick matcher that pulls event types, vendor categories, venue cues and
+numbers out of a natural language query
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Keyword tables: the first event type (in table order) found in the query wins,
+# vendor categories are reported in table order. Add synonyms to the keyword lists.
+EVENT_TYPE_KEYWORDS: Dict[str, List[str]] = {
+    "wedding": ["wedding"],
+    "corporate": ["corporate"],
+    "birthday": ["birthday"],
+    "anniversary": ["anniversary"],
+    "engagement": ["engagement"],
+    "reception": ["reception"],
+    "conference": ["conference"],
+    "seminar": ["seminar"],
+    "party": ["party"]
+}
+
+VENDOR_KEYWORDS: Dict[str, List[str]] = {
+    "flowers": ["flower", "floral", "bouquet", "decoration"],
+    "food": ["food", "catering", "caterer", "cuisine", "meal"],
+    "music_dj": ["music", "dj", "band", "entertainment"],
+    "photography": ["photo", "photographer", "videography"],
+    "transportation": ["car", "transport", "vehicle", "cab"],
+    "decoration": ["decor", "decoration", "theme"]
+}
+
+VENUE_CUES: List[str] = ["venue", "hall"]
+VENDOR_CUES: List[str] = ["vendor"]
+
+EVENT, VENDOR, VENUE_CUE, VENDOR_CUE = range(4)
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over lowercase keywords
+
+    Every keyword carries a tag. Walking the text through goto/fail reaches, at each position,
+    a state whose output holds the tags of every keyword ending there (overlaps included),
+    so one walk answers `keyword in text` for all keywords at once.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, object]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple] = [()]
+
+        for keyword, tag in keywords:
+            state = 0
+            for ch in keyword.lower():
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = nxt
+            if keyword and tag not in self.output[state]:
+                self.output[state] += (tag,)
+
+        # Breadth-first fail links; each state's output includes its fail chain's outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(ch, 0)
+                self.output[nxt] += tuple(t for t in self.output[self.fail[nxt]] if t not in self.output[nxt])
+
+class QueryKeywordDetector:
+    """
+    Detects everything get_recommendations needs from a query in one pass
+
+    Built once from keyword tables; the tables can grow (e.g. Hindi/Hinglish synonyms)
+    without adding passes over the query.
+    """
+
+    def __init__(self,
+                 event_keywords: Dict[str, List[str]] = None,
+                 vendor_keywords: Dict[str, List[str]] = None,
+                 venue_cues: List[str] = None,
+                 vendor_cues: List[str] = None):
+        self.event_keywords = event_keywords if event_keywords is not None else EVENT_TYPE_KEYWORDS
+        self.vendor_keywords = vendor_keywords if vendor_keywords is not None else VENDOR_KEYWORDS
+        self.event_priority = {event: i for i, event in enumerate(self.event_keywords)}
+        self.vendor_order = {vendor: i for i, vendor in enumerate(self.vendor_keywords)}
+
+        keywords = []
+        for event_type, words in self.event_keywords.items():
+            keywords += [(w, (EVENT, event_type)) for w in words]
+        for vendor_type, words in self.vendor_keywords.items():
+            keywords += [(w, (VENDOR, vendor_type)) for w in words]
+        keywords += [(w, (VENUE_CUE, None)) for w in (venue_cues if venue_cues is not None else VENUE_CUES)]
+        keywords += [(w, (VENDOR_CUE, None)) for w in (vendor_cues if vendor_cues is not None else VENDOR_CUES)]
+        self.automaton = KeywordAutomaton(keywords)
+
+    def detect(self, query: str) -> Dict:
+        """
+        Scan the query once
+
+        Returns:
+            {"event_type": first event type by table order or None,
+             "vendor_types": matched vendor categories in table order,
+             "venue_cue": bool, "vendor_cue": bool,
+             "numbers": digit runs in query order (as strings)}
+        """
+        automaton = self.automaton
+        goto, fail, output = automaton.goto, automaton.fail, automaton.output
+        event_type: Optional[str] = None
+        vendor_types = set()
+        venue_cue = vendor_cue = False
+        numbers = []
+        digits = []
+
+        state = 0
+        for ch in query.lower():
+            if ch.isdecimal():
+                digits.append(ch)
+            elif digits:
+                numbers.append("".join(digits))
+                digits = []
+
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for kind, label in output[state]:
+                if kind == EVENT:
+                    if event_type is None or self.event_priority[label] < self.event_priority[event_type]:
+                        event_type = label
+                elif kind == VENDOR:
+                    vendor_types.add(label)
+                elif kind == VENUE_CUE:
+                    venue_cue = True
+                else:
+                    vendor_cue = True
+        if digits:
+            numbers.append("".join(digits))
+
+        return {
+            "event_type": event_type,
+            "vendor_types": sorted(vendor_types, key=self.vendor_order.__getitem__),
+            "venue_cue": venue_cue,
+            "vendor_cue": vendor_cue,
+            "numbers": numbers
+        }
+
+default_detector = QueryKeywordDetector()
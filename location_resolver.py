@@ -0,0 +1,228 @@
+"""
+Location Resolver
+Maps misspelled, transliterated or ASR-mangled city/area names ("bengaluru", "conaught place",
+"bandraa") to catalog keys, so a search does not come back empty over a spelling
+
+Every city and area is indexed under its key, its display name and its aliases, normalized to
+lowercase letters and digits with repeated letters collapsed ("Connaught Place" -> "conaughtplace").
+An exact normalized match is one dict lookup; otherwise the input's character trigrams are looked
+up in a trigram -> names posting table, and the names sharing the most trigrams are scored by
+Dice overlap or, for short swaps like "dehli", by edit distance. The best name wins if it is
+similar enough and only a typo away: at most one edit for names up to SHORT_NAME_LENGTH
+characters, two for longer ones, so other real places ("ahmedabad", "navi mumbai") stay unknown
+instead of snapping to a catalog city. Both tables are built once; a catalog mutation that adds a city or area only
+adds that entry's names and trigrams (add_city / add_area).
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Other spellings and old names -> city key
+CITY_ALIASES: Dict[str, str] = {
+    "bengaluru": "bangalore",
+    "bengalooru": "bangalore",
+    "blr": "bangalore",
+    "bombay": "mumbai",
+    "new delhi": "delhi",
+    "dilli": "delhi",
+    "ncr": "delhi",
+    "madras": "chennai",
+    "calcutta": "kolkata",
+    "gurugram": "gurgaon",
+    "poona": "pune",
+    "amdavad": "ahmedabad",
+    "hyd": "hyderabad",
+    "cyberabad": "hyderabad"
+}
+
+# Common short forms -> area key (only used where the catalog has that area)
+AREA_ALIASES: Dict[str, str] = {
+    "cp": "connaught_place",
+    "rajiv chowk": "connaught_place",
+    "thyagaraya nagar": "t_nagar",
+    "hitec city": "hitech_city",
+    "cyber city": "hitech_city",
+    "jubilee": "jubilee_hills",
+    "kormangala": "koramangala"
+}
+
+# Dice similarity a fuzzy match needs; below it the input is treated as unknown
+MIN_SIMILARITY = 0.5
+# Names (by shared trigram count) scored per fuzzy lookup
+MAX_CANDIDATES = 16
+# Normalized names up to this length may be one edit off; longer names two
+SHORT_NAME_LENGTH = 8
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_REPEATS = re.compile(r'(.)\1+')
+
+def normalize_location(text: str) -> str:
+    """Lowercase letters and digits only, runs of one letter collapsed ("Bandraa" -> "bandra")"""
+    return _REPEATS.sub(r'\1', _NON_ALNUM.sub('', text.lower())) if text else ""
+
+def trigrams(normalized: str) -> List[str]:
+    """Character trigrams of a normalized name, padded so short names and word starts count"""
+    padded = f"  {normalized} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+def max_edits(a: str, b: str) -> int:
+    """Typo budget for matching two normalized names"""
+    return 1 if max(len(a), len(b)) <= SHORT_NAME_LENGTH else 2
+
+def edit_distance(a: str, b: str) -> int:
+    """Insertions, deletions, substitutions and adjacent swaps turning a into b"""
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+def edit_similarity(a: str, b: str) -> float:
+    """1 - (edits incl. adjacent swaps) / longer length"""
+    return 1.0 - edit_distance(a, b) / max(len(a), len(b), 1)
+
+class TrigramMatcher:
+    """Exact and trigram-similarity lookup of names mapped to targets (first added wins ties)"""
+
+    def __init__(self):
+        self.exact: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.targets: List[int] = []
+        self.gram_counts: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+
+    def add(self, name: str, target: int):
+        normalized = normalize_location(name)
+        if not normalized or normalized in self.exact:
+            return
+        self.exact[normalized] = target
+        entry = len(self.targets)
+        grams = set(trigrams(normalized))
+        self.names.append(normalized)
+        self.targets.append(target)
+        self.gram_counts.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(entry)
+
+    def match(self, name: str, allowed: Optional[Iterable[int]] = None,
+              min_similarity: float = MIN_SIMILARITY) -> Optional[int]:
+        """Target of the exact or most similar name, None when nothing is similar enough"""
+        normalized = normalize_location(name)
+        if not normalized:
+            return None
+        allowed = None if allowed is None else set(allowed)
+        target = self.exact.get(normalized)
+        if target is not None and (allowed is None or target in allowed):
+            return target
+
+        grams = set(trigrams(normalized))
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for entry in self.postings.get(gram, ()):
+                shared[entry] = shared.get(entry, 0) + 1
+
+        if allowed is not None:
+            shared = {entry: count for entry, count in shared.items() if self.targets[entry] in allowed}
+        candidates = sorted(shared, key=lambda entry: (-shared[entry], entry))[:MAX_CANDIDATES]
+
+        best, best_score = None, min_similarity
+        for entry in candidates:
+            name = self.names[entry]
+            distance = edit_distance(normalized, name)
+            if distance > max_edits(normalized, name):
+                continue
+            score = max(2.0 * shared[entry] / (len(grams) + self.gram_counts[entry]),
+                        1.0 - distance / max(len(normalized), len(name)))
+            if score > best_score or (score == best_score and best is not None and entry < best):
+                best, best_score = entry, score
+        return None if best is None else self.targets[best]
+
+class LocationResolver:
+    """
+    Resolves city/area inputs to ids of one catalog's location tables
+
+    Exact keys win over everything else. Areas are matched within the city when one is
+    given; an area key shared by several cities resolves to the area id listed first.
+    """
+
+    def __init__(self, city_keys: Sequence[str], city_names: Sequence[str],
+                 area_keys: Sequence[str], area_names: Sequence[str], area_city: Sequence[int]):
+        self.cities = TrigramMatcher()
+        for city_id, key in enumerate(city_keys):
+            self.cities.add(key, city_id)
+            self.cities.add(city_names[city_id], city_id)
+        self.city_key_ids = {key: i for i, key in enumerate(city_keys)}
+        for alias, key in CITY_ALIASES.items():
+            if key in self.city_key_ids:
+                self.cities.add(alias, self.city_key_ids[key])
+
+        self.areas = TrigramMatcher()
+        self.area_key_ids: Dict[str, List[int]] = {}
+        self.city_areas: Dict[int, List[int]] = {}
+        for area_id, key in enumerate(area_keys):
+            self.areas.add(key, area_id)
+            self.areas.add(area_names[area_id], area_id)
+            self.area_key_ids.setdefault(key, []).append(area_id)
+            self.city_areas.setdefault(area_city[area_id], []).append(area_id)
+        for alias, key in AREA_ALIASES.items():
+            for area_id in self.area_key_ids.get(key, ()):
+                self.areas.add(alias, area_id)
+        self.city_keys = list(city_keys)
+        self.area_keys = list(area_keys)
+        self.area_city = list(area_city)
+
+    def add_city(self, city_id: int, key: str, name: str):
+        """Index a city appended to the catalog (city_id is the next id)"""
+        self.city_keys.append(key)
+        self.cities.add(key, city_id)
+        self.cities.add(name, city_id)
+        for alias, alias_key in CITY_ALIASES.items():
+            if alias_key == key:
+                self.cities.add(alias, city_id)
+        self.city_key_ids[key] = city_id
+
+    def add_area(self, area_id: int, key: str, name: str, city_id: int):
+        """Index an area appended to the catalog (area_id is the next id)"""
+        self.area_keys.append(key)
+        self.area_city.append(city_id)
+        self.areas.add(key, area_id)
+        self.areas.add(name, area_id)
+        for alias, alias_key in AREA_ALIASES.items():
+            if alias_key == key:
+                self.areas.add(alias, area_id)
+        self.city_areas.setdefault(city_id, []).append(area_id)
+        self.area_key_ids.setdefault(key, []).append(area_id)
+
+    @classmethod
+    def from_index(cls, index) -> "LocationResolver":
+        return cls(index.city_keys, index.city_names, index.area_keys, index.area_names, index.area_city)
+
+    def city_id(self, city: str) -> Optional[int]:
+        city_id = self.city_key_ids.get(city.lower())
+        return self.cities.match(city) if city_id is None else city_id
+
+    def area_id(self, area: str, city_id: Optional[int] = None) -> Optional[int]:
+        exact = [a for a in self.area_key_ids.get(area.lower(), ()) if city_id is None or self.area_city[a] == city_id]
+        if exact:
+            return exact[0]
+        if city_id is not None:
+            return self.areas.match(area, self.city_areas.get(city_id, ()))
+        return self.areas.match(area)
+
+    def resolve(self, city: Optional[str], area: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        (city key, area key) for a city/area input; None where that part is unset or unknown
+
+        A known city with an unknown area gives (city key, None); callers that were given an
+        area must treat that as no match.
+        """
+        city_id = self.city_id(city) if city else None
+        area_key = None
+        if area and (city_id is not None or not city):
+            area_id = self.area_id(area, city_id)
+            area_key = None if area_id is None else self.area_keys[area_id]
+        return (None if city_id is None else self.city_keys[city_id]), area_key
@@ -8,7 +8,8 @@ import os
 # Load environment variables
 load_dotenv()
 
-from routes import agent, token, events, groq_llm, summary, guest_invitations
+from routes import agent, token, events, groq_llm, summary, guest_invitations, catalog_admin
+from event_search import search_engine_status, warm_search_engine
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -26,6 +27,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Load the event catalog in the background so a large catalog does not hold back the port
+@app.on_event("startup")
+async def warm_event_search():
+    warm_search_engine()
+
 # Health check endpoint
 @app.get("/")
 async def root():
@@ -46,7 +52,12 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
+    search = search_engine_status()
+    if search["ready"]:
+        status = "healthy"
+    else:
+        status = "starting" if search["warming"] else "degraded"
+    return {"status": status, "timestamp": "2024-01-01T00:00:00Z", "search_engine": search}
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -73,6 +84,7 @@ app.include_router(events.router)
 app.include_router(groq_llm.router)
 app.include_router(summary.router)
 app.include_router(guest_invitations.router)
+app.include_router(catalog_admin.router)
 
 # Main entry point
 if __name__ == "__main__":
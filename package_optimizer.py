@@ -0,0 +1,115 @@
+"""
+Event Package Optimizer
+Picks one venue and one vendor per category with the highest combined rating whose quoted
+cost fits a total budget ("a venue plus catering, decor and a DJ under ₹3 lakh")
+
+Costs are starting prices: per-person prices ("₹350 - ₹800 per person") are multiplied by the
+guest count and per-day prices by the number of days. Each category is first pruned to its
+Pareto frontier (an option survives only if every cheaper option is rated lower), then a
+depth-first branch-and-bound explores the frontiers best rated first, cutting any branch whose
+cost cannot fit the budget or whose rating cannot beat the best package found so far.
+"""
+
+import re
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from event_index import extract_price_range
+
+PER_PERSON = re.compile(r'per\s+(person|plate|head|guest|pax)', re.IGNORECASE)
+PER_DAY = re.compile(r'per\s+day', re.IGNORECASE)
+
+# Search nodes before the best package so far is returned as not proven optimal
+MAX_NODES = 200000
+
+_EPSILON = 1e-9
+
+class Option(NamedTuple):
+    cost: int
+    rating: float
+    item: Any
+
+def quoted_cost(price_range: str, guests: int, days: int = 1) -> int:
+    """Starting cost of a venue/vendor for the event from its price_range text"""
+    min_price, _ = extract_price_range(price_range)
+    if PER_PERSON.search(price_range or ""):
+        return min_price * guests
+    if PER_DAY.search(price_range or ""):
+        return min_price * days
+    return min_price
+
+def pareto_options(options: Sequence[Option]) -> List[Option]:
+    """Cheapest-first options that are each rated higher than everything cheaper (ties: catalog order)"""
+    frontier = []
+    for option in sorted(options, key=lambda o: (o.cost, -o.rating)):
+        if not frontier or option.rating > frontier[-1].rating + _EPSILON:
+            frontier.append(option)
+    return frontier
+
+def best_combination(categories: Sequence[Sequence[Option]], budget: int,
+                     max_nodes: int = MAX_NODES) -> Tuple[Optional[List[Option]], bool]:
+    """
+    One option per category maximizing the rating sum with total cost <= budget
+
+    Ties go to the cheaper package. Categories should already be Pareto-pruned.
+
+    Returns:
+        (chosen options in category order or None when nothing fits, whether the search finished
+        within max_nodes, i.e. the answer is proven optimal)
+    """
+    if not categories or any(not options for options in categories):
+        return None, True
+
+    # Small categories first, so the bounds tighten early; best rated options first in each
+    order = sorted(range(len(categories)), key=lambda k: len(categories[k]))
+    levels = [sorted(categories[k], key=lambda o: (-o.rating, o.cost)) for k in order]
+    depth = len(levels)
+    min_cost_after = [0] * (depth + 1)
+    max_rating_after = [0.0] * (depth + 1)
+    for level in range(depth - 1, -1, -1):
+        min_cost_after[level] = min_cost_after[level + 1] + min(o.cost for o in levels[level])
+        max_rating_after[level] = max_rating_after[level + 1] + max(o.rating for o in levels[level])
+
+    if min_cost_after[0] > budget:
+        return None, True
+
+    best: List = [None, -1.0, 0]  # choice, rating, cost
+    chosen: List[Option] = []
+    nodes = 0
+
+    def search(level: int, cost: int, rating: float) -> bool:
+        """False once the node budget is spent"""
+        nonlocal nodes
+        if level == depth:
+            if rating > best[1] + _EPSILON or (abs(rating - best[1]) <= _EPSILON and cost < best[2]):
+                best[0], best[1], best[2] = list(chosen), rating, cost
+            return True
+        for option in levels[level]:
+            nodes += 1
+            if nodes > max_nodes:
+                return False
+            total = cost + option.cost
+            if total + min_cost_after[level + 1] > budget:
+                continue
+            if rating + option.rating + max_rating_after[level + 1] < best[1] - _EPSILON:
+                # Options are in falling rating order: nothing later in this level can do better
+                break
+            chosen.append(option)
+            finished = search(level + 1, total, rating + option.rating)
+            chosen.pop()
+            if not finished:
+                return False
+        return True
+
+    finished = search(0, 0, 0.0)
+    if best[0] is None:
+        return None, finished
+    by_category = [None] * depth
+    for level, k in enumerate(order):
+        by_category[k] = best[0][level]
+    return by_category, finished
+
+def cheapest_cost(categories: Sequence[Sequence[Option]]) -> Optional[int]:
+    """Lowest possible package cost (one option per category), None if a category is empty"""
+    if not categories or any(not options for options in categories):
+        return None
+    return sum(min(o.cost for o in options) for options in categories)
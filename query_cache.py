@@ -0,0 +1,152 @@
+"""
+Query Result Cache
+LRU/TTL memoization for EventSearchEngine calls, invalidated whenever the catalog version changes
+"""
+
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with a per-entry TTL
+
+    Entries are tagged with the catalog version they were computed against; the first lookup
+    under a newer version drops everything. Lookups under an older version (queries still pinned
+    to the catalog a reload replaced) bypass the cache: they neither clear it nor store results.
+    Cached results are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_lookups = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, version: Any, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key under version, computing and storing it on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            stale = version != self.version and not self._is_newer(version)
+            if stale:
+                self.stale_lookups += 1
+                self.misses += 1
+            else:
+                if version != self.version:
+                    if self._entries:
+                        self.invalidations += 1
+                    self._entries.clear()
+                    self.version = version
+
+                entry = self._entries.get(key)
+                if entry is not None and (self.ttl is None or entry[0] > now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self.misses += 1
+
+        value = compute()
+        if stale:
+            return value
+
+        with self._lock:
+            if version == self.version:
+                expires = now + self.ttl if self.ttl is not None else None
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def _is_newer(self, version: Any) -> bool:
+        """Whether version supersedes the cached one (versions of other types always do)"""
+        if self.version is None:
+            return True
+        try:
+            return version > self.version
+        except TypeError:
+            return True
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for sizing the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "stale_lookups": self.stale_lookups,
+                "catalog_version": self.version
+            }
+
+def cached_query(**normalizers: Callable[[Any], Hashable]):
+    """
+    Memoize an EventSearchEngine method in the engine's QueryCache
+
+    The key is the method name plus every argument (defaults applied) in signature order.
+    Arguments listed in `normalizers` are mapped through their function first so equivalent
+    calls, e.g. city="Delhi" and city="delhi", share an entry.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self, "cache", None)
+            if cache is None:
+                return method(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = [method.__name__]
+            for name, value in bound.arguments.items():
+                if name == "self":
+                    continue
+                normalize = normalizers.get(name)
+                key.append(normalize(value) if normalize else value)
+            return cache.get_or_compute(tuple(key), self.catalog_version,
+                                        lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
+
+def lower_or_none(value: Optional[str]) -> Optional[str]:
+    """Case-insensitive string argument; empty means unset"""
+    return value.lower() if value else None
+
+def number_or_none(value: Optional[int]) -> Optional[int]:
+    """Numeric filter where 0 means unset"""
+    return value or None
+
+def string_set(values) -> Optional[tuple]:
+    """Order- and case-insensitive list of strings"""
+    if not values:
+        return None
+    return tuple(sorted({v.strip().lower() for v in values if v and v.strip()}))
+
+def string_tuple(values) -> Optional[tuple]:
+    """Ordered list of strings (e.g. projected fields, whose order shapes the result)"""
+    return tuple(values) if values else None
+
+def budget_preferences(preferences: Optional[Dict]) -> str:
+    """Budget estimates only read budget_level from the preferences dict"""
+    return (preferences or {}).get("budget_level", "medium")
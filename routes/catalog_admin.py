@@ -0,0 +1,148 @@
+"""
+Catalog Admin API Routes
+Add, update and retire venues/vendors in the live search catalog without a restart
+
+Handlers are plain functions: FastAPI runs them in its threadpool, so a journal write and
+fsync never blocks the event loop serving live voice sessions.
+"""
+
+from fastapi import APIRouter, Header, HTTPException
+from typing import Any, Dict, Optional
+from pydantic import BaseModel
+import hmac
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from event_search import get_search_engine, search_engine_status
+    CATALOG_AVAILABLE = True
+except ImportError as e:
+    CATALOG_AVAILABLE = False
+    print(f"⚠️ Event catalog not available for admin routes: {e}")
+
+router = APIRouter(prefix="/catalog", tags=["catalog"])
+
+class NewVenueRequest(BaseModel):
+    city: str
+    area: str
+    venue: Dict[str, Any]
+    city_name: Optional[str] = None
+    area_name: Optional[str] = None
+
+class NewVendorRequest(BaseModel):
+    city: str
+    area: str
+    vendor_type: str
+    vendor: Dict[str, Any]
+    city_name: Optional[str] = None
+    area_name: Optional[str] = None
+
+class BookingRequest(BaseModel):
+    date_from: str
+    date_to: Optional[str] = None
+
+def require_admin(token: Optional[str]):
+    """Admin routes are disabled unless CATALOG_ADMIN_TOKEN is set, then need a matching X-Admin-Token (503 until the catalog is loaded)"""
+    if not CATALOG_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Event catalog not available")
+    expected = os.getenv("CATALOG_ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=503, detail="Catalog admin API disabled (CATALOG_ADMIN_TOKEN not set)")
+    if not token or not hmac.compare_digest(token, expected):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+    if not search_engine_status()["ready"]:
+        raise HTTPException(status_code=503, detail="Event catalog is still loading, retry shortly")
+
+def apply_change(change):
+    """Run an engine mutation, mapping its errors to HTTP status codes"""
+    try:
+        return change()
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e).strip("'\""))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=f"Failed to journal catalog change: {str(e)}")
+
+@router.get("/{kind}/lookup")
+def lookup_records(kind: str, name: str = "", city: Optional[str] = None,
+                   x_admin_token: Optional[str] = Header(None)):
+    """Find venue/vendor ids by (partial) name"""
+    require_admin(x_admin_token)
+    if kind not in ("venues", "vendors"):
+        raise HTTPException(status_code=404, detail="Unknown record kind")
+    matches = get_search_engine().find_records(kind[:-1], name, city)
+    return {"success": True, "matches": matches, "total": len(matches)}
+
+@router.post("/venues")
+def add_venue(request: NewVenueRequest, x_admin_token: Optional[str] = Header(None)):
+    """Add a venue to the live catalog"""
+    require_admin(x_admin_token)
+    venue_id = apply_change(lambda: get_search_engine().add_venue(
+        request.city, request.area, request.venue, request.city_name, request.area_name
+    ))
+    return {"success": True, "venue_id": venue_id}
+
+@router.patch("/venues/{venue_id}")
+def update_venue(venue_id: int, changes: Dict[str, Any], x_admin_token: Optional[str] = Header(None)):
+    """Change fields (price_range, capacity, rating, amenities, ...) of a venue"""
+    require_admin(x_admin_token)
+    venue = apply_change(lambda: get_search_engine().update_venue(venue_id, changes))
+    return {"success": True, "venue_id": venue_id, "venue": venue}
+
+@router.delete("/venues/{venue_id}")
+def retire_venue(venue_id: int, x_admin_token: Optional[str] = Header(None)):
+    """Retire a venue from search results"""
+    require_admin(x_admin_token)
+    apply_change(lambda: get_search_engine().retire_venue(venue_id))
+    return {"success": True, "venue_id": venue_id, "message": "Venue retired"}
+
+@router.post("/venues/{venue_id}/bookings")
+def book_venue(venue_id: int, request: BookingRequest, x_admin_token: Optional[str] = Header(None)):
+    """Mark a venue booked for a day or date range (it drops out of date-filtered searches)"""
+    require_admin(x_admin_token)
+    venue = apply_change(lambda: get_search_engine().book_venue(venue_id, request.date_from, request.date_to))
+    return {"success": True, "venue_id": venue_id, "booked_dates": venue.get("booked_dates", [])}
+
+@router.delete("/venues/{venue_id}/bookings")
+def release_venue(venue_id: int, date_from: str, date_to: Optional[str] = None,
+                  x_admin_token: Optional[str] = Header(None)):
+    """Free a venue's bookings for a day or date range"""
+    require_admin(x_admin_token)
+    venue = apply_change(lambda: get_search_engine().release_venue(venue_id, date_from, date_to))
+    return {"success": True, "venue_id": venue_id, "booked_dates": venue.get("booked_dates", [])}
+
+@router.post("/vendors")
+def add_vendor(request: NewVendorRequest, x_admin_token: Optional[str] = Header(None)):
+    """Add a vendor to the live catalog"""
+    require_admin(x_admin_token)
+    vendor_id = apply_change(lambda: get_search_engine().add_vendor(
+        request.city, request.area, request.vendor_type, request.vendor, request.city_name, request.area_name
+    ))
+    return {"success": True, "vendor_id": vendor_id}
+
+@router.patch("/vendors/{vendor_id}")
+def update_vendor(vendor_id: int, changes: Dict[str, Any], x_admin_token: Optional[str] = Header(None)):
+    """Change fields (price_range, rating, speciality, ...) of a vendor"""
+    require_admin(x_admin_token)
+    vendor = apply_change(lambda: get_search_engine().update_vendor(vendor_id, changes))
+    return {"success": True, "vendor_id": vendor_id, "vendor": vendor}
+
+@router.delete("/vendors/{vendor_id}")
+def retire_vendor(vendor_id: int, x_admin_token: Optional[str] = Header(None)):
+    """Retire a vendor from search results"""
+    require_admin(x_admin_token)
+    apply_change(lambda: get_search_engine().retire_vendor(vendor_id))
+    return {"success": True, "vendor_id": vendor_id, "message": "Vendor retired"}
+
+@router.post("/compact")
+def compact_catalog(x_admin_token: Optional[str] = Header(None)):
+    """Fold the change journal into event_data.json (record ids are reassigned)"""
+    require_admin(x_admin_token)
+    apply_change(lambda: get_search_engine().compact_journal())
+    return {"success": True, "message": "Catalog journal compacted"}
@@ -0,0 +1,934 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the indexed event search against a plain scan of event_data.json
+"""
+
+import datetime
+import itertools
+import json
+import os
+import random
+import re
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+
+from catalog_facets import FacetBitmaps
+from catalog_generator import format_inr, generate_catalog
+from catalog_shm import CatalogPublisher, read_control
+from catalog_snapshot import compile_snapshot
+from catalog_sqlite import SQLiteCatalogBackend, build_sqlite_catalog
+from event_search import EventSearchEngine
+from event_index import CatalogIndex, NUMPY_AVAILABLE, extract_price_range
+from keyword_detector import EVENT_TYPE_KEYWORDS, VENDOR_KEYWORDS, QueryKeywordDetector, default_detector
+from location_resolver import LocationResolver, normalize_location
+from package_optimizer import quoted_cost
+from text_index import CatalogTextIndex
+from venue_ranking import VenueScorer
+
+engine = EventSearchEngine("event_data.json")
+
+def scan_venues(city=None, area=None, capacity=None, budget_min=None, budget_max=None, event_type=None):
+    """Reference venue search: walk the nested catalog dict record by record"""
+    results = []
+    for city_key, city_data in engine.data["cities"].items():
+        if city and city.lower() != city_key:
+            continue
+        for area_key, area_data in city_data["areas"].items():
+            if area and area.lower() != area_key:
+                continue
+            for venue in area_data.get("venues", []):
+                low, high = extract_price_range(venue.get("price_range", ""))
+                if capacity and venue.get("capacity", 0) < capacity:
+                    continue
+                if budget_min and high < budget_min:
+                    continue
+                if budget_max and low > budget_max:
+                    continue
+                if event_type and event_type.lower() not in venue.get("suitable_for", []):
+                    continue
+                results.append(venue["name"])
+    return results
+
+def scan_vendors(city=None, area=None, vendor_type=None, budget_min=None, budget_max=None, speciality=None):
+    """Reference vendor search: walk the nested catalog dict record by record"""
+    results = []
+    for city_key, city_data in engine.data["cities"].items():
+        if city and city.lower() != city_key:
+            continue
+        for area_key, area_data in city_data["areas"].items():
+            if area and area.lower() != area_key:
+                continue
+            for vtype, vendors in area_data.get("vendors", {}).items():
+                if vendor_type and vtype != vendor_type:
+                    continue
+                for vendor in vendors:
+                    low, high = extract_price_range(vendor.get("price_range", ""))
+                    if budget_min and high < budget_min:
+                        continue
+                    if budget_max and low > budget_max:
+                        continue
+                    if speciality and speciality.lower() not in vendor.get("speciality", "").lower():
+                        continue
+                    results.append(vendor["name"])
+    return results
+
+@contextmanager
+def catalog_workspace(catalog=None):
+    """
+    Temp dir holding a catalog (a copy of event_data.json when None) as event_data.json
+
+    Yields a cache-less JSON engine over it; the dir is removed afterwards.
+    """
+    workdir = tempfile.mkdtemp()
+    try:
+        data_file = os.path.join(workdir, "event_data.json")
+        if catalog is None:
+            shutil.copy("event_data.json", data_file)
+        else:
+            with open(data_file, "w", encoding="utf-8") as f:
+                json.dump(catalog, f)
+        yield EventSearchEngine(data_file, cache_size=0)
+    finally:
+        shutil.rmtree(workdir)
+
+def storage_engines(base, snapshot=True, vectorized=True):
+    """Engines over snapshot, SQLite and (with NumPy) vectorized copies of base's current catalog"""
+    workdir = os.path.dirname(base.data_file)
+    engines = []
+    if snapshot:
+        snapshot_file = os.path.join(workdir, "event_data.snapshot")
+        compile_snapshot(base.data_file, snapshot_file)
+        engines.append(EventSearchEngine(snapshot_file))
+    db_path = os.path.join(workdir, "event_catalog.db")
+    build_sqlite_catalog(base.index, db_path)
+    engines.append(EventSearchEngine(backend=SQLiteCatalogBackend(db_path)))
+    if vectorized and NUMPY_AVAILABLE:
+        engines.append(EventSearchEngine(base.data_file, vectorized=True))
+    return engines
+
+def test_search_venues_matches_scan():
+    cities = [None, "delhi", "Mumbai", "nowhere"]
+    areas = [None, "connaught_place", "bandra"]
+    capacities = [None, 100, 500]
+    budgets = [(None, None), (50000, None), (None, 60000), (40000, 200000)]
+    event_types = [None, "wedding", "Corporate", "unknown"]
+
+    for city, area, capacity, (budget_min, budget_max), event_type in itertools.product(
+            cities, areas, capacities, budgets, event_types):
+        results = engine.search_venues(city, area, capacity, budget_min, budget_max, event_type)
+        expected = scan_venues(city, area, capacity, budget_min, budget_max, event_type)
+        assert sorted(r["name"] for r in results) == sorted(expected)
+        ratings = [r["rating"] for r in results]
+        assert ratings == sorted(ratings, reverse=True)
+
+def test_search_vendors_matches_scan():
+    cities = [None, "delhi", "bangalore"]
+    vendor_types = [None, "food", "flowers", "unknown"]
+    budgets = [(None, None), (20000, None), (None, 30000)]
+    specialities = [None, "wedding", "Corporate", "cuisine"]
+
+    for city, vendor_type, (budget_min, budget_max), speciality in itertools.product(
+            cities, vendor_types, budgets, specialities):
+        results = engine.search_vendors(city, None, vendor_type, budget_min, budget_max, speciality)
+        expected = scan_vendors(city, None, vendor_type, budget_min, budget_max, speciality)
+        assert sorted(r["name"] for r in results) == sorted(expected)
+        ratings = [r["rating"] for r in results]
+        assert ratings == sorted(ratings, reverse=True)
+
+def test_results_carry_location_info():
+    venue = engine.search_venues(city="delhi", area="connaught_place")[0]
+    assert venue["city"] == "Delhi"
+    assert venue["area_key"] == "connaught_place"
+
+    vendor = engine.search_vendors(city="delhi", vendor_type="food")[0]
+    assert vendor["vendor_type"] == "food"
+    assert vendor["city_key"] == "delhi"
+
+def test_amenity_and_event_type_postings():
+    results = engine.search_venues(event_type="engagement", amenities=["bridal room"])
+    assert results
+    for venue in results:
+        assert "engagement" in venue["suitable_for"]
+        assert "bridal room" in [a.lower() for a in venue["amenities"]]
+    assert engine.search_venues(amenities=["Bridal Room", "No Such Amenity"]) == []
+
+def test_speciality_substring_semantics():
+    for speciality in ["wed", "ding dec", "wedding & event", "&"]:
+        results = engine.search_vendors(speciality=speciality)
+        assert sorted(r["name"] for r in results) == sorted(scan_vendors(speciality=speciality))
+
+def test_capacity_and_price_range_paths():
+    for city, area in [(None, None), ("delhi", None), (None, "bandra"), ("mumbai", "bandra")]:
+        for capacity, budget_min, budget_max in [(1000, None, None), (None, 400000, None),
+                                                 (None, None, 20000), (200, 100000, 150000)]:
+            results = engine.search_venues(city, area, capacity, budget_min, budget_max)
+            expected = scan_venues(city, area, capacity, budget_min, budget_max)
+            assert sorted(r["name"] for r in results) == sorted(expected)
+
+def test_limit_keeps_top_rated_prefix():
+    full = engine.search_venues()
+    top = engine.search_venues(limit=3)
+    assert top == full[:3]
+    assert top.total == len(full)
+
+    full = engine.search_vendors(vendor_type="food")
+    top = engine.search_vendors(vendor_type="food", limit=2)
+    assert top == full[:2]
+    assert top.total == len(full)
+
+def test_vectorized_mode_matches_python():
+    if not NUMPY_AVAILABLE:
+        print("⚠️ numpy not installed, skipping vectorized checks")
+        return
+
+    vectorized = EventSearchEngine("event_data.json", vectorized=True)
+    venue_queries = [{}, {"city": "delhi", "capacity": 100}, {"budget_min": 50000, "event_type": "wedding"},
+                     {"area": "bandra", "amenities": ["wifi"], "limit": 2}]
+    for query in venue_queries:
+        assert vectorized.search_venues(**query) == engine.search_venues(**query)
+
+    vendor_queries = [{}, {"vendor_type": "food", "budget_max": 30000}, {"city": "delhi", "speciality": "wedding"}]
+    for query in vendor_queries:
+        assert vectorized.search_vendors(**query) == engine.search_vendors(**query)
+
+    assert vectorized.venue_coverage(capacity=200) == engine.venue_coverage(capacity=200)
+
+def test_query_cache_hits_and_version_invalidation():
+    cached = EventSearchEngine("event_data.json", cache_size=16)
+    first = cached.search_venues(city="Delhi", event_type="wedding", capacity=100)
+    second = cached.search_venues(city="delhi", event_type="WEDDING", capacity=100)
+    assert first is second
+    stats = cached.cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+    old_index = cached.index
+    cached.index = CatalogIndex(cached.data)
+    third = cached.search_venues(city="delhi", event_type="wedding", capacity=100)
+    assert third is not first and third == first
+    assert cached.cache_stats()["invalidations"] == 1
+
+    # A request still pinned to the replaced catalog neither wipes nor pollutes the cache
+    cached._pinned.index = old_index
+    try:
+        assert cached.search_venues(city="delhi", event_type="wedding", capacity=100) == first
+    finally:
+        cached._pinned.index = None
+    assert cached.search_venues(city="delhi", event_type="wedding", capacity=100) is third
+    stats = cached.cache_stats()
+    assert stats["invalidations"] == 1 and stats["stale_lookups"] == 1
+
+    assert EventSearchEngine("event_data.json", cache_size=0).cache_stats() == {"enabled": False}
+
+def test_reload_swaps_catalog_atomically():
+    with catalog_workspace() as reloading:
+        workdir, data_file = os.path.dirname(reloading.data_file), reloading.data_file
+        before = len(reloading.search_venues(city="delhi"))
+
+        with open(data_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        del data["cities"]["delhi"]
+
+        with reloading.pinned_index() as pinned:
+            with open(data_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            assert reloading.reload()
+            # A query pinned to the old snapshot keeps seeing it
+            assert len(reloading.search_venues(city="delhi")) == before
+            assert reloading.index is pinned
+        assert reloading.search_venues(city="delhi") == []
+
+        # A broken file keeps the current catalog
+        with open(data_file, "w", encoding="utf-8") as f:
+            f.write("{ not json")
+        assert not reloading.reload()
+        assert reloading.get_all_cities() and "Delhi" not in reloading.get_all_cities()
+
+        # The watcher picks up file changes on its own
+        reloading.start_auto_reload(interval=0.05)
+        shutil.copy("event_data.json", data_file)
+        deadline = time.time() + 5
+        while time.time() < deadline and not reloading.search_venues(city="delhi"):
+            time.sleep(0.05)
+        reloading.stop_auto_reload()
+        assert len(reloading.search_venues(city="delhi")) == before
+
+        # Recompiling a snapshot that is mapped replaces the file instead of truncating it
+        snapshot_file = os.path.join(workdir, "event_data.snapshot")
+        smaller_file = os.path.join(workdir, "smaller.json")
+        with open(smaller_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        compile_snapshot("event_data.json", snapshot_file)
+        mapped = EventSearchEngine(snapshot_file)
+        with mapped.pinned_index():
+            compile_snapshot(smaller_file, snapshot_file)
+            assert mapped.reload()
+            assert len(mapped.search_venues(city="delhi")) == before
+        assert mapped.search_venues(city="delhi") == []
+
+def test_snapshot_engine_matches_json_engine():
+    workdir = tempfile.mkdtemp()
+    try:
+        snapshot_file = os.path.join(workdir, "event_data.snapshot")
+        compile_snapshot("event_data.json", snapshot_file)
+        snapshot = EventSearchEngine(snapshot_file)
+
+        venue_queries = [{}, {"city": "delhi", "capacity": 100}, {"budget_min": 50000, "event_type": "wedding"},
+                         {"area": "bandra", "amenities": ["wifi"], "limit": 2}]
+        for query in venue_queries:
+            assert snapshot.search_venues(**query) == engine.search_venues(**query)
+
+        vendor_queries = [{}, {"vendor_type": "food", "budget_max": 30000}, {"city": "delhi", "speciality": "wed"}]
+        for query in vendor_queries:
+            assert snapshot.search_vendors(**query) == engine.search_vendors(**query)
+
+        assert snapshot.get_all_cities() == engine.get_all_cities()
+        assert snapshot.get_city_areas("mumbai") == engine.get_city_areas("mumbai")
+
+        if NUMPY_AVAILABLE:
+            # Vectorized mode reads the snapshot columns in place instead of copying them
+            vectorized = EventSearchEngine(snapshot_file, vectorized=True)
+            cols = vectorized.index.numpy_columns()
+            assert not cols.venue_capacity.flags.writeable and not cols.venue_event_words.flags.writeable
+            for query in venue_queries:
+                assert vectorized.search_venues(**query) == engine.search_venues(**query)
+            for query in vendor_queries:
+                assert vectorized.search_vendors(**query) == engine.search_vendors(**query)
+    finally:
+        shutil.rmtree(workdir)
+
+def test_sqlite_backend_matches_in_memory_engine():
+    workdir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(workdir, "event_catalog.db")
+        build_sqlite_catalog(engine.index, db_path)
+        sqlite_engine = EventSearchEngine(backend=SQLiteCatalogBackend(db_path))
+
+        venue_queries = [{}, {"city": "Delhi", "capacity": 100}, {"budget_min": 50000, "event_type": "wedding"},
+                         {"area": "bandra", "amenities": ["wifi"], "limit": 2}]
+        for query in venue_queries:
+            results = sqlite_engine.search_venues(**query)
+            expected = engine.search_venues(**query)
+            assert results == expected and results.total == expected.total
+
+        vendor_queries = [{}, {"vendor_type": "food", "budget_max": 30000}, {"city": "delhi", "speciality": "wed"}]
+        for query in vendor_queries:
+            assert sqlite_engine.search_vendors(**query) == engine.search_vendors(**query)
+
+        assert sqlite_engine.get_city_areas("mumbai") == engine.get_city_areas("mumbai")
+        assert sqlite_engine.venue_coverage(capacity=200) == engine.venue_coverage(capacity=200)
+
+        # a rebuild replaces the file under open connections; they must reopen onto the new one
+        before = sqlite_engine.backend.version
+        rebuilt = CatalogIndex(generate_catalog(cities=2, areas_per_city=2, venues_per_area=3, vendors_per_type=1, seed=5))
+        build_sqlite_catalog(rebuilt, db_path)
+        assert sqlite_engine.backend.version != before
+        assert sqlite_engine.get_all_cities() == rebuilt.city_names
+        assert sqlite_engine.search_venues(limit=None).total == len(rebuilt.venue_records)
+        assert sqlite_engine.resolve_location(rebuilt.city_keys[1])["city"] == rebuilt.city_keys[1]
+        assert len(sqlite_engine.backend.venue_similarity().ids) == len(rebuilt.venue_records)
+    finally:
+        shutil.rmtree(workdir)
+
+def test_generated_catalog_follows_schema():
+    catalog = generate_catalog(cities=2, areas_per_city=3, venues_per_area=4, vendors_per_type=2, seed=7)
+    assert catalog == generate_catalog(cities=2, areas_per_city=3, venues_per_area=4, vendors_per_type=2, seed=7)
+    assert format_inr(150000) == "₹1,50,000" and format_inr(999) == "₹999"
+
+    index = CatalogIndex(catalog)
+    assert len(index.city_keys) == 2 and len(index.venue_records) == 2 * 3 * 4
+    assert len(index.vendor_records) == 2 * 3 * 2 * len(catalog["vendor_categories"])
+    for record in index.venue_records + index.vendor_records:
+        low, high = extract_price_range(record["price_range"])
+        assert 0 < low <= high
+
+def test_keyword_detector_matches_substring_checks():
+    words = ["wedding", "party", "parties", "decoration", "decor", "hall", "venue", "vendors", "cab", "dj",
+             "photographer", "in", "delhi", "for", "200", "people", "₹50000", "१२०", "Cuisine", "WEDDING"]
+    rng = random.Random(3)
+    for _ in range(500):
+        query = "".join(rng.choice(words) + rng.choice([" ", "", "-"]) for _ in range(rng.randint(0, 8)))
+        lower = query.lower()
+        detected = default_detector.detect(query)
+        expected_event = next((e for e in EVENT_TYPE_KEYWORDS if e in lower), None)
+        expected_vendors = [v for v, kws in VENDOR_KEYWORDS.items() if any(k in lower for k in kws)]
+        assert detected["event_type"] == expected_event
+        assert detected["vendor_types"] == expected_vendors
+        assert detected["venue_cue"] == ("venue" in lower or "hall" in lower)
+        assert detected["vendor_cue"] == ("vendor" in lower)
+        assert detected["numbers"] == re.findall(r"\d+", query)
+
+    hinglish = QueryKeywordDetector({"wedding": ["wedding", "shaadi"]}, {"food": ["khana"]})
+    detected = hinglish.detect("Shaadi ke liye khana")
+    assert detected["event_type"] == "wedding" and detected["vendor_types"] == ["food"]
+
+def test_search_batch_matches_individual_searches():
+    venue_query = {"capacity": 100, "event_type": "wedding", "limit": 4}
+    vendor_queries = [{"vendor_type": "food", "budget_max": 30000}, {"vendor_type": "flowers", "speciality": "wed"},
+                      {"vendor_type": "unknown"}, {"vendor_type": "photography", "limit": 1}]
+    for city, area in [(None, None), ("delhi", None), ("mumbai", "bandra"), ("nowhere", None)]:
+        batch = engine.search_batch(city, area, venue_query, vendor_queries, limit=2)
+        venues = engine.search_venues(city, area, capacity=100, event_type="wedding", limit=4)
+        assert batch["venues"] == venues and batch["venues"].total == venues.total
+        for q in vendor_queries:
+            expected = engine.search_vendors(city, area, q["vendor_type"], None, q.get("budget_max"),
+                                             q.get("speciality"), q.get("limit", 2))
+            assert batch["vendors"][q["vendor_type"]] == expected
+            assert batch["vendors"][q["vendor_type"]].total == expected.total
+
+    assert engine.search_batch(vendor_queries=[{"vendor_type": "food"}])["venues"] is None
+
+def test_results_are_views_over_catalog_records():
+    venue = engine.search_venues(city="delhi", limit=1)[0]
+    record = engine.index.venue_records[venue._id]
+    expected = dict(record, city="Delhi", area=venue["area"], city_key="delhi", area_key=venue["area_key"])
+    assert venue == expected and expected == venue
+    assert list(venue) == list(expected) and len(venue) == len(expected)
+    assert venue._record is record
+    assert venue.to_dict(["name", "city", "missing"]) == {"name": record["name"], "city": "Delhi"}
+    assert json.loads(json.dumps(dict(venue))) == expected
+
+    vendor = engine.search_vendors(vendor_type="food", limit=1)[0]
+    assert vendor["vendor_type"] == "food" and vendor.get("nope", 1) == 1
+
+def test_cursor_pages_cover_full_ranking():
+    with catalog_workspace() as base:
+        engines = [base] + storage_engines(base)
+
+        for paging in engines:
+            for search, kwargs in [(paging.search_venues, {"city": "delhi"}), (paging.search_venues, {}),
+                                   (paging.search_vendors, {"vendor_type": "food"})]:
+                full = search(**kwargs)
+                pages, cursor = [], None
+                while True:
+                    page = search(**kwargs, limit=4, cursor=cursor, fields=["name", "rating"])
+                    assert page.total == full.total
+                    pages.extend(page)
+                    cursor = page.next_cursor
+                    if cursor is None:
+                        break
+                assert pages == [{"name": r["name"], "rating": r["rating"]} for r in full]
+            assert paging.search_venues(limit=2).next_cursor is not None
+            assert paging.search_venues().next_cursor is None
+
+        try:
+            base.search_venues(cursor="not-a-cursor")
+            assert False, "invalid cursor accepted"
+        except ValueError:
+            pass
+
+def test_catalog_mutations_patch_indexes_and_survive_restart():
+    with catalog_workspace() as live:
+        workdir, data_file = os.path.dirname(live.data_file), live.data_file
+        # Build the lazily created range indexes first so they are patched, not rebuilt
+        live.search_venues(capacity=100)
+        live.search_venues(city="delhi", budget_max=100000)
+
+        venue_id = live.add_venue("delhi", "aerocity", {
+            "name": "Skyline Aerocity Lawns", "capacity": 5000, "price_range": "₹2,00,000 - ₹6,00,000",
+            "amenities": ["Helipad", "Valet Parking"], "rating": 4.9, "suitable_for": ["wedding", "expo"]
+        }, area_name="Aerocity")
+        vendor_id = live.find_records("vendor", "royal kitchen")[0]["id"]
+        live.update_vendor(vendor_id, {"price_range": "₹90,000 - ₹95,000 per person", "speciality": "Royal Thali"})
+        retired = live.find_records("venue", "", city="mumbai")[0]
+        live.retire_venue(retired["id"])
+
+        assert live.search_venues(capacity=4000)[0]["name"] == "Skyline Aerocity Lawns"
+        assert [v["name"] for v in live.search_venues(event_type="expo")] == ["Skyline Aerocity Lawns"]
+        assert live.search_venues(city="delhi", amenities=["helipad"])[0]["area"] == "Aerocity"
+        assert live.search_vendors(budget_min=90000, vendor_type="food")[0]["speciality"] == "Royal Thali"
+        assert live.search_vendors(speciality="thali").total == 1
+        assert retired["record"]["name"] not in [v["name"] for v in live.search_venues(city="mumbai")]
+
+        # Same answers as a catalog compiled from scratch, and after a restart (journal replay)
+        rebuilt_file = os.path.join(workdir, "rebuilt.json")
+        with open(rebuilt_file, "w", encoding="utf-8") as f:
+            json.dump(live.data, f)
+        rebuilt = EventSearchEngine(rebuilt_file, journal_file=os.path.join(workdir, "none.journal"))
+        restarted = EventSearchEngine(data_file)
+        engines = [rebuilt, restarted]
+        if NUMPY_AVAILABLE:
+            engines.append(EventSearchEngine(data_file, vectorized=True))
+        venue_queries = [{}, {"capacity": 300}, {"city": "delhi", "budget_min": 150000}, {"event_type": "wedding"},
+                         {"city": "mumbai", "budget_max": 80000}, {"amenities": ["valet parking"]}]
+        vendor_queries = [{}, {"vendor_type": "food", "budget_max": 1000}, {"speciality": "royal"}]
+        for other in engines:
+            for query in venue_queries:
+                results, expected = other.search_venues(**query), live.search_venues(**query)
+                assert sorted(r["name"] for r in results) == sorted(r["name"] for r in expected)
+            for query in vendor_queries:
+                results, expected = other.search_vendors(**query), live.search_vendors(**query)
+                assert sorted(r["name"] for r in results) == sorted(r["name"] for r in expected)
+        assert restarted.search_venues() == live.search_venues()
+
+        try:
+            live.update_venue(retired["id"], {"rating": 5})
+            assert False, "retired venue updated"
+        except KeyError:
+            pass
+
+        live.compact_journal()
+        assert os.path.getsize(live.journal_file) == 0
+        assert EventSearchEngine(data_file).search_venues() == live.search_venues()
+        assert venue_id is not None
+
+def test_shared_memory_catalog_follows_republish():
+    name = f"event_catalog_test_{os.getpid()}"
+    publisher = CatalogPublisher(name)
+    try:
+        publisher.publish(engine.index)
+        worker = EventSearchEngine(shared_catalog=name, cache_size=0)
+        assert worker.index.read_only and worker.index.generation == 1
+        for query in [{}, {"city": "delhi", "capacity": 100}, {"event_type": "wedding", "budget_max": 300000}]:
+            assert worker.search_venues(**query) == engine.search_venues(**query)
+        assert worker.search_vendors(vendor_type="food") == engine.search_vendors(vendor_type="food")
+
+        data = json.loads(json.dumps(engine.data))
+        del data["cities"]["delhi"]
+        publisher.publish(CatalogIndex(data))
+        assert worker._file_signature() != worker._loaded_signature
+        assert worker.reload() and worker.index.generation == 2
+        assert worker.search_venues("delhi") == [] and "delhi" not in worker.get_all_cities()
+
+        try:
+            worker.retire_venue(0)
+            assert False, "shared catalog mutated"
+        except RuntimeError:
+            pass
+    finally:
+        publisher.close()
+    assert read_control(name) is None
+
+def test_budget_matrix_matches_single_estimates():
+    event_types = ["wedding", "corporate", "birthday", "anniversary"]
+    guest_counts = [1, 75, 333, 1200]
+    cities = ["Delhi", "gurgaon", None, "atlantis"]
+    levels = ["low", "medium", "high", "lavish"]
+    matrix = engine.get_budget_matrix(event_types, guest_counts, cities, levels)
+    combos = list(itertools.product(event_types, guest_counts, cities, levels))
+    assert len(matrix["estimates"]) == len(combos)
+    for (event_type, guests, city, level), estimate in zip(combos, matrix["estimates"]):
+        assert estimate == engine.get_budget_estimate(event_type, guests, city, {"budget_level": level})
+
+    quick = engine.get_budget_matrix(["wedding"], [200], breakdown=False)
+    assert quick["cities"] == [None] and quick["budget_levels"] == ["low", "medium", "high"]
+    assert [e["total_estimate"] for e in quick["estimates"]] == [
+        engine.get_budget_estimate("wedding", 200, None, {"budget_level": level})["total_estimate"]
+        for level in ("low", "medium", "high")]
+    assert "breakdown" not in quick["estimates"][0]
+
+def test_relevance_ranking_prefers_fitting_venues():
+    with catalog_workspace(generate_catalog(cities=2, areas_per_city=3, venues_per_area=20, seed=11)) as base:
+        engines = storage_engines(base)
+
+        scorer = VenueScorer(150, 200000, 600000)
+        queries = [{"capacity": 150, "budget_min": 200000, "budget_max": 600000}, {"capacity": 400},
+                   {"budget_max": 300000, "event_type": "wedding"}, {"city": "delhi", "budget_min": 500000}, {}]
+        for query in queries:
+            ranked = base.search_venues(**query, rank_by="relevance")
+            assert sorted(r["name"] for r in ranked) == sorted(r["name"] for r in base.search_venues(**query))
+            for other in engines:
+                assert other.search_venues(**query, rank_by="relevance") == ranked
+                pages, cursor = [], None
+                while True:
+                    page = other.search_venues(**query, rank_by="relevance", limit=7, cursor=cursor, fields=["name"])
+                    pages.extend(page)
+                    cursor = page.next_cursor
+                    if cursor is None:
+                        break
+                assert pages == [{"name": r["name"]} for r in ranked]
+        assert base.search_venues(rank_by="relevance") == base.search_venues()
+
+        ranked = base.search_venues(capacity=150, budget_min=200000, budget_max=600000, rank_by="relevance")
+        venue_ids = {record["name"]: i for i, record in enumerate(base.index.venue_records)}
+        scores = [scorer.score(base.index, venue_ids[r["name"]]) for r in ranked]
+        assert scores == sorted(scores, reverse=True)
+
+        # A snug, in-budget venue outranks a better rated one that is oversized and mostly over budget
+        venues = [{"name": "Palace", "capacity": 2000, "price_range": "₹4,00,000 - ₹20,00,000", "rating": 4.9},
+                  {"name": "Courtyard", "capacity": 180, "price_range": "₹2,50,000 - ₹4,50,000", "rating": 4.4}]
+        query = {"capacity": 150, "budget_max": 500000}
+        small_catalog = {"cities": {"pune": {"name": "Pune", "areas": {"kothrud": {"name": "Kothrud", "venues": venues}}}}}
+        with catalog_workspace(small_catalog) as small:
+            assert [r["name"] for r in small.search_venues(**query)] == ["Palace", "Courtyard"]
+            assert [r["name"] for r in small.search_venues(**query, rank_by="relevance")] == ["Courtyard", "Palace"]
+
+        try:
+            base.search_venues(rank_by="price")
+            assert False, "unknown ranking accepted"
+        except ValueError:
+            pass
+
+def test_facet_counts_match_search_results():
+    with catalog_workspace(generate_catalog(cities=2, areas_per_city=3, venues_per_area=15, seed=5)) as base:
+        engines = storage_engines(base)
+
+        venue_queries = [{}, {"city": "delhi"}, {"capacity": 300, "budget_max": 400000}, {"event_type": "wedding"},
+                         {"city": "mumbai", "budget_min": 150000, "amenities": ["parking"]}, {"capacity": 5000},
+                         {"area": base.index.area_keys[1], "capacity": 50, "event_type": "Birthday"}]
+        for query in venue_queries:
+            facets = base.venue_facets(**query)
+            results = base.search_venues(**query, limit=10000)
+            assert facets["total"] == results.total
+            areas = {}
+            for r in results:
+                areas[r["area"]] = areas.get(r["area"], 0) + 1
+            assert {a["area_name"]: a["count"] for a in facets["areas"]} == areas
+            assert sum(b["count"] for b in facets["price_ranges"]) == results.total
+            assert sum(b["count"] for b in facets["capacity_ranges"]) == results.total
+            for other in engines:
+                assert other.venue_facets(**query) == facets
+
+        for query in [{}, {"vendor_type": "food"}, {"city": "mumbai", "budget_max": 50000},
+                      {"budget_min": 60000, "speciality": "wed"}, {"vendor_type": "nothing"}]:
+            facets = base.vendor_facets(**query)
+            types = {}
+            for vendor_type in base.index.vendor_type_keys:
+                if query.get("vendor_type", vendor_type) == vendor_type:
+                    found = base.search_vendors(**dict(query, vendor_type=vendor_type), limit=10000).total
+                    if found:
+                        types[vendor_type] = found
+            assert facets["vendor_types"] == types and facets["total"] == sum(types.values())
+            for other in engines:
+                assert other.vendor_facets(**query) == facets
+
+        # Counts follow catalog mutations; the bitmaps are patched bit by bit, not rebuilt
+        engine = EventSearchEngine(base.data_file)
+        before = engine.venue_facets(city="delhi")
+        bitmaps = engine.index.facet_bitmaps()
+        delhi_venues = engine.find_records("venue", "", city="delhi")
+        engine.retire_venue(delhi_venues[0]["id"])
+        assert engine.venue_facets(city="delhi")["total"] == before["total"] - 1
+        engine.update_venue(delhi_venues[1]["id"], {"capacity": 2000, "price_range": "₹9,00,000 - ₹12,00,000"})
+        engine.add_venue("delhi", engine.index.area_keys[0], {"name": "Facet Lawns", "capacity": 90,
+                                                              "price_range": "₹40,000 - ₹60,000", "rating": 4.0})
+        vendors = engine.find_records("vendor", "", city="mumbai")
+        engine.update_vendor(vendors[0]["id"], {"price_range": "₹3,00,000 - ₹4,00,000"})
+        engine.retire_vendor(vendors[1]["id"])
+        engine.add_vendor("mumbai", vendors[2]["area_key"], "decoration", {"name": "Facet Florals",
+                                                                          "price_range": "₹15,000 - ₹30,000"})
+        assert engine.index.facet_bitmaps() is bitmaps
+        rebuilt = FacetBitmaps(engine.index)
+        for name, value in vars(rebuilt).items():
+            patched = getattr(bitmaps, name)
+            if isinstance(value, dict):
+                patched = {key: bitmap for key, bitmap in patched.items() if bitmap}
+                value = {key: bitmap for key, bitmap in value.items() if bitmap}
+            assert patched == value, name
+        for query in venue_queries:
+            assert engine.venue_facets(**query)["total"] == engine.search_venues(**query, limit=0).total
+        for query in [{"city": "mumbai", "budget_min": 200000}, {"budget_max": 20000, "vendor_type": "decoration"}]:
+            assert engine.vendor_facets(**query)["total"] == engine.search_vendors(**query, limit=0).total
+
+def test_misspelled_locations_resolve_to_catalog_keys():
+    with catalog_workspace() as base:
+        engines = [base] + storage_engines(base)
+
+        assert normalize_location("Bandraa  West!") == "bandrawest"
+        spellings = [(("bengaluru", None), ("bangalore", None)), (("Bombay", "bandraa"), ("mumbai", "bandra")),
+                     (("dehli", "conaught plce"), ("delhi", "connaught_place")), ((None, "cp"), (None, "connaught_place")),
+                     (("chenai", "T. Nagar"), ("chennai", "t_nagar")), ((None, "koramangla"), (None, "koramangala"))]
+        for (city, area), (city_key, area_key) in spellings:
+            expected = base.search_venues(city=city_key, area=area_key)
+            assert expected.total > 0
+            for engine in engines:
+                assert engine.resolve_location(city, area) == {"city": city_key, "area": area_key}
+                assert engine.search_venues(city=city, area=area) == expected
+                assert engine.search_vendors(city=city, area=area).total == base.search_vendors(city=city_key, area=area_key).total
+
+        # Unknown places and areas of another city still match nothing
+        for city, area in [("xyz", None), ("mumbai", "xyzzy"), ("delhi", "bandra"), ("pune", None)]:
+            for engine in engines:
+                assert engine.search_venues(city=city, area=area).total == 0
+        # Real cities outside the catalog (tool enum values included) never snap onto a catalog city
+        for city in ["ahmedabad", "pune", "kolkata", "gurgaon", "noida", "kanpur", "dubai", "navi mumbai"]:
+            for engine in engines:
+                assert engine.resolve_location(city, None)["city"] is None, city
+                assert engine.search_venues(city=city).total == 0, city
+                assert engine.search_vendors(city=city).total == 0, city
+        assert base.get_city_areas("Bengaluru") == ["koramangala", "whitefield"]
+
+        # New cities and areas are added to the built resolver instead of rebuilding it
+        index = CatalogIndex(json.loads(json.dumps(base.data)))
+        resolver = index.location_resolver()
+        index.add_venue("pune", "koregaon_park", {"name": "Riverside Hall", "capacity": 200}, city_name="Pune")
+        index.add_vendor("mumbai", "powai", "food", {"name": "Lakeside Caterers"})
+        assert index.location_resolver() is resolver
+        fresh = LocationResolver.from_index(index)
+        for city, area in [("poona", "koregaon prk"), ("bombay", "powaii"), ("pune", None), ("dehli", "cp")]:
+            assert resolver.resolve(city, area) == fresh.resolve(city, area)
+        assert resolver.resolve("poona", "koregaon prk") == ("pune", "koregaon_park")
+        assert resolver.resolve("bombay", "powaii") == ("mumbai", "powai")
+
+def test_date_filter_skips_booked_venues():
+    today = datetime.date.today()
+    day = lambda offset: (today + datetime.timedelta(days=offset)).isoformat()
+    catalog = generate_catalog(cities=2, areas_per_city=2, venues_per_area=12, seed=3)
+    rng = random.Random(3)
+    for city in catalog["cities"].values():
+        for area in city["areas"].values():
+            for venue in area["venues"]:
+                venue["booked_dates"] = sorted({day(rng.randrange(0, 20)) for _ in range(rng.randrange(0, 6))})
+    with catalog_workspace(catalog) as base:
+        engines = storage_engines(base)
+
+        for first, last in [(3, 3), (5, 9), (0, 19), (25, 30)]:
+            window = {day(d) for d in range(first, last + 1)}
+            expected = [r["name"] for r in base.search_venues(capacity=200)
+                        if not window & set(r.get("booked_dates", []))]
+            results = base.search_venues(capacity=200, date_from=day(first), date_to=day(last))
+            assert [r["name"] for r in results] == expected and results.total == len(expected)
+            for engine in engines:
+                assert engine.search_venues(capacity=200, date_from=day(first), date_to=day(last)) == results
+
+        for bad in [("2020-01-01", None), (day(5), day(2)), ("someday", None), (day(400), None)]:
+            try:
+                base.search_venues(date_from=bad[0], date_to=bad[1])
+                assert False, f"accepted {bad}"
+            except ValueError:
+                pass
+
+        # Bookings made through the engine patch the calendar and survive a restart
+        live = EventSearchEngine(base.data_file, cache_size=0)
+        free = live.search_venues(date_from=day(30))
+        venue_id = live.find_records("venue", free[0]["name"])[0]["id"]
+        live.book_venue(venue_id, day(30), day(31))
+        assert free[0]["name"] not in [r["name"] for r in live.search_venues(date_from=day(31))]
+        assert live.search_venues(date_from=day(30)).total == free.total - 1
+        try:
+            live.book_venue(venue_id, day(31))
+            assert False, "double booking accepted"
+        except ValueError:
+            pass
+        assert EventSearchEngine(base.data_file).search_venues(date_from=day(30)).total == free.total - 1
+        live.release_venue(venue_id, day(30), day(31))
+        assert live.search_venues(date_from=day(30)).total == free.total
+
+def test_package_plan_matches_exhaustive_search():
+    catalog = generate_catalog(cities=1, areas_per_city=2, venues_per_area=6, vendors_per_type=3, seed=9)
+    with catalog_workspace(catalog) as base:
+        engines = storage_engines(base, snapshot=False)
+        city = base.index.city_keys[0]
+        vendor_types = ["food", "decoration", "music_dj"]
+
+        for budget, guests in [(150000, 80), (400000, 150), (1200000, 300), (20000, 50)]:
+            categories = [list(base.search_venues(city=city, capacity=guests))]
+            categories += [list(base.search_vendors(city=city, vendor_type=t)) for t in vendor_types]
+            best = None
+            for combo in itertools.product(*categories):
+                cost = sum(quoted_cost(item["price_range"], guests) for item in combo)
+                rating = sum(item["rating"] for item in combo)
+                if cost <= budget and (best is None or (round(rating, 6), -cost) > (round(best[0], 6), -best[1])):
+                    best = (rating, cost)
+
+            plan = base.plan_event_package(budget, guests, vendor_types, city=city)
+            assert plan["feasible"] == (best is not None) and plan["optimal"]
+            if best is not None:
+                assert plan["total_cost"] == best[1] <= budget
+                assert abs(plan["average_rating"] - round(best[0] / 4, 2)) < 1e-9
+                assert plan["venue"]["capacity"] >= guests
+                assert sorted(plan["vendors"]) == sorted(vendor_types)
+            else:
+                assert plan["cheapest_possible"] > budget
+            for engine in engines:
+                other = engine.plan_event_package(budget, guests, vendor_types, city=city)
+                assert (other["feasible"], other.get("total_cost"), other.get("average_rating")) == \
+                       (plan["feasible"], plan.get("total_cost"), plan.get("average_rating"))
+
+        assert base.plan_event_package(500000, 100, ["fireworks"], city=city)["missing"] == ["fireworks"]
+
+def test_similar_venues_rank_by_feature_cosine():
+    with catalog_workspace(generate_catalog(cities=2, areas_per_city=3, venues_per_area=10, seed=21)) as base:
+        engines = storage_engines(base, vectorized=False)
+
+        records = base.index.venue_records
+        for venue_id in (0, 17, 45):
+            similar = base.similar_venues(venue_id, limit=8, same_city=False)
+            assert records[venue_id]["name"] not in [r["name"] for r in similar]
+            scores = [r["similarity"] for r in similar]
+            assert scores == sorted(scores, reverse=True) and all(-1.0001 <= s <= 1.0001 for s in scores)
+            same_city = base.similar_venues(records[venue_id]["name"], limit=50)
+            assert {r["city_key"] for r in same_city} == {base.index.city_keys[base.index.venue_city[venue_id]]}
+            for engine in engines:
+                assert engine.similar_venues(venue_id, limit=8, same_city=False) == similar
+
+        # A copy of a venue under another name is its nearest neighbour
+        similarity = base.index.venue_similarity()
+        clone = dict(records[5], name="Clone Hall")
+        clone_id = base.add_venue(base.index.city_keys[base.index.venue_city[5]],
+                                  base.index.area_keys[base.index.venue_area[5]], clone)
+        top = base.similar_venues(records[5]["name"], limit=1)[0]
+        assert top["name"] == "Clone Hall" and abs(top["similarity"] - 1.0) < 1e-3
+
+        # Venue changes patch single rows; vendor changes leave the vectors alone
+        base.update_vendor(base.find_records("vendor", "")[0]["id"], {"rating": 1.0})
+        base.update_venue(clone_id, {"capacity": 10, "rating": 1.0})
+        assert base.index.venue_similarity() is similarity
+        assert base.similar_venues(records[5]["name"], limit=1)[0]["name"] != "Clone Hall"
+        base.retire_venue(clone_id)
+        assert "Clone Hall" not in [r["name"] for r in base.similar_venues(5, limit=100, same_city=False)]
+        # An amenity the vectors have no column for forces a rebuild
+        base.update_venue(7, {"amenities": ["Moon Landing Pad"]})
+        assert base.index.venue_similarity() is not similarity
+
+        try:
+            base.similar_venues("No Such Venue")
+            assert False, "unknown venue accepted"
+        except KeyError:
+            pass
+
+def test_free_text_search_narrows_structured_filters():
+    with catalog_workspace(generate_catalog(cities=2, areas_per_city=3, venues_per_area=10, seed=24)) as base:
+        index = base.index
+        city, area = index.city_keys[0], index.area_keys[index.city_areas[0][0]]
+        base.add_venue(city, area, {"name": "Skyline Rooftop Terrace", "address": "Opposite Metro Station Gate 2",
+                                    "capacity": 180, "price_range": "₹90,000 - ₹1,50,000", "rating": 3.9,
+                                    "amenities": ["Live Band Stage", "Open Air Deck"], "suitable_for": ["birthday"]})
+
+        query = "rooftop with live band space near the metro"
+        results = base.search_venues(city=city, text=query)
+        assert results[0]["name"] == "Skyline Rooftop Terrace"
+        terms = {"rooftop", "live", "band", "space", "metro"}
+        for venue in results:
+            text = " ".join([venue["name"], venue["address"]] + venue["amenities"]).lower()
+            assert any(re.search(r'\b' + term, text) for term in terms)
+        # Text narrows the structured filters, never widens them
+        structured = {v["name"] for v in base.search_venues(city=city, capacity=150)}
+        assert {v["name"] for v in base.search_venues(city=city, capacity=150, text=query)} <= structured
+        assert base.search_venues(text="zzqx").total == 0
+        assert base.search_venues(city=city, text="the with of") == base.search_venues(city=city)
+
+        recommendations = base.get_recommendations(query, city=city)
+        assert recommendations["venues"][0]["name"] == "Skyline Rooftop Terrace"
+
+        # Mutations patch the built text index instead of rebuilding it
+        text_index = index.text_index()
+        base.update_venue(base.find_records("venue", "skyline rooftop")[0]["id"], {"name": "Skyline Rooftop Garden"})
+        base.retire_venue(base.find_records("venue", "", city=city)[1]["id"])
+        base.update_vendor(base.find_records("vendor", "", city=city)[0]["id"], {"speciality": "Metro Rooftop Catering"})
+        base.add_vendor(city, area, "food", {"name": "Garden Grill", "speciality": "Live Counters",
+                                             "price_range": "₹800 - ₹1,200 per person", "rating": 4.1})
+        assert base.index.text_index() is text_index
+        fresh = CatalogTextIndex.from_index(base.index)
+        for text in (query, "garden", "catering metro live"):
+            assert text_index.venues.scores(text) == fresh.venues.scores(text)
+            assert text_index.vendors.scores(text) == fresh.vendors.scores(text)
+
+        base.compact_journal()
+        engines = [EventSearchEngine(base.data_file)] + storage_engines(base)
+        for text in (query, "garden lawn parking", "wedding photography"):
+            first = base.search_venues(text=text, limit=4)
+            vendors = base.search_vendors(text=text, limit=4)
+            for engine in engines:
+                assert engine.search_venues(text=text, limit=4) == first
+                assert engine.search_venues(text=text, limit=4, cursor=first.next_cursor) == \
+                    base.search_venues(text=text, limit=4, cursor=first.next_cursor)
+                assert engine.search_vendors(text=text, limit=4) == vendors
+
+def test_global_engine_is_built_lazily():
+    import subprocess
+    import sys
+    import event_search
+    probe = ("import event_search, event_tools; print(event_search.search_engine_status()['ready'])")
+    assert subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                          check=True).stdout.strip().splitlines()[-1] == "False"
+
+    thread = event_search.warm_search_engine()
+    if thread is not None:
+        thread.join(60)
+    status = event_search.search_engine_status()
+    assert status["ready"] and not status["warming"] and status["error"] is None
+    assert event_search.warm_search_engine() is None
+    assert event_search.get_search_engine() is event_search.get_search_engine()
+    assert event_search.search_venues_api(city="delhi").total == engine.search_venues(city="delhi").total
+
+def test_journal_replay_follows_records_after_base_file_edit():
+    with catalog_workspace() as live:
+        retired = live.index.venue_records[5]["name"]
+        updated = live.index.venue_records[9]["name"]
+        live.retire_venue(5)
+        live.update_venue(9, {"rating": 1.5})
+
+        # Someone edits the base file: a new venue at the front shifts every later id
+        with open(live.data_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data["cities"]["delhi"]["areas"]["connaught_place"]["venues"].insert(0, {
+            "name": "Front Row Hall", "capacity": 90, "price_range": "₹40,000 - ₹60,000", "rating": 4.0,
+            "amenities": [], "suitable_for": ["birthday"]})
+        with open(live.data_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        for engine in (live, EventSearchEngine(live.data_file, cache_size=0)):
+            if engine is live:
+                assert live.reload()
+            names = [v["name"] for v in engine.search_venues()]
+            assert retired not in names and "Front Row Hall" in names
+            assert len(names) == sum(len(a.get("venues", [])) for c in data["cities"].values()
+                                     for a in c["areas"].values()) - 1
+            assert [v["rating"] for v in engine.search_venues() if v["name"] == updated] == [1.5]
+
+def test_index_mutations_leave_pinned_lists_untouched():
+    index = CatalogIndex(json.loads(json.dumps(engine.data)))
+    scope = index.venue_scopes()[0]
+    capacity_ids = list(scope.capacity.ids)
+    venue_id = index.area_venues[0][0]
+    area_venues = index.area_venues[0]
+    pinned_area_venues = list(area_venues)
+    event_type = index.venue_records[venue_id]["suitable_for"][0]
+    event_posting = index.venues_by_event_type[event_type]
+    pinned_event_posting = list(event_posting)
+
+    index.update_venue(venue_id, dict(index.venue_records[venue_id], capacity=99999, suitable_for=["expo"]))
+    index.retire_venue(area_venues[1])
+
+    # A reader still holding the old lists sees them exactly as they were
+    assert area_venues == pinned_area_venues and event_posting == pinned_event_posting
+    assert scope.capacity.ids == capacity_ids
+    # The index itself has swapped in patched copies
+    assert index.venue_scopes()[0] is not scope
+    assert index.venue_scopes()[0].capacity.ids[-1] == venue_id
+    assert venue_id not in index.venues_by_event_type[event_type]
+    assert index.venues_by_event_type["expo"] == [venue_id]
+    assert pinned_area_venues[1] not in index.area_venues[0]
+
+def test_workers_sharing_a_journal_follow_each_other():
+    with catalog_workspace() as first:
+        # Two engines on one data file stand in for two uvicorn worker processes
+        second = EventSearchEngine(first.data_file, cache_size=0)
+        venue = first.find_records("venue", "", city="delhi")[0]
+        day = (datetime.date.today() + datetime.timedelta(days=10)).isoformat()
+
+        first.book_venue(venue["id"], day)
+        # The booking check runs against the journal, not only the worker's own index
+        try:
+            second.book_venue(venue["id"], day)
+            assert False, "double booking accepted"
+        except ValueError:
+            pass
+        first.update_venue(venue["id"], {"rating": 1.1})
+        second.follow_journal()
+        assert second.find_records("venue", venue["record"]["name"])[0]["record"]["rating"] == 1.1
+
+        # The watcher applies other workers' entries on its own
+        second.start_auto_reload(interval=0.05, data_file=False)
+        first.retire_venue(venue["id"])
+        deadline = time.time() + 5
+        while time.time() < deadline and venue["record"]["name"] in [v["name"] for v in second.search_venues()]:
+            time.sleep(0.05)
+        second.stop_auto_reload()
+        assert venue["record"]["name"] not in [v["name"] for v in second.search_venues()]
+
+        # Compaction by one worker makes the others reload
+        first.compact_journal()
+        second.follow_journal()
+        assert second.search_venues() == first.search_venues()
+        second.add_vendor("delhi", "karol_bagh", "food", {"name": "Second Worker Caterers"})
+        first.follow_journal()
+        assert first.search_vendors(city="delhi") == second.search_vendors(city="delhi")
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✓ {name}")
@@ -0,0 +1,168 @@
+"""
+Free-Text Index
+BM25 search over venue and vendor text, for intent the keyword detector has no entry for
+("rooftop with live band space near the metro")
+
+Venue documents are the name, address and amenities; vendor documents the name, speciality
+and services. Text is split into lowercase letters/digits, stop words are dropped and a plural
+"s" is stripped, so "Gardens" finds "garden". Every term keeps a posting list of (id, term
+frequency). The first query using a term turns its whole posting list into per-id BM25
+contributions and caches them, so a query costs one dict merge per distinct term. Both indexes
+are built once and then follow catalog mutations document by document: only the changed
+record's postings are patched, along with the document count and average length.
+"""
+
+import math
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# BM25 term-frequency saturation and document-length normalization
+K1 = 1.2
+B = 0.75
+
+STOP_WORDS = frozenset({
+    "a", "an", "and", "any", "are", "at", "by", "for", "from", "i", "in", "is", "it", "looking",
+    "me", "my", "near", "need", "of", "on", "or", "our", "please", "show", "some", "that", "the",
+    "to", "us", "want", "we", "with"
+})
+
+_TERM_PATTERN = re.compile(r'[a-z0-9]+')
+
+def text_terms(text: str) -> List[str]:
+    """Searchable terms of free text, in order (stop words dropped, plural "s" stripped)"""
+    terms = []
+    for token in _TERM_PATTERN.findall(text.lower()) if text else []:
+        if token in STOP_WORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+def _term_counts(text: str) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for term in text_terms(text):
+        counts[term] = counts.get(term, 0) + 1
+    return counts
+
+def venue_document(record: Dict) -> str:
+    return " ".join([record.get("name", ""), record.get("address", "")] + list(record.get("amenities", [])))
+
+def vendor_document(record: Dict) -> str:
+    return " ".join([record.get("name", ""), record.get("speciality", "")] + list(record.get("services", [])))
+
+class BM25Index:
+    """Inverted index of (id, text) documents scored with Okapi BM25"""
+
+    def __init__(self, documents: Iterable[Tuple[int, str]], k1: float = K1, b: float = B):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.doc_length: Dict[int, int] = {}
+        for doc_id, text in sorted(documents, key=lambda document: document[0]):
+            counts = _term_counts(text)
+            for term, tf in counts.items():
+                self.postings.setdefault(term, []).append((doc_id, tf))
+            self.doc_length[doc_id] = sum(counts.values())
+        self._total_length = sum(self.doc_length.values())
+        self._collection_changed()
+
+    def _collection_changed(self):
+        """Refresh the collection statistics; every cached term score depends on them"""
+        self.doc_count = len(self.doc_length)
+        self.average_length = self._total_length / self.doc_count if self.doc_count else 0.0
+        self._term_scores: Dict[str, Dict[int, float]] = {}
+
+    def add_document(self, doc_id: int, text: str):
+        """Index one more document; its id must not be indexed already"""
+        counts = _term_counts(text)
+        for term, tf in counts.items():
+            # Copy-on-write: a reader may be walking the current posting list
+            posting = list(self.postings.get(term, ()))
+            insort(posting, (doc_id, tf))
+            self.postings[term] = posting
+        self.doc_length[doc_id] = sum(counts.values())
+        self._total_length += self.doc_length[doc_id]
+        self._collection_changed()
+
+    def remove_document(self, doc_id: int, text: str):
+        """Drop a document, given the text it was indexed with"""
+        if doc_id not in self.doc_length:
+            return
+        for term in _term_counts(text):
+            posting = self.postings.get(term, [])
+            pos = bisect_left(posting, (doc_id,))
+            if pos < len(posting) and posting[pos][0] == doc_id:
+                if len(posting) == 1:
+                    del self.postings[term]
+                else:
+                    self.postings[term] = posting[:pos] + posting[pos + 1:]
+        self._total_length -= self.doc_length.pop(doc_id)
+        self._collection_changed()
+
+    def term_scores(self, term: str) -> Dict[int, float]:
+        """{id: BM25 contribution of the term} over its posting list, computed on first use"""
+        cache = self._term_scores
+        cached = cache.get(term)
+        if cached is not None:
+            return cached
+        posting = self.postings.get(term)
+        if not posting:
+            return {}
+        # Same formula and operation order as SQLite FTS5's bm25(), so both backends rank alike
+        df = len(posting)
+        idf = math.log((self.doc_count - df + 0.5) / (df + 0.5))
+        if idf <= 0.0:
+            idf = 1e-6
+        average = self.average_length or 1.0
+        scores = {}
+        for doc_id, tf in posting:
+            length = self.doc_length.get(doc_id, average)
+            scores[doc_id] = idf * ((tf * (self.k1 + 1.0)) / (tf + self.k1 * (1 - self.b + self.b * length / average)))
+        cache[term] = scores
+        return scores
+
+    def scores(self, query: str) -> Optional[Dict[int, float]]:
+        """
+        {id: BM25 score} of the documents containing any query term
+
+        Returns None when the query has no searchable terms (only stop words or punctuation),
+        so callers can tell "no text filter" from "nothing matched".
+        """
+        terms = sorted(set(text_terms(query)))
+        if not terms:
+            return None
+        totals: Dict[int, float] = {}
+        for term in terms:
+            for doc_id, score in self.term_scores(term).items():
+                totals[doc_id] = totals.get(doc_id, 0.0) + score
+        return totals
+
+class CatalogTextIndex:
+    """BM25 indexes over the live venues and vendors of one catalog version"""
+
+    def __init__(self, venues: Iterable[Tuple[int, Dict]], vendors: Iterable[Tuple[int, Dict]]):
+        self.venues = BM25Index((i, venue_document(record)) for i, record in venues)
+        self.vendors = BM25Index((i, vendor_document(record)) for i, record in vendors)
+
+    @classmethod
+    def from_index(cls, index) -> "CatalogTextIndex":
+        return cls(((i, index.venue_records[i]) for i in range(len(index.venue_records))
+                    if i not in index.retired_venues),
+                   ((i, index.vendor_records[i]) for i in range(len(index.vendor_records))
+                    if i not in index.retired_vendors))
+
+    def set_venue(self, venue_id: int, old: Optional[Dict], new: Optional[Dict]):
+        """Re-index one venue (old None: added, new None: retired)"""
+        if old is not None:
+            self.venues.remove_document(venue_id, venue_document(old))
+        if new is not None:
+            self.venues.add_document(venue_id, venue_document(new))
+
+    def set_vendor(self, vendor_id: int, old: Optional[Dict], new: Optional[Dict]):
+        """Re-index one vendor (old None: added, new None: retired)"""
+        if old is not None:
+            self.vendors.remove_document(vendor_id, vendor_document(old))
+        if new is not None:
+            self.vendors.add_document(vendor_id, vendor_document(new))
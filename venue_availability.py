@@ -0,0 +1,152 @@
+"""
+Venue Availability Calendar
+Per-day bitsets of booked venues over the next AVAILABILITY_DAYS days, so a date filter on
+venue search costs a few big-integer ORs instead of a calendar lookup per venue
+
+Bookings live in the venue records as ISO dates ("booked_dates": ["2026-12-05", ...]). The
+calendar keeps, for every day of the horizon, one Python int with bit i set when venue i is
+booked that day; the venues booked anywhere in a date range are the OR of the range's days.
+Each venue also keeps its booked days as a bitset over the horizon, so a booking change only
+flips that venue's bits in the days that changed.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# How far ahead availability is tracked (and date filters are accepted)
+AVAILABILITY_DAYS = 365
+
+DateLike = Union[str, date]
+
+def parse_date(value: DateLike) -> date:
+    """date from a date or an ISO "YYYY-MM-DD" string"""
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value).strip())
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+def booking_window(date_from: DateLike, date_to: Optional[DateLike] = None, today: Optional[date] = None,
+                   days: int = AVAILABILITY_DAYS) -> Tuple[date, date]:
+    """
+    Validated (first, last) day of a date filter, both inclusive
+
+    Raises:
+        ValueError: Unparseable dates, a range ending before it starts, or days outside
+            today .. today + days - 1
+    """
+    today = today or date.today()
+    first = parse_date(date_from)
+    last = parse_date(date_to) if date_to else first
+    if last < first:
+        raise ValueError(f"date_to {last} is before date_from {first}")
+    if first < today:
+        raise ValueError(f"{first} is in the past")
+    horizon = today + timedelta(days=days - 1)
+    if last > horizon:
+        raise ValueError(f"Availability is only known up to {horizon} ({days} days ahead)")
+    return first, last
+
+def iso_days(first: date, last: date) -> List[str]:
+    """Every day from first to last as YYYY-MM-DD"""
+    return [(first + timedelta(days=d)).isoformat() for d in range((last - first).days + 1)]
+
+def booked_days(record: Dict) -> List[date]:
+    """Valid booked dates of a venue record (malformed entries are skipped)"""
+    days = []
+    for value in record.get("booked_dates", None) or []:
+        try:
+            days.append(parse_date(value))
+        except ValueError:
+            continue
+    return days
+
+class AvailabilityCalendar:
+    """Booked-venue bitsets for the days start .. start + days - 1"""
+
+    def __init__(self, start: date, days: int = AVAILABILITY_DAYS):
+        self.start = start
+        self.days = days
+        self.day_booked: List[int] = [0] * days
+        self.venue_days: Dict[int, int] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[int, Dict]], start: date,
+                     days: int = AVAILABILITY_DAYS) -> "AvailabilityCalendar":
+        """Calendar of (venue id, record) pairs; day bitsets are filled as byte arrays, then converted once"""
+        calendar = cls(start, days)
+        day_bits: Dict[int, bytearray] = {}
+        for venue_id, record in records:
+            mask = calendar._day_mask(record)
+            if not mask:
+                continue
+            calendar.venue_days[venue_id] = mask
+            day = 0
+            while mask:
+                if mask & 1:
+                    bits = day_bits.get(day)
+                    if bits is None:
+                        bits = day_bits[day] = bytearray()
+                    if len(bits) <= venue_id >> 3:
+                        bits.extend(bytes((venue_id >> 3) + 1 - len(bits)))
+                    bits[venue_id >> 3] |= 1 << (venue_id & 7)
+                mask >>= 1
+                day += 1
+        for day, bits in day_bits.items():
+            calendar.day_booked[day] = int.from_bytes(bits, "little")
+        return calendar
+
+    def _day_mask(self, record: Dict) -> int:
+        """Bitset of the record's booked days inside the horizon"""
+        mask = 0
+        for day in booked_days(record):
+            offset = (day - self.start).days
+            if 0 <= offset < self.days:
+                mask |= 1 << offset
+        return mask
+
+    def set_venue(self, venue_id: int, record: Optional[Dict]):
+        """Re-read one venue's bookings (None clears them), flipping only the changed days"""
+        new = self._day_mask(record) if record else 0
+        changed = self.venue_days.get(venue_id, 0) ^ new
+        day = 0
+        while changed:
+            if changed & 1:
+                self.day_booked[day] ^= 1 << venue_id
+            changed >>= 1
+            day += 1
+        if new:
+            self.venue_days[venue_id] = new
+        else:
+            self.venue_days.pop(venue_id, None)
+
+    def _offsets(self, first: date, last: date) -> range:
+        return range(max((first - self.start).days, 0), min((last - self.start).days, self.days - 1) + 1)
+
+    def booked_between(self, first: date, last: date) -> int:
+        """Bitset of venues booked on any day from first to last"""
+        booked = 0
+        for offset in self._offsets(first, last):
+            booked |= self.day_booked[offset]
+        return booked
+
+    def available(self, venue_ids: Iterable[int], first: date, last: date) -> List[int]:
+        """The venue ids (order kept) free on every day from first to last"""
+        booked = self.booked_between(first, last)
+        if not booked:
+            return list(venue_ids)
+        bits = booked.to_bytes((booked.bit_length() + 7) // 8, "little")
+        size = len(bits) * 8
+        return [i for i in venue_ids if i >= size or not bits[i >> 3] >> (i & 7) & 1]
+
+    def numpy_booked(self, first: date, last: date, venue_count: int):
+        """Boolean column (venue_count long) of venues booked in the range"""
+        booked = self.booked_between(first, last)
+        bits = np.frombuffer(booked.to_bytes((venue_count + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(bits, bitorder="little")[:venue_count].astype(bool)
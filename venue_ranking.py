@@ -0,0 +1,94 @@
+"""
+Venue Relevance Ranking
+Scores matched venues on rating, capacity fit and price fit, so the first page of a search
+already holds venues that suit the guest count and budget instead of merely the best rated
+
+    score = RATING_WEIGHT * rating prior
+          + CAPACITY_WEIGHT * guests / venue capacity                          (when capacity is given)
+          + PRICE_WEIGHT * share of the venue's price range inside the budget  (when a budget is given)
+
+The query-independent factors (rating prior, 1 / capacity, 1 / price span) are columns the
+catalog index computes at build time, so scoring a candidate is a few multiply-adds. Python,
+NumPy and SQL evaluate the same expression in the same order and produce identical scores.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RANKINGS = ("rating", "relevance")
+
+RATING_WEIGHT = 0.5
+CAPACITY_WEIGHT = 0.25
+PRICE_WEIGHT = 0.25
+MAX_RATING = 5.0
+
+def rating_prior(rating: float) -> float:
+    """Rating scaled to [0, 1]"""
+    return min(max(rating / MAX_RATING, 0.0), 1.0)
+
+def capacity_inverse(capacity: int) -> float:
+    return 1.0 / capacity if capacity > 0 else 0.0
+
+def price_span_inverse(min_price: int, max_price: int) -> float:
+    """1 / (rupee width of the price range + 1); the +1 makes a fixed price fit fully"""
+    return 1.0 / (max(max_price - min_price, 0) + 1)
+
+def check_ranking(rank_by: str) -> str:
+    if rank_by not in RANKINGS:
+        raise ValueError(f"rank_by must be one of {', '.join(RANKINGS)}")
+    return rank_by
+
+class VenueScorer:
+    """
+    Relevance of venues for one query's capacity and budget
+
+    Only meant for venues that passed the query's filters: they hold at least `capacity`
+    guests and their price range overlaps the budget window.
+    """
+
+    def __init__(self, capacity: Optional[int], budget_min: Optional[int], budget_max: Optional[int]):
+        self.capacity = capacity or None
+        self.budget = bool(budget_min or budget_max)
+        self.low = budget_min or 0
+        self.high = budget_max or None
+
+    def score(self, index, venue_id: int) -> float:
+        score = RATING_WEIGHT * index.venue_rank_prior[venue_id]
+        if self.capacity:
+            score = score + CAPACITY_WEIGHT * (self.capacity * index.venue_capacity_inv[venue_id])
+        if self.budget:
+            high = index.venue_max_price[venue_id] if self.high is None else min(index.venue_max_price[venue_id], self.high)
+            overlap = high - max(index.venue_min_price[venue_id], self.low) + 1
+            score = score + PRICE_WEIGHT * (overlap * index.venue_price_span_inv[venue_id])
+        return score
+
+    def scores(self, index, venue_ids: Iterable[int]) -> Dict[int, float]:
+        """{venue id: score}, usable wherever a rating column is expected"""
+        return {venue_id: self.score(index, venue_id) for venue_id in venue_ids}
+
+    def numpy_scores(self, cols):
+        """Scores of every venue as one array (NumpyColumns layout)"""
+        scores = RATING_WEIGHT * cols.venue_rank_prior
+        if self.capacity:
+            scores = scores + CAPACITY_WEIGHT * (self.capacity * cols.venue_capacity_inv)
+        if self.budget:
+            high = cols.venue_max_price if self.high is None else np.minimum(cols.venue_max_price, self.high)
+            overlap = high - np.maximum(cols.venue_min_price, self.low) + 1
+            scores = scores + PRICE_WEIGHT * (overlap * cols.venue_price_span_inv)
+        return scores
+
+    def sql(self, table: str) -> Tuple[str, List]:
+        """The score as a SQL expression over the venues table columns, with its parameters"""
+        expr, params = f"{RATING_WEIGHT!r} * {table}.rank_prior", []
+        if self.capacity:
+            expr += f" + {CAPACITY_WEIGHT!r} * (? * {table}.capacity_inv)"
+            params.append(self.capacity)
+        if self.budget:
+            high = f"{table}.max_price" if self.high is None else f"MIN({table}.max_price, ?)"
+            expr += f" + {PRICE_WEIGHT!r} * (({high} - MAX({table}.min_price, ?) + 1) * {table}.price_span_inv)"
+            params += ([] if self.high is None else [self.high]) + [self.low]
+        return expr, params
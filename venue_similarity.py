@@ -0,0 +1,267 @@
+"""
+Similar Venues
+"More like this" for a venue: nearest neighbours by cosine similarity of per-venue feature
+vectors, built once and then patched row by row as venues change
+
+A venue's vector concatenates
+    amenities     one-hot over the amenity vocabulary, scaled to unit length
+    event types   one-hot over the event types it suits, scaled to unit length
+    price         log of the price range midpoint, standardized over the catalog
+    capacity      log capacity, standardized
+    rating        rating, standardized
+each block multiplied by its FEATURE_WEIGHTS entry, and the whole row normalized, so the cosine
+similarity of two venues is one dot product. With NumPy all similarities to a venue are one
+matrix-vector product; without it, small catalogs keep each queried venue's full neighbour
+order in a table and larger ones fall back to a pure-Python scan.
+
+An added or updated venue only gets its own row recomputed, against the vocabulary and the
+numeric means/deviations of the original build; a retired venue's row is masked out. A venue
+with an amenity or event type outside the vocabulary needs a full rebuild (set_venue says so).
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+FEATURE_WEIGHTS: Dict[str, float] = {
+    "amenities": 1.0,
+    "event_types": 1.0,
+    "price": 1.0,
+    "capacity": 1.0,
+    "rating": 0.5
+}
+
+# Without NumPy, catalogs up to this many venues memoize neighbour orders per queried venue
+NEIGHBOUR_TABLE_MAX = 2000
+
+def _mean_std(values: List[float]) -> Tuple[float, float]:
+    if not values:
+        return 0.0, 0.0
+    mean = sum(values) / len(values)
+    return mean, math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+
+def _standardized(values: List[float]) -> List[float]:
+    """z-scores (0 everywhere when the values do not vary)"""
+    mean, std = _mean_std(values)
+    return [(v - mean) / std if std > 0 else 0.0 for v in values]
+
+def _numeric_features(capacity: int, min_price: int, max_price: int, rating: float) -> List[float]:
+    """Unweighted price, capacity and rating features, in FEATURE_WEIGHTS order"""
+    return [math.log1p((min_price + max_price) / 2), math.log1p(capacity), float(rating)]
+
+class VenueSimilarity:
+    """
+    Feature vectors of the live venues of a catalog, patched by set_venue / remove_venue
+
+    Built from plain columns so the compiled index and the SQLite backend share it:
+    `live_ids` (ascending venue ids), per-id capacity / min_price / max_price / rating / city
+    sequences, and {amenity: venue ids} / {event type: venue ids} postings.
+    """
+
+    def __init__(self, live_ids: Sequence[int], capacity: Sequence[int], min_price: Sequence[int],
+                 max_price: Sequence[int], rating: Sequence[float], city: Sequence[int],
+                 amenity_postings: Dict[str, Iterable[int]], event_type_postings: Dict[str, Iterable[int]]):
+        # Rows are never reused: a retired venue keeps its row, masked out of every ranking
+        self.ids = list(live_ids)
+        self.row_of = {venue_id: row for row, venue_id in enumerate(self.ids)}
+        self.city = [city[i] for i in self.ids]
+        self.retired_rows = set()
+        self._neighbour_table: Dict[int, List[Tuple[float, int]]] = {}
+
+        amenities, event_types = sorted(amenity_postings), sorted(event_type_postings)
+        self.amenity_columns = {k: column for column, k in enumerate(amenities)}
+        self.event_type_columns = {k: column for column, k in enumerate(event_types, len(amenities))}
+        blocks = [(FEATURE_WEIGHTS["amenities"], [amenity_postings[k] for k in amenities]),
+                  (FEATURE_WEIGHTS["event_types"], [event_type_postings[k] for k in event_types])]
+        features = [_numeric_features(capacity[i], min_price[i], max_price[i], rating[i]) for i in self.ids]
+        numeric = [(FEATURE_WEIGHTS[name], [row[k] for row in features])
+                   for k, name in enumerate(("price", "capacity", "rating"))]
+        # (weight, mean, std) the numeric features are standardized with, also for later rows
+        self.numeric_scaling: List[Tuple[float, float, float]] = []
+        if NUMPY_AVAILABLE:
+            # (row matrix, city column, live mask), swapped as one when the buffers grow
+            self.arrays = (self._numpy_matrix(blocks, numeric), np.array(self.city, dtype=np.int64),
+                           np.ones(len(self.ids), dtype=bool))
+            self.rows = None
+        else:
+            self.arrays = None
+            self.rows = self._python_rows(blocks, numeric)
+
+    def _block_rows(self, postings: List[Iterable[int]]) -> List[List[int]]:
+        """Per one-hot column, the rows (live venues) that have it"""
+        return [[self.row_of[i] for i in ids if i in self.row_of] for ids in postings]
+
+    def _numpy_matrix(self, blocks, numeric):
+        columns = []
+        for weight, postings in blocks:
+            block = np.zeros((len(self.ids), len(postings)))
+            for column, rows in enumerate(self._block_rows(postings)):
+                block[rows, column] = 1.0
+            counts = block.sum(axis=1)
+            block *= np.where(counts > 0, weight / np.sqrt(np.maximum(counts, 1)), 0.0)[:, None]
+            columns.append(block)
+        for weight, values in numeric:
+            values = np.array(values, dtype=np.float64)
+            mean, std = (float(values.mean()), float(values.std())) if len(values) else (0.0, 0.0)
+            self.numeric_scaling.append((weight, mean, std))
+            z = (values - mean) / std if std > 0 else np.zeros(len(values))
+            columns.append((weight * z)[:, None])
+        matrix = np.hstack(columns) if columns else np.zeros((len(self.ids), 0))
+        norms = np.linalg.norm(matrix, axis=1)
+        return matrix / np.where(norms > 0, norms, 1.0)[:, None]
+
+    def _python_rows(self, blocks, numeric) -> List[List[float]]:
+        width = sum(len(postings) for _, postings in blocks) + len(numeric)
+        rows = [[0.0] * width for _ in self.ids]
+        offset = 0
+        for weight, postings in blocks:
+            members = self._block_rows(postings)
+            counts = [0] * len(self.ids)
+            for block_rows in members:
+                for row in block_rows:
+                    counts[row] += 1
+            for column, block_rows in enumerate(members, offset):
+                for row in block_rows:
+                    rows[row][column] = weight / math.sqrt(counts[row])
+            offset += len(postings)
+        for column, (weight, values) in enumerate(numeric, offset):
+            self.numeric_scaling.append((weight,) + _mean_std(values))
+            for row, z in enumerate(_standardized(values)):
+                rows[row][column] = weight * z
+        for row in rows:
+            norm = math.sqrt(sum(v * v for v in row))
+            if norm > 0:
+                row[:] = [v / norm for v in row]
+        return rows
+
+    @classmethod
+    def from_index(cls, index) -> "VenueSimilarity":
+        live = [i for i in range(len(index.venue_records)) if i not in index.retired_venues]
+        return cls(live, index.venue_capacity, index.venue_min_price, index.venue_max_price, index.venue_rating,
+                   index.venue_city, index.venues_by_amenity, index.venues_by_event_type)
+
+    def _vector(self, amenities: Iterable[str], event_types: Iterable[str], numeric: List[float]) -> List[float]:
+        """Normalized feature row of one venue (every amenity and event type in the vocabulary)"""
+        width = len(self.amenity_columns) + len(self.event_type_columns)
+        vector = [0.0] * (width + len(self.numeric_scaling))
+        for weight, columns in ((FEATURE_WEIGHTS["amenities"], [self.amenity_columns[k] for k in amenities]),
+                                (FEATURE_WEIGHTS["event_types"], [self.event_type_columns[k] for k in event_types])):
+            for column in columns:
+                vector[column] = weight / math.sqrt(len(columns))
+        for column, (weight, mean, std), value in zip(range(width, len(vector)), self.numeric_scaling, numeric):
+            vector[column] = weight * ((value - mean) / std if std > 0 else 0.0)
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm > 0 else vector
+
+    def set_venue(self, index, venue_id: int) -> bool:
+        """
+        Recompute one venue's row (appending one for a new venue) from the index columns
+
+        Returns False, leaving everything as it was, when the venue has an amenity or event type
+        the vectors have no column for; the caller must rebuild.
+        """
+        amenities = index.venue_amenities[venue_id]
+        event_types = set(index.venue_records[venue_id].get("suitable_for", []))
+        if not (amenities <= self.amenity_columns.keys() and event_types <= self.event_type_columns.keys()):
+            return False
+        vector = self._vector(amenities, event_types, _numeric_features(
+            index.venue_capacity[venue_id], index.venue_min_price[venue_id], index.venue_max_price[venue_id],
+            index.venue_rating[venue_id]))
+        city = index.venue_city[venue_id]
+
+        row = self.row_of.get(venue_id)
+        if row is None:
+            # Fill the row first; it becomes visible to readers once ids grows
+            row = len(self.ids)
+            if self.rows is not None:
+                self.rows.append(vector)
+            else:
+                if row == len(self.arrays[0]):
+                    self._grow(2 * row or 1)
+                matrix, city_column, live = self.arrays
+                matrix[row] = vector
+                city_column[row] = city
+                live[row] = True
+            self.city.append(city)
+            self.ids.append(venue_id)
+            self.row_of[venue_id] = row
+        elif self.rows is not None:
+            self.rows[row] = vector
+        else:
+            self.arrays[0][row] = vector
+        self._neighbour_table = {}
+        return True
+
+    def remove_venue(self, venue_id: int):
+        """Mask a retired venue's row out of every ranking"""
+        row = self.row_of.pop(venue_id, None)
+        if row is None:
+            return
+        self.retired_rows.add(row)
+        if self.arrays is not None:
+            self.arrays[2][row] = False
+        self._neighbour_table = {}
+
+    def _grow(self, capacity: int):
+        """Reallocate the NumPy buffers with room for `capacity` rows (rows past len(ids) unused)"""
+        used = len(self.ids)
+        old_matrix, old_city_column, old_live = self.arrays
+        matrix = np.zeros((capacity, old_matrix.shape[1]))
+        matrix[:used] = old_matrix[:used]
+        city_column = np.zeros(capacity, dtype=np.int64)
+        city_column[:used] = old_city_column[:used]
+        live = np.zeros(capacity, dtype=bool)
+        live[:used] = old_live[:used]
+        self.arrays = (matrix, city_column, live)
+
+    def _ranked(self, row: int) -> List[Tuple[float, int]]:
+        """(similarity, venue id) of every other venue, most similar first (ties: lower id)"""
+        cached = self._neighbour_table.get(row)
+        if cached is not None:
+            return cached
+        vector = self.rows[row]
+        ranked = sorted(((sum(a * b for a, b in zip(vector, other)), self.ids[r])
+                         for r, other in enumerate(self.rows) if r != row and r not in self.retired_rows),
+                        key=lambda pair: (-pair[0], pair[1]))
+        if len(self.ids) <= NEIGHBOUR_TABLE_MAX:
+            self._neighbour_table[row] = ranked
+        return ranked
+
+    def neighbours(self, venue_id: int, limit: int = 5, city_id: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        The `limit` venues most similar to venue_id as (venue id, cosine similarity)
+
+        Raises:
+            KeyError: venue_id is not a live venue
+        """
+        row = self.row_of.get(venue_id)
+        if row is None:
+            raise KeyError(f"No active venue with id {venue_id}")
+        limit = max(limit, 0)
+
+        if self.rows is not None:
+            matches = []
+            for score, other in self._ranked(row):
+                if len(matches) >= limit:
+                    break
+                if city_id is None or self.city[self.row_of[other]] == city_id:
+                    matches.append((other, score))
+            return matches
+
+        matrix, city_column, live = self.arrays
+        size = min(len(self.ids), len(matrix))
+        matrix = matrix[:size]
+        scores = matrix @ matrix[row]
+        keep = live[:size].copy()
+        keep[row] = False
+        if city_id is not None:
+            keep &= city_column[:size] == city_id
+        candidates = np.flatnonzero(keep)
+        order = np.lexsort((candidates, -scores[candidates]))[:limit]
+        return [(self.ids[r], float(scores[r])) for r in candidates[order].tolist()]